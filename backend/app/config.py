@@ -7,6 +7,25 @@ class Settings(BaseSettings):
     SUPABASE_ANON_KEY: str
     SUPABASE_SERVICE_ROLE_KEY: str
 
+    # Supabase HTTP 커넥션 풀 (워커/API 키당 하나)
+    SUPABASE_POOL_MAX_CONNECTIONS: int = 100
+    SUPABASE_POOL_MAX_KEEPALIVE: int = 20
+    SUPABASE_POOL_KEEPALIVE_EXPIRY: float = 30.0
+    SUPABASE_TIMEOUT_SECONDS: float = 10.0
+    SUPABASE_CONNECT_TIMEOUT_SECONDS: float = 5.0
+    DB_MAX_CONCURRENCY: int = 40  # 동시에 실행되는 DB 호출(스레드) 수 상한
+
+    # 핫 패스 조회/기록 백엔드 (supabase: PostgREST HTTP, asyncpg: Postgres 직접 연결)
+    # asyncpg는 Repository의 핫 패스 메서드(권한 확인, 강의/비디오 조회, 시청 진도)만 대체하고
+    # 관리자 API, 인증, 가져오기 등 나머지는 항상 supabase-py를 사용한다
+    DB_BACKEND: str = "supabase"
+    DATABASE_URL: str = ""  # 예: postgresql://postgres:<password>@db.xxx.supabase.co:5432/postgres
+    DB_POOL_MIN_SIZE: int = 2
+    DB_POOL_MAX_SIZE: int = 10
+    DB_COMMAND_TIMEOUT_SECONDS: float = 10.0
+    # 연결별 prepared statement 캐시 (트랜잭션 모드 풀러(6543 포트)를 쓰면 0)
+    DB_STATEMENT_CACHE_SIZE: int = 100
+
     # Bunny Stream
     BUNNY_STREAM_API_KEY: str
     BUNNY_VIDEO_LIBRARY_API_KEY: str
@@ -14,6 +33,84 @@ class Settings(BaseSettings):
     BUNNY_VIDEO_LIBRARY_HOSTNAME: str = "vz-27718a49-df0.b-cdn.net"
     BUNNY_STREAM_TOKEN_AUTH_KEY: str = ""
 
+    # 서명 URL 만료 시각 버킷 (0이면 요청마다 고유 URL)
+    BUNNY_URL_EXPIRY_BUCKET_SECONDS: int = 0
+    BUNNY_URL_MIN_VALIDITY_SECONDS: int = 3600
+    BUNNY_URL_CACHE_SIZE: int = 10000
+
+    # Bunny API HTTP 클라이언트 (워커당 공유)
+    BUNNY_HTTP2: bool = True
+    BUNNY_MAX_CONNECTIONS: int = 20
+    BUNNY_MAX_KEEPALIVE: int = 10
+    BUNNY_TIMEOUT_SECONDS: float = 15.0
+    BUNNY_CONNECT_TIMEOUT_SECONDS: float = 5.0
+
+    # Bunny 라이브러리 목록 페이지네이션 (동시에 미리 가져올 페이지 수)
+    BUNNY_LIST_PAGE_SIZE: int = 100
+    BUNNY_LIST_CONCURRENCY: int = 4
+
+    # Bunny 비디오 상세 동시 조회 수 (일괄 가져오기)
+    BUNNY_DETAILS_CONCURRENCY: int = 8
+
+    # Bunny 비디오 백그라운드 삭제
+    BUNNY_DELETE_CONCURRENCY: int = 5
+    BUNNY_DELETE_RETRIES: int = 3
+    BUNNY_DELETE_BACKOFF_SECONDS: float = 0.5
+    CLEANUP_JOB_RETENTION_SECONDS: int = 3600
+    CLEANUP_SHUTDOWN_TIMEOUT_SECONDS: float = 10.0
+
+    # Bunny TUS 재개 가능 업로드 (서명 유효 시간은 대용량 업로드 전체를 덮어야 함)
+    BUNNY_TUS_ENDPOINT: str = "https://video.bunnycdn.com/tusupload"
+    BUNNY_TUS_EXPIRY_SECONDS: int = 6 * 3600
+
+    # Bunny 웹훅 서명/토큰 키 (비어 있으면 웹훅 비활성, 상태 조회는 Bunny API 사용)
+    BUNNY_WEBHOOK_SECRET: str = ""
+
+    # 비디오 처리 상태 pub/sub (SSE)
+    VIDEO_STATUS_CACHE_SIZE: int = 1000
+    VIDEO_STATUS_CACHE_SECONDS: int = 3600
+    VIDEO_STATUS_QUEUE_SIZE: int = 100
+    SSE_KEEPALIVE_SECONDS: float = 15.0
+
+    # Auth (토큰 검증)
+    AUTH_VERIFY_MODE: str = "remote"  # remote: Supabase Auth 서버 검증, local: PyJWT 로컬 검증
+    SUPABASE_JWT_SECRET: str = ""  # HS256 프로젝트 JWT 시크릿
+    AUTH_JWKS_URL: str = ""  # 비어 있으면 {SUPABASE_URL}/auth/v1/.well-known/jwks.json
+    AUTH_JWKS_CACHE_SECONDS: int = 600
+    AUTH_JWT_AUDIENCE: str = "authenticated"
+    AUTH_TOKEN_CACHE_SIZE: int = 10000
+    AUTH_TOKEN_CACHE_SECONDS: int = 300
+    AUTH_NEGATIVE_CACHE_SECONDS: int = 30
+
+    # 수강 권한 캐시
+    ENROLLMENT_CACHE_SIZE: int = 50000
+    ENROLLMENT_CACHE_SECONDS: int = 300
+    ENROLLMENT_NEGATIVE_CACHE_SECONDS: int = 15
+
+    # 일괄 수강 등록 배치 크기 (in.(...) 필터가 URL에 들어가므로 너무 크지 않게)
+    ENROLLMENT_IMPORT_BATCH_SIZE: int = 200
+
+    # 관리자 역할 캐시
+    ROLE_CACHE_SIZE: int = 10000
+    ROLE_CACHE_SECONDS: int = 60
+    AUTH_ROLE_CLAIM: str = ""  # 예: app_metadata.role (설정 시 토큰 클레임을 DB보다 우선 사용)
+
+    # 시청 진도 write-behind 버퍼
+    PROGRESS_BUFFER_ENABLED: bool = True
+    PROGRESS_FLUSH_INTERVAL_SECONDS: float = 5.0
+    PROGRESS_FLUSH_MAX_BATCH: int = 500
+    PROGRESS_FLUSH_MAX_ATTEMPTS: int = 12  # 일시적 오류 시 키별 최대 기록 시도 횟수
+
+    # 강의 카탈로그 응답 캐시 (ETag)
+    CATALOG_CACHE_SIZE: int = 1000
+    CATALOG_CACHE_SECONDS: int = 60
+    VIDEO_CACHE_SIZE: int = 10000  # 비디오 행 캐시 (시청 경로 권한 확인용)
+
+    # 요청별 외부 호출 집계를 Server-Timing 응답 헤더로 노출
+    SERVER_TIMING_ENABLED: bool = True
+    # 요청별 집계 JSON 로그 레벨 (app.requests 로거, 비어 있으면 끔)
+    REQUEST_LOG_LEVEL: str = "INFO"
+
     # App
     FRONTEND_URL: str = "http://localhost:3000"
 
@@ -1,7 +1,8 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 
-from app.services.supabase import get_supabase_client, get_supabase_admin_client
+from app.services.auth import InvalidTokenError, token_verifier
+from app.services.roles import role_cache, role_from_token
 
 security = HTTPBearer()
 
@@ -12,17 +13,15 @@ async def get_current_user(
     """현재 인증된 사용자 정보 반환"""
 
     token = credentials.credentials
-    supabase = get_supabase_client()
 
     try:
-        # Supabase에서 토큰 검증
-        user_response = supabase.auth.get_user(token)
-        if not user_response.user:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid authentication token",
-            )
-        return user_response.user
+        # 토큰 검증 (AUTH_VERIFY_MODE에 따라 로컬 JWT 검증 또는 Supabase 검증, 결과 캐시)
+        return await token_verifier.verify(token)
+    except InvalidTokenError:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid authentication token",
+        )
     except Exception:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -35,19 +34,10 @@ async def get_current_admin_user(
 ) -> dict:
     """관리자 권한 확인"""
 
-    # admin 클라이언트 사용하여 RLS 우회
-    supabase = get_supabase_admin_client()
-
-    # profiles 테이블에서 role 확인
-    result = (
-        supabase.table("profiles")
-        .select("role")
-        .eq("id", str(current_user.id))
-        .single()
-        .execute()
-    )
+    # 토큰 역할 클레임 우선, 없으면 profiles.role 조회 (캐시)
+    role = role_from_token(current_user) or await role_cache.get_role(current_user.id)
 
-    if not result.data or result.data.get("role") != "admin":
+    if role != "admin":
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN, detail="Admin access required"
         )
@@ -1,13 +1,43 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.config import settings
-from app.routers import auth, courses, videos, admin
+from app.middleware import MetricsMiddleware, RequestStatsMiddleware, configure_request_logging
+from app.routers import auth, courses, videos, admin, webhooks
+from app.services.bunny import bunny_service
+from app.services.cleanup import bunny_cleanup
+from app.services.metrics import render_metrics
+from app.services.progress_buffer import progress_buffer
+from app.services.repository import repository
+from app.services.supabase import supabase_clients
+from app.services.video_status import video_status_broker
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """워커 단위 공유 리소스 생성/정리"""
+    supabase_clients.startup()
+    await repository.startup()
+    await bunny_service.startup()
+    await progress_buffer.start()
+    try:
+        yield
+    finally:
+        video_status_broker.close()
+        await progress_buffer.stop()
+        await bunny_cleanup.stop()
+        await bunny_service.close()
+        await repository.shutdown()
+        supabase_clients.shutdown()
+
 
 app = FastAPI(
     title="Video Streaming API",
     description="학생용 온라인 강의 비디오 스트리밍 서비스",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 # CORS 설정
@@ -17,15 +47,29 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "X-Next-Cursor", "X-Total-Count", "Server-Timing"],
 )
 
+# 요청 처리 시간 메트릭 / 요청별 외부 호출 집계 (JSON 로그)
+configure_request_logging(settings.REQUEST_LOG_LEVEL)
+app.add_middleware(RequestStatsMiddleware, server_timing=settings.SERVER_TIMING_ENABLED)
+app.add_middleware(MetricsMiddleware)
+
 # 라우터 등록
 app.include_router(auth.router, prefix="/api/auth", tags=["auth"])
 app.include_router(courses.router, prefix="/api/courses", tags=["courses"])
 app.include_router(videos.router, prefix="/api/videos", tags=["videos"])
 app.include_router(admin.router, prefix="/api/admin", tags=["admin"])
+app.include_router(webhooks.router, prefix="/api/webhooks", tags=["webhooks"])
 
 
 @app.get("/health")
 async def health_check():
     return {"status": "healthy"}
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus 메트릭 (외부 공개하지 않도록 인그레스에서 제한)"""
+    body, content_type = render_metrics()
+    return Response(content=body, media_type=content_type)
@@ -0,0 +1,133 @@
+import json
+import logging
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.services import request_stats
+from app.services.metrics import HTTP_REQUEST_DURATION, HTTP_REQUESTS_IN_PROGRESS
+
+logger = logging.getLogger("app.requests")
+
+
+class JsonLogFormatter(logging.Formatter):
+    """한 줄 JSON 로그 (request_stats extra 필드를 최상위 키로 펼침)"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": self.formatTime(record, "%Y-%m-%dT%H:%M:%S%z"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            **getattr(record, "request_stats", {}),
+        }
+        return json.dumps(entry, ensure_ascii=False)
+
+
+def configure_request_logging(level: str) -> None:
+    """app.requests 로거에 JSON 핸들러 연결 (uvicorn 로깅 설정과 무관하게 출력, 빈 값이면 끔)"""
+    if not level:
+        logger.disabled = True
+        return
+
+    logger.setLevel(level.upper())
+    logger.propagate = False
+    if not any(isinstance(handler.formatter, JsonLogFormatter) for handler in logger.handlers):
+        handler = logging.StreamHandler()
+        handler.setFormatter(JsonLogFormatter())
+        logger.addHandler(handler)
+
+
+def route_template(scope: Scope) -> str:
+    """매칭된 라우트의 경로 템플릿 (매칭되지 않은 경로는 하나의 라벨로 묶어 라벨 수 폭증 방지)"""
+    # 최신 FastAPI의 include_router 라우트는 라우터 기준 경로만 갖고,
+    # prefix를 포함한 전체 경로는 scope["fastapi"]["effective_route_context"]에 있다
+    context = (scope.get("fastapi") or {}).get("effective_route_context")
+    path = getattr(context, "path", None) or getattr(scope.get("route"), "path", None)
+    return path or "<unmatched>"
+
+
+class MetricsMiddleware:
+    """요청 처리 시간을 라우트 템플릿(/api/videos/{video_id}) 단위로 기록하는 ASGI 미들웨어"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+        start = time.perf_counter()
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        HTTP_REQUESTS_IN_PROGRESS.labels(method).inc()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            HTTP_REQUESTS_IN_PROGRESS.labels(method).dec()
+            HTTP_REQUEST_DURATION.labels(method, route_template(scope), str(status_code)).observe(
+                time.perf_counter() - start
+            )
+
+
+class RequestStatsMiddleware:
+    """요청별 Supabase 쿼리/Bunny/Auth 호출 횟수와 시간을 Server-Timing 헤더와 로그로 남기는 ASGI 미들웨어
+
+    헤더는 응답 시작 시점의 값이므로 스트리밍 응답은 본문 전송 중 호출이 빠지고,
+    로그에는 응답이 끝난 뒤의 최종 값이 기록된다.
+    """
+
+    def __init__(self, app: ASGIApp, server_timing: bool = True):
+        self.app = app
+        self.server_timing = server_timing
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        token = request_stats.start()
+        stats = request_stats.current()
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if self.server_timing:
+                    MutableHeaders(scope=message).append("Server-Timing", stats.server_timing())
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            request_stats.reset(token)
+            fields = {
+                "method": scope["method"],
+                "route": route_template(scope),
+                "status": status_code,
+                **stats.as_dict(),
+            }
+            logger.info(
+                "%s %s %s %.1fms db=%d/%.1fms bunny=%d/%.1fms auth=%d/%.1fms",
+                fields["method"],
+                fields["route"],
+                status_code,
+                fields["duration_ms"],
+                fields["db_count"],
+                fields["db_ms"],
+                fields["bunny_count"],
+                fields["bunny_ms"],
+                fields["auth_count"],
+                fields["auth_ms"],
+                extra={"request_stats": fields},
+            )
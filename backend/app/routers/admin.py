@@ -1,29 +1,82 @@
-from typing import List
+import asyncio
+import json
+from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 
+from app.config import settings
 from app.dependencies import get_current_admin_user
+from app.services.database import run_query
 from app.services.supabase import get_supabase_admin_client
 from app.services.bunny import bunny_service
+from app.services.catalog import catalog_cache
+from app.services.cleanup import bunny_cleanup
+from app.services.enrollment_import import EnrollmentImport, iter_lines, iter_records
+from app.services.enrollments import enrollment_cache
+from app.services.pagination import count_method, keyset_page, page_rows
+from app.services.roles import role_cache
+from app.services.video_status import (
+    TERMINAL_STATUSES,
+    VIDEO_STATUS,
+    status_payload,
+    video_status_broker,
+)
 from app.schemas.course import CourseCreate, CourseUpdate, CourseResponse
-from app.schemas.video import VideoCreate, VideoUpdate, VideoResponse
-from app.schemas.enrollment import EnrollmentCreate, EnrollmentResponse
-from app.schemas.common import MessageResponse
+from app.schemas.video import (
+    BulkImportRequest,
+    BulkImportResponse,
+    VideoCreate,
+    VideoResponse,
+    VideoUpdate,
+)
+from app.schemas.enrollment import BulkEnrollmentResponse, EnrollmentCreate, EnrollmentResponse
+from app.schemas.common import CleanupJobResponse, DeleteResponse, MessageResponse
 
 router = APIRouter()
 
 
+async def _unreferenced_bunny_ids(deleted_videos: List[dict]) -> List[str]:
+    """삭제된 행의 bunny_video_id 중 다른 videos 행이 더 이상 참조하지 않는 것만 반환
+
+    같은 Bunny 비디오가 여러 강의에 등록될 수 있으므로 아직 쓰이는 원본은 지우지 않는다.
+    """
+    bunny_ids = list(dict.fromkeys(
+        video["bunny_video_id"] for video in deleted_videos if video.get("bunny_video_id")
+    ))
+    if not bunny_ids:
+        return []
+
+    supabase = get_supabase_admin_client()
+    remaining = await run_query(
+        supabase.table("videos").select("bunny_video_id").in_("bunny_video_id", bunny_ids)
+    )
+    referenced = {row["bunny_video_id"] for row in remaining.data or []}
+    return [bunny_id for bunny_id in bunny_ids if bunny_id not in referenced]
+
+
 # ============== Course Management ==============
 
 
 @router.get("/courses", response_model=List[CourseResponse])
-async def admin_get_courses(current_user: dict = Depends(get_current_admin_user)):
-    """모든 강의 목록 조회 (관리자)"""
+async def admin_get_courses(
+    response: Response,
+    is_published: Optional[bool] = None,
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = None,
+    include_total: bool = False,
+    current_user: dict = Depends(get_current_admin_user)
+):
+    """모든 강의 목록 조회 (관리자, created_at 기준 커서 페이지네이션)"""
     supabase = get_supabase_admin_client()
 
-    courses = supabase.table("courses").select("*").execute()
-    return courses.data or []
+    query = supabase.table("courses").select("*", count=count_method(include_total, cursor))
+    if is_published is not None:
+        query = query.eq("is_published", is_published)
+
+    courses = await run_query(keyset_page(query, "created_at", limit, cursor))
+    return page_rows(response, courses.data or [], "created_at", limit, courses.count)
 
 
 @router.post("/courses", response_model=CourseResponse)
@@ -34,7 +87,7 @@ async def admin_create_course(
     """강의 생성 (관리자)"""
     supabase = get_supabase_admin_client()
 
-    result = supabase.table("courses").insert(course_data.model_dump()).execute()
+    result = await run_query(supabase.table("courses").insert(course_data.model_dump()))
 
     if not result.data:
         raise HTTPException(
@@ -42,6 +95,9 @@ async def admin_create_course(
             detail="Failed to create course",
         )
 
+    # 카탈로그 캐시 무효화
+    catalog_cache.bump()
+
     return result.data[0]
 
 
@@ -55,8 +111,8 @@ async def admin_update_course(
     supabase = get_supabase_admin_client()
 
     # 기존 강의 확인
-    existing = (
-        supabase.table("courses").select("*").eq("id", str(course_id)).single().execute()
+    existing = await run_query(
+        supabase.table("courses").select("*").eq("id", str(course_id)).single()
     )
 
     if not existing.data:
@@ -68,46 +124,72 @@ async def admin_update_course(
     # 업데이트
     update_data = {k: v for k, v in course_data.model_dump().items() if v is not None}
 
-    result = (
+    result = await run_query(
         supabase.table("courses")
         .update(update_data)
         .eq("id", str(course_id))
-        .execute()
     )
 
+    # 카탈로그 캐시 무효화
+    catalog_cache.bump()
+
     return result.data[0]
 
 
-@router.delete("/courses/{course_id}", response_model=MessageResponse)
+@router.delete("/courses/{course_id}", response_model=DeleteResponse)
 async def admin_delete_course(
     course_id: UUID,
     current_user: dict = Depends(get_current_admin_user),
 ):
-    """강의 삭제 (관리자)"""
+    """강의 삭제 (관리자, Bunny 비디오는 백그라운드에서 삭제)"""
     supabase = get_supabase_admin_client()
 
-    # 강의에 속한 비디오 삭제
-    supabase.table("videos").delete().eq("course_id", str(course_id)).execute()
+    # 강의에 속한 비디오 삭제 (삭제된 행의 bunny_video_id 사용)
+    videos = await run_query(
+        supabase.table("videos").delete().eq("course_id", str(course_id))
+    )
 
     # 수강 등록 삭제
-    supabase.table("enrollments").delete().eq("course_id", str(course_id)).execute()
+    await run_query(
+        supabase.table("enrollments").delete().eq("course_id", str(course_id))
+    )
+    enrollment_cache.invalidate_course(course_id)
 
     # 강의 삭제
-    supabase.table("courses").delete().eq("id", str(course_id)).execute()
+    await run_query(supabase.table("courses").delete().eq("id", str(course_id)))
+
+    # 카탈로그 캐시 무효화
+    catalog_cache.bump()
 
-    return {"message": "Course deleted successfully"}
+    job = bunny_cleanup.submit(await _unreferenced_bunny_ids(videos.data or []))
+
+    return {
+        "message": "Course deleted successfully",
+        "cleanup_job_id": job["id"] if job else None,
+    }
 
 
 # ============== Video Management ==============
 
 
 @router.get("/videos", response_model=List[VideoResponse])
-async def admin_get_videos(current_user: dict = Depends(get_current_admin_user)):
-    """모든 비디오 목록 조회 (관리자)"""
+async def admin_get_videos(
+    response: Response,
+    course_id: Optional[UUID] = None,
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = None,
+    include_total: bool = False,
+    current_user: dict = Depends(get_current_admin_user)
+):
+    """모든 비디오 목록 조회 (관리자, created_at 기준 커서 페이지네이션)"""
     supabase = get_supabase_admin_client()
 
-    videos = supabase.table("videos").select("*").execute()
-    return videos.data or []
+    query = supabase.table("videos").select("*", count=count_method(include_total, cursor))
+    if course_id is not None:
+        query = query.eq("course_id", str(course_id))
+
+    videos = await run_query(keyset_page(query, "created_at", limit, cursor))
+    return page_rows(response, videos.data or [], "created_at", limit, videos.count)
 
 
 @router.post("/videos", response_model=VideoResponse)
@@ -119,12 +201,11 @@ async def admin_create_video(
     supabase = get_supabase_admin_client()
 
     # 강의 존재 확인
-    course = (
+    course = await run_query(
         supabase.table("courses")
         .select("id")
         .eq("id", str(video_data.course_id))
         .single()
-        .execute()
     )
 
     if not course.data:
@@ -136,7 +217,7 @@ async def admin_create_video(
     data = video_data.model_dump()
     data["course_id"] = str(data["course_id"])
 
-    result = supabase.table("videos").insert(data).execute()
+    result = await run_query(supabase.table("videos").insert(data))
 
     if not result.data:
         raise HTTPException(
@@ -144,6 +225,9 @@ async def admin_create_video(
             detail="Failed to create video",
         )
 
+    # 카탈로그 캐시 무효화
+    catalog_cache.bump()
+
     return result.data[0]
 
 
@@ -157,8 +241,8 @@ async def admin_update_video(
     supabase = get_supabase_admin_client()
 
     # 기존 비디오 확인
-    existing = (
-        supabase.table("videos").select("*").eq("id", str(video_id)).single().execute()
+    existing = await run_query(
+        supabase.table("videos").select("*").eq("id", str(video_id)).single()
     )
 
     if not existing.data:
@@ -170,44 +254,58 @@ async def admin_update_video(
     # 업데이트
     update_data = {k: v for k, v in video_data.model_dump().items() if v is not None}
 
-    result = (
-        supabase.table("videos").update(update_data).eq("id", str(video_id)).execute()
+    result = await run_query(
+        supabase.table("videos").update(update_data).eq("id", str(video_id))
     )
 
+    # 카탈로그 캐시 무효화
+    catalog_cache.bump()
+
     return result.data[0]
 
 
-@router.delete("/videos/{video_id}", response_model=MessageResponse)
+@router.delete("/videos/{video_id}", response_model=DeleteResponse)
 async def admin_delete_video(
     video_id: UUID,
     current_user: dict = Depends(get_current_admin_user),
 ):
-    """비디오 삭제 (관리자)"""
+    """비디오 삭제 (관리자, Bunny 비디오는 백그라운드에서 삭제)"""
     supabase = get_supabase_admin_client()
 
-    # 비디오 정보 조회 (Bunny 삭제용)
-    video = (
-        supabase.table("videos")
-        .select("bunny_video_id")
-        .eq("id", str(video_id))
-        .single()
-        .execute()
+    # 시청 기록 삭제
+    await run_query(
+        supabase.table("watch_history").delete().eq("video_id", str(video_id))
     )
 
-    # Bunny에서 비디오 삭제
-    if video.data and video.data.get("bunny_video_id"):
-        try:
-            await bunny_service.delete_video(video.data["bunny_video_id"])
-        except Exception:
-            pass  # Bunny 삭제 실패해도 DB는 삭제
+    # 비디오 삭제 (삭제된 행의 bunny_video_id 사용)
+    video = await run_query(supabase.table("videos").delete().eq("id", str(video_id)))
 
-    # 시청 기록 삭제
-    supabase.table("watch_history").delete().eq("video_id", str(video_id)).execute()
+    # 카탈로그 캐시 무효화
+    catalog_cache.bump()
+
+    job = bunny_cleanup.submit(await _unreferenced_bunny_ids(video.data or []))
+
+    return {
+        "message": "Video deleted successfully",
+        "cleanup_job_id": job["id"] if job else None,
+    }
+
+
+@router.get("/cleanup-jobs/{job_id}", response_model=CleanupJobResponse)
+async def admin_get_cleanup_job(
+    job_id: str,
+    current_user: dict = Depends(get_current_admin_user),
+):
+    """Bunny 비디오 삭제 작업 진행 상황 조회 (관리자)"""
+    job = bunny_cleanup.get(job_id)
 
-    # 비디오 삭제
-    supabase.table("videos").delete().eq("id", str(video_id)).execute()
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Cleanup job not found",
+        )
 
-    return {"message": "Video deleted successfully"}
+    return job
 
 
 # ============== Video Upload ==============
@@ -224,12 +322,11 @@ async def admin_get_upload_url(
     supabase = get_supabase_admin_client()
 
     # 강의 존재 확인
-    course = (
+    course = await run_query(
         supabase.table("courses")
         .select("id")
         .eq("id", str(course_id))
         .single()
-        .execute()
     )
 
     if not course.data:
@@ -252,6 +349,48 @@ async def admin_get_upload_url(
     }
 
 
+@router.post("/videos/tus-upload")
+async def admin_create_tus_upload(
+    course_id: UUID,
+    title: str,
+    current_user: dict = Depends(get_current_admin_user),
+):
+    """Bunny Stream TUS 재개 가능 업로드 발급 (관리자)
+
+    Bunny 비디오를 생성하고 해당 비디오에만 유효한 서명 헤더를 반환한다.
+    클라이언트는 tus 프로토콜로 tus_endpoint에 직접 업로드하고, 끊기면 이어서 올린다.
+    """
+    supabase = get_supabase_admin_client()
+
+    # 강의 존재 확인
+    course = await run_query(
+        supabase.table("courses")
+        .select("id")
+        .eq("id", str(course_id))
+        .maybe_single()
+    )
+
+    if not course or not course.data:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Course not found",
+        )
+
+    result = await bunny_service.create_video(title=title)
+    video_guid = result["guid"]
+    upload_headers = bunny_service.generate_tus_authorization(video_guid)
+
+    return {
+        "tus_endpoint": settings.BUNNY_TUS_ENDPOINT,
+        "bunny_video_id": video_guid,
+        "course_id": str(course_id),
+        "title": title,
+        "upload_headers": upload_headers,
+        "metadata": {"title": title},
+        "expires_at": int(upload_headers["AuthorizationExpire"]),
+    }
+
+
 @router.post("/videos/complete-upload")
 async def admin_complete_upload(
     bunny_video_id: str,
@@ -270,8 +409,15 @@ async def admin_complete_upload(
         bunny_video = await bunny_service.get_video_details(bunny_video_id)
         duration_seconds = int(bunny_video.get("length", duration_seconds))
         thumbnail = bunny_service.get_thumbnail_url(bunny_video_id)
+        encoding_status = VIDEO_STATUS.get(bunny_video.get("status"))
     except Exception:
         thumbnail = bunny_service.get_thumbnail_url(bunny_video_id)
+        encoding_status = None
+
+    # 업로드 직후 웹훅이 먼저 도착한 경우 그 상태 사용
+    event = video_status_broker.get(bunny_video_id)
+    if event is not None:
+        encoding_status = event["status"]
 
     # 데이터베이스에 비디오 정보 저장
     video_data = {
@@ -282,9 +428,10 @@ async def admin_complete_upload(
         "duration_seconds": duration_seconds,
         "order_index": order_index,
         "bunny_thumbnail": thumbnail,
+        "encoding_status": encoding_status,
     }
 
-    result = supabase.table("videos").insert(video_data).execute()
+    result = await run_query(supabase.table("videos").insert(video_data))
 
     if not result.data:
         raise HTTPException(
@@ -292,26 +439,186 @@ async def admin_complete_upload(
             detail="Failed to save video info",
         )
 
+    # 카탈로그 캐시 무효화
+    catalog_cache.bump()
+
     return result.data[0]
 
 
+@router.post("/videos/bulk-import", response_model=BulkImportResponse)
+async def admin_bulk_import_videos(
+    request: BulkImportRequest,
+    current_user: dict = Depends(get_current_admin_user),
+):
+    """Bunny 라이브러리의 기존 비디오 일괄 등록 (관리자)
+
+    bunny_video_ids 또는 collection_id의 비디오를 강의 마지막 순서 뒤에 한 번의 insert로 추가한다.
+    """
+    if not request.bunny_video_ids and not request.collection_id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="bunny_video_ids or collection_id is required",
+        )
+
+    supabase = get_supabase_admin_client()
+    course_id = str(request.course_id)
+
+    course = await run_query(
+        supabase.table("courses")
+        .select("id")
+        .eq("id", course_id)
+        .maybe_single()
+    )
+
+    if not course or not course.data:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Course not found",
+        )
+
+    # Bunny 비디오 정보 (컬렉션은 목록 조회 결과에 상세 정보가 포함됨)
+    failed = []
+    if request.collection_id:
+        try:
+            details = await bunny_service.list_videos(collection=request.collection_id)
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to fetch videos: {str(e)}",
+            )
+    else:
+        bunny_video_ids = list(dict.fromkeys(request.bunny_video_ids))
+        fetched = await bunny_service.get_many_video_details(bunny_video_ids)
+        details = [video for video in fetched if video is not None]
+        failed = [
+            video_id for video_id, video in zip(bunny_video_ids, fetched)
+            if video is None
+        ]
+
+    guids = [video["guid"] for video in details]
+    if not guids:
+        return {"course_id": request.course_id, "imported": [], "skipped": [], "failed": failed}
+
+    # 이미 등록된 비디오와 현재 마지막 순서를 동시에 조회
+    existing, last = await asyncio.gather(
+        run_query(
+            supabase.table("videos")
+            .select("bunny_video_id")
+            .eq("course_id", course_id)
+            .in_("bunny_video_id", guids)
+        ),
+        run_query(
+            supabase.table("videos")
+            .select("order_index")
+            .eq("course_id", course_id)
+            # DESC 정렬은 NULL이 먼저 오므로 제외
+            .not_.is_("order_index", "null")
+            .order("order_index", desc=True)
+            .limit(1)
+        ),
+    )
+    existing_ids = {row["bunny_video_id"] for row in existing.data or []}
+    next_index = last.data[0]["order_index"] + 1 if last.data else 0
+
+    rows = []
+    for video in details:
+        if video["guid"] in existing_ids:
+            continue
+        existing_ids.add(video["guid"])
+        rows.append({
+            "course_id": course_id,
+            "title": video.get("title") or video["guid"],
+            "bunny_video_id": video["guid"],
+            "duration_seconds": int(video.get("length") or 0),
+            "order_index": next_index + len(rows),
+            "bunny_thumbnail": bunny_service.get_thumbnail_url(video["guid"]),
+            "encoding_status": VIDEO_STATUS.get(video.get("status")),
+        })
+
+    imported = []
+    if rows:
+        result = await run_query(supabase.table("videos").insert(rows))
+        imported = result.data or []
+
+        # 카탈로그 캐시 무효화
+        catalog_cache.bump()
+
+    imported_ids = {row["bunny_video_id"] for row in rows}
+    return {
+        "course_id": request.course_id,
+        "imported": imported,
+        "skipped": [guid for guid in dict.fromkeys(guids) if guid not in imported_ids],
+        "failed": failed,
+    }
+
+
+@router.get("/videos/status/stream")
+async def admin_stream_video_status(
+    video_id: Optional[List[str]] = Query(None),
+    current_user: dict = Depends(get_current_admin_user),
+):
+    """비디오 처리 상태 변경 SSE 스트림 (관리자, video_id로 Bunny 비디오 필터)
+
+    다른 관리자 API처럼 Authorization: Bearer 헤더가 필요하다. 브라우저 기본 EventSource는
+    헤더를 보낼 수 없으므로 fetch 스트림 기반 클라이언트(예: @microsoft/fetch-event-source)로
+    구독한다. 토큰을 쿼리 문자열로 받지 않는 것은 접근 로그에 남지 않게 하기 위함이다.
+    """
+
+    async def events():
+        async for event in video_status_broker.subscribe(video_id):
+            if event is None:
+                yield ": keep-alive\n\n"
+            else:
+                yield f"event: status\ndata: {json.dumps(event)}\n\n"
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.get("/videos/{video_id}/status")
 async def admin_get_video_status(
     video_id: str,
     current_user: dict = Depends(get_current_admin_user),
 ):
-    """Bunny 비디오 처리 상태 조회 (관리자)"""
+    """Bunny 비디오 처리 상태 조회 (관리자)
+
+    저장된 상태(이 워커의 최신 이벤트, videos.encoding_status)는 완료/오류이거나
+    웹훅이 설정되어 이후 변경을 받을 수 있을 때만 사용하고, 그 외에는 Bunny API를 조회한다.
+    """
+    webhooks_enabled = bool(settings.BUNNY_WEBHOOK_SECRET)
+
+    event = video_status_broker.get(video_id)
+    if event is not None and (webhooks_enabled or event["status"] in TERMINAL_STATUSES):
+        return event
+
+    supabase = get_supabase_admin_client()
+    result = await run_query(
+        supabase.table("videos")
+        .select("encoding_status, duration_seconds, bunny_thumbnail")
+        .eq("bunny_video_id", video_id)
+        .not_.is_("encoding_status", "null")
+        .limit(1)
+    )
+    row = result.data[0] if result.data else None
+    if row and (webhooks_enabled or row["encoding_status"] in TERMINAL_STATUSES):
+        return status_payload(
+            video_id,
+            row["encoding_status"],
+            row.get("duration_seconds"),
+            row.get("bunny_thumbnail") or bunny_service.get_thumbnail_url(video_id),
+        )
+
     try:
         video_details = await bunny_service.get_video_details(video_id)
-        bunny_status = video_details.get("status", 0)
-        status_map = {0: "created", 1: "uploaded", 2: "processing", 3: "transcoding", 4: "finished", 5: "error"}
-        return {
-            "video_id": video_id,
-            "status": status_map.get(bunny_status, "unknown"),
-            "ready_to_stream": bunny_status == 4,
-            "duration": video_details.get("length"),
-            "thumbnail": bunny_service.get_thumbnail_url(video_id),
-        }
+        return status_payload(
+            video_id,
+            VIDEO_STATUS.get(video_details.get("status", 0), "unknown"),
+            video_details.get("length"),
+            bunny_service.get_thumbnail_url(video_id),
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -321,11 +628,13 @@ async def admin_get_video_status(
 
 @router.get("/bunny/videos")
 async def admin_list_bunny_videos(
+    search: Optional[str] = None,
+    collection: Optional[str] = None,
     current_user: dict = Depends(get_current_admin_user),
 ):
     """Bunny Stream 비디오 목록 조회 (관리자)"""
     try:
-        videos = await bunny_service.list_videos()
+        videos = await bunny_service.list_videos(search, collection)
         return {"videos": videos}
     except Exception as e:
         raise HTTPException(
@@ -334,16 +643,60 @@ async def admin_list_bunny_videos(
         )
 
 
+@router.get("/bunny/videos/stream")
+async def admin_stream_bunny_videos(
+    search: Optional[str] = None,
+    collection: Optional[str] = None,
+    current_user: dict = Depends(get_current_admin_user),
+):
+    """Bunny Stream 비디오 목록 스트리밍 (관리자, NDJSON 한 줄에 비디오 하나)"""
+    videos = bunny_service.iter_videos(search, collection)
+
+    # 첫 페이지 오류는 응답 시작 전에 상태 코드로 반환
+    try:
+        first = await videos.__anext__()
+    except StopAsyncIteration:
+        first = None
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to fetch videos: {str(e)}",
+        )
+
+    async def lines():
+        if first is None:
+            return
+        yield json.dumps(first) + "\n"
+        async for video in videos:
+            yield json.dumps(video) + "\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
 # ============== Enrollment Management ==============
 
 
 @router.get("/enrollments", response_model=List[EnrollmentResponse])
-async def admin_get_enrollments(current_user: dict = Depends(get_current_admin_user)):
-    """모든 수강 등록 목록 조회 (관리자)"""
+async def admin_get_enrollments(
+    response: Response,
+    course_id: Optional[UUID] = None,
+    user_id: Optional[UUID] = None,
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = None,
+    include_total: bool = False,
+    current_user: dict = Depends(get_current_admin_user)
+):
+    """모든 수강 등록 목록 조회 (관리자, enrolled_at 기준 커서 페이지네이션)"""
     supabase = get_supabase_admin_client()
 
-    enrollments = supabase.table("enrollments").select("*").execute()
-    return enrollments.data or []
+    query = supabase.table("enrollments").select("*", count=count_method(include_total, cursor))
+    if course_id is not None:
+        query = query.eq("course_id", str(course_id))
+    if user_id is not None:
+        query = query.eq("user_id", str(user_id))
+
+    enrollments = await run_query(keyset_page(query, "enrolled_at", limit, cursor))
+    return page_rows(response, enrollments.data or [], "enrolled_at", limit, enrollments.count)
 
 
 @router.post("/enrollments", response_model=EnrollmentResponse)
@@ -355,12 +708,11 @@ async def admin_create_enrollment(
     supabase = get_supabase_admin_client()
 
     # 사용자 존재 확인
-    user = (
+    user = await run_query(
         supabase.table("profiles")
         .select("id")
         .eq("id", str(enrollment_data.user_id))
         .single()
-        .execute()
     )
 
     if not user.data:
@@ -370,12 +722,11 @@ async def admin_create_enrollment(
         )
 
     # 강의 존재 확인
-    course = (
+    course = await run_query(
         supabase.table("courses")
         .select("id")
         .eq("id", str(enrollment_data.course_id))
         .single()
-        .execute()
     )
 
     if not course.data:
@@ -385,12 +736,11 @@ async def admin_create_enrollment(
         )
 
     # 중복 등록 확인
-    existing = (
+    existing = await run_query(
         supabase.table("enrollments")
         .select("*")
         .eq("user_id", str(enrollment_data.user_id))
         .eq("course_id", str(enrollment_data.course_id))
-        .execute()
     )
 
     if existing.data:
@@ -405,7 +755,7 @@ async def admin_create_enrollment(
     if data["expires_at"]:
         data["expires_at"] = data["expires_at"].isoformat()
 
-    result = supabase.table("enrollments").insert(data).execute()
+    result = await run_query(supabase.table("enrollments").insert(data))
 
     if not result.data:
         raise HTTPException(
@@ -413,9 +763,35 @@ async def admin_create_enrollment(
             detail="Failed to create enrollment",
         )
 
+    # 수강 권한 캐시 무효화 (미등록 캐시 제거)
+    enrollment_cache.invalidate(data["user_id"], data["course_id"])
+
     return result.data[0]
 
 
+@router.post("/enrollments/bulk", response_model=BulkEnrollmentResponse)
+async def admin_bulk_create_enrollments(
+    request: Request,
+    current_user: dict = Depends(get_current_admin_user),
+):
+    """일괄 수강 등록 (관리자)
+
+    본문: text/csv (헤더: email 또는 user_id, course_id, expires_at) 또는
+    application/x-ndjson (한 줄에 {"email"|"user_id", "course_id", "expires_at"}).
+    본문을 스트림으로 읽어 배치 단위로 처리하고 행별 결과를 반환한다.
+    """
+    content_type = request.headers.get("content-type", "")
+    if "csv" not in content_type and "json" not in content_type:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail="Use text/csv or application/x-ndjson",
+        )
+
+    # 디코딩/CSV 오류도 행별 결과(invalid)로 보고하므로 앞 배치가 기록된 뒤에도 전체 결과를 반환
+    records = iter_records(iter_lines(request.stream()), content_type)
+    return await EnrollmentImport().run(records)
+
+
 @router.delete("/enrollments/{enrollment_id}", response_model=MessageResponse)
 async def admin_delete_enrollment(
     enrollment_id: UUID,
@@ -424,7 +800,13 @@ async def admin_delete_enrollment(
     """수강 등록 삭제 (관리자)"""
     supabase = get_supabase_admin_client()
 
-    supabase.table("enrollments").delete().eq("id", str(enrollment_id)).execute()
+    result = await run_query(
+        supabase.table("enrollments").delete().eq("id", str(enrollment_id))
+    )
+
+    # 수강 권한 캐시 무효화
+    for enrollment in result.data or []:
+        enrollment_cache.invalidate(enrollment["user_id"], enrollment["course_id"])
 
     return {"message": "Enrollment deleted successfully"}
 
@@ -433,12 +815,23 @@ async def admin_delete_enrollment(
 
 
 @router.get("/users")
-async def admin_get_users(current_user: dict = Depends(get_current_admin_user)):
-    """모든 사용자 목록 조회 (관리자)"""
+async def admin_get_users(
+    response: Response,
+    role: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = None,
+    include_total: bool = False,
+    current_user: dict = Depends(get_current_admin_user)
+):
+    """모든 사용자 목록 조회 (관리자, created_at 기준 커서 페이지네이션)"""
     supabase = get_supabase_admin_client()
 
-    users = supabase.table("profiles").select("*").execute()
-    return users.data or []
+    query = supabase.table("profiles").select("*", count=count_method(include_total, cursor))
+    if role is not None:
+        query = query.eq("role", role)
+
+    users = await run_query(keyset_page(query, "created_at", limit, cursor))
+    return page_rows(response, users.data or [], "created_at", limit, users.count)
 
 
 @router.put("/users/{user_id}/role")
@@ -456,11 +849,10 @@ async def admin_update_user_role(
             detail="Invalid role. Must be 'student' or 'admin'",
         )
 
-    result = (
+    result = await run_query(
         supabase.table("profiles")
         .update({"role": role})
         .eq("id", str(user_id))
-        .execute()
     )
 
     if not result.data:
@@ -469,4 +861,7 @@ async def admin_update_user_role(
             detail="User not found",
         )
 
+    # 역할 캐시 무효화
+    role_cache.invalidate(user_id)
+
     return result.data[0]
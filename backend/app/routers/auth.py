@@ -1,6 +1,7 @@
 from fastapi import APIRouter, HTTPException, status, Depends
 
-from app.services.supabase import get_supabase_client, get_supabase_admin_client
+from app.services.database import run_query, run_sync
+from app.services.supabase import get_supabase_session_client, get_supabase_admin_client
 from app.dependencies import get_current_user
 from app.schemas.user import UserCreate, UserLogin, ProfileResponse
 from app.schemas.common import MessageResponse
@@ -11,12 +12,13 @@ router = APIRouter()
 @router.post("/signup", response_model=MessageResponse)
 async def signup(user_data: UserCreate):
     """회원가입"""
-    supabase = get_supabase_client()
+    supabase = get_supabase_session_client()
 
     try:
         # Supabase Auth로 사용자 생성
         # user_metadata에 name을 저장하면 트리거가 자동으로 profiles에 삽입
-        response = supabase.auth.sign_up(
+        response = await run_sync(
+            supabase.auth.sign_up,
             {
                 "email": user_data.email,
                 "password": user_data.password,
@@ -25,7 +27,7 @@ async def signup(user_data: UserCreate):
                         "name": user_data.name,
                     }
                 },
-            }
+            },
         )
 
         if response.user is None:
@@ -47,11 +49,12 @@ async def signup(user_data: UserCreate):
 @router.post("/signin")
 async def signin(user_data: UserLogin):
     """로그인"""
-    supabase = get_supabase_client()
+    supabase = get_supabase_session_client()
 
     try:
-        response = supabase.auth.sign_in_with_password(
-            {"email": user_data.email, "password": user_data.password}
+        response = await run_sync(
+            supabase.auth.sign_in_with_password,
+            {"email": user_data.email, "password": user_data.password},
         )
 
         if response.user is None:
@@ -80,10 +83,10 @@ async def signin(user_data: UserLogin):
 @router.post("/signout", response_model=MessageResponse)
 async def signout(current_user: dict = Depends(get_current_user)):
     """로그아웃"""
-    supabase = get_supabase_client()
+    supabase = get_supabase_session_client()
 
     try:
-        supabase.auth.sign_out()
+        await run_sync(supabase.auth.sign_out)
         return {"message": "Successfully signed out"}
     except Exception as e:
         raise HTTPException(
@@ -98,12 +101,11 @@ async def get_me(current_user: dict = Depends(get_current_user)):
     # 서버사이드에서 admin 클라이언트 사용 (RLS 우회)
     supabase = get_supabase_admin_client()
 
-    result = (
+    result = await run_query(
         supabase.table("profiles")
         .select("*")
         .eq("id", str(current_user.id))
         .single()
-        .execute()
     )
 
     if not result.data:
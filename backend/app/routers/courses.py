@@ -1,14 +1,33 @@
-from typing import List
+import asyncio
+import time
+from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from pydantic import TypeAdapter
 
 from app.dependencies import get_current_user
+from app.services.bunny import bunny_service
+from app.services.catalog import catalog_cache, conditional_response
+from app.services.database import run_query
+from app.services.enrollments import enrollment_cache
+from app.services.progress_buffer import progress_buffer
+from app.services.repository import repository
 from app.services.supabase import get_supabase_admin_client
-from app.schemas.course import CourseResponse, CourseWithVideosResponse
+from app.schemas.course import CourseProgressResponse, CourseResponse, CourseWithVideosResponse
+from app.schemas.video import BatchSignedUrlRequest, BatchSignedUrlResponse
 
 router = APIRouter()
 
+# 카탈로그 응답 직렬화 (response_model과 같은 스키마)
+_course_list_adapter = TypeAdapter(List[CourseResponse])
+_course_detail_adapter = TypeAdapter(CourseWithVideosResponse)
+
+
+def _dump(adapter: TypeAdapter, data) -> bytes:
+    """response_model과 같이 검증 후 직렬화 (스키마에 없는 컬럼 제외)"""
+    return adapter.dump_json(adapter.validate_python(data))
+
 
 @router.get("", response_model=List[CourseResponse])
 async def get_courses(current_user: dict = Depends(get_current_user)):
@@ -16,11 +35,10 @@ async def get_courses(current_user: dict = Depends(get_current_user)):
     supabase = get_supabase_admin_client()
 
     # 사용자가 수강 등록한 강의 ID 조회
-    enrollments = (
+    enrollments = await run_query(
         supabase.table("enrollments")
         .select("course_id")
         .eq("user_id", str(current_user.id))
-        .execute()
     )
 
     if not enrollments.data:
@@ -29,78 +47,87 @@ async def get_courses(current_user: dict = Depends(get_current_user)):
     course_ids = [e["course_id"] for e in enrollments.data]
 
     # 강의 정보 조회
-    courses = (
+    courses = await run_query(
         supabase.table("courses")
         .select("*")
         .in_("id", course_ids)
         .eq("is_published", True)
-        .execute()
     )
 
     return courses.data or []
 
 
 @router.get("/all", response_model=List[CourseResponse])
-async def get_all_courses(current_user: dict = Depends(get_current_user)):
-    """모든 공개 강의 목록 조회"""
-    supabase = get_supabase_admin_client()
+async def get_all_courses(request: Request, current_user: dict = Depends(get_current_user)):
+    """모든 공개 강의 목록 조회 (ETag / If-None-Match 지원)"""
+    entry = catalog_cache.get("all")
 
-    courses = (
-        supabase.table("courses")
-        .select("*")
-        .eq("is_published", True)
-        .execute()
-    )
+    if entry is None:
+        supabase = get_supabase_admin_client()
 
-    return courses.data or []
+        courses = await run_query(
+            supabase.table("courses")
+            .select("*")
+            .eq("is_published", True)
+        )
 
+        body = _dump(_course_list_adapter, courses.data or [])
+        entry = catalog_cache.set("all", body)
 
-@router.get("/{course_id}", response_model=CourseWithVideosResponse)
-async def get_course(course_id: UUID, current_user: dict = Depends(get_current_user)):
-    """강의 상세 조회"""
-    supabase = get_supabase_admin_client()
+    return conditional_response(request, entry)
 
-    # 강의 정보 조회
-    course = (
-        supabase.table("courses")
-        .select("*")
-        .eq("id", str(course_id))
-        .single()
-        .execute()
-    )
 
-    if not course.data:
+@router.get("/progress", response_model=List[CourseProgressResponse])
+async def get_course_progress(current_user: dict = Depends(get_current_user)):
+    """수강 중인 강의별 진도 요약 (전체/완료 비디오 수, 진도율)
+
+    SQL 집계 한 번으로 계산하며, 아직 기록되지 않은 진도 버퍼 값은 다음 flush 후 반영된다.
+    """
+    return await repository.course_progress(current_user.id)
+
+
+@router.get("/{course_id}", response_model=CourseWithVideosResponse)
+async def get_course(
+    course_id: UUID, request: Request, current_user: dict = Depends(get_current_user)
+):
+    """강의 상세 조회 (ETag / If-None-Match 지원)"""
+    cache_key = ("course", str(course_id))
+    entry = catalog_cache.get(cache_key)
+
+    # 캐시된 본문이 있으면 수강 권한만 확인
+    if entry is not None:
+        if not await enrollment_cache.is_enrolled(current_user.id, course_id):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Not enrolled in this course",
+            )
+        return conditional_response(request, entry)
+
+    # 강의 정보, 수강 권한, 비디오 목록을 한 번에 조회 (course_with_videos_for_user SQL 함수)
+    result = await repository.course_with_videos(current_user.id, course_id)
+
+    if not result or not result.get("course"):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Course not found",
         )
 
-    # 수강 권한 확인
-    enrollment = (
-        supabase.table("enrollments")
-        .select("*")
-        .eq("user_id", str(current_user.id))
-        .eq("course_id", str(course_id))
-        .single()
-        .execute()
-    )
+    enrolled = bool(result.get("enrolled"))
+    enrollment_cache.set(current_user.id, course_id, enrolled)
 
-    if not enrollment.data:
+    if not enrolled:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not enrolled in this course",
         )
 
-    # 비디오 목록 조회
-    videos = (
-        supabase.table("videos")
-        .select("id, title, duration_seconds, order_index, bunny_thumbnail")
-        .eq("course_id", str(course_id))
-        .order("order_index")
-        .execute()
+    body = _dump(
+        _course_detail_adapter,
+        {**result["course"], "videos": result.get("videos") or []},
     )
+    entry = catalog_cache.set(cache_key, body)
 
-    return {**course.data, "videos": videos.data or []}
+    return conditional_response(request, entry)
 
 
 @router.get("/{course_id}/videos", response_model=List[dict])
@@ -110,48 +137,45 @@ async def get_course_videos(
     """강의 내 비디오 목록 조회"""
     supabase = get_supabase_admin_client()
 
-    # 수강 권한 확인
-    enrollment = (
-        supabase.table("enrollments")
-        .select("*")
-        .eq("user_id", str(current_user.id))
-        .eq("course_id", str(course_id))
-        .single()
-        .execute()
+    # 수강 권한, 비디오 목록, 강의 내 시청 기록을 동시에 조회
+    enrolled, videos, history = await asyncio.gather(
+        enrollment_cache.is_enrolled(current_user.id, course_id),
+        run_query(
+            supabase.table("videos")
+            .select("*")
+            .eq("course_id", str(course_id))
+            .order("order_index")
+        ),
+        run_query(
+            supabase.table("watch_history")
+            .select("video_id, progress_seconds, is_completed, videos!inner(course_id)")
+            .eq("user_id", str(current_user.id))
+            .eq("videos.course_id", str(course_id))
+        ),
     )
 
-    if not enrollment.data:
+    if not enrolled:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not enrolled in this course",
         )
 
-    # 비디오 목록 조회
-    videos = (
-        supabase.table("videos")
-        .select("*")
-        .eq("course_id", str(course_id))
-        .order("order_index")
-        .execute()
-    )
-
-    # 시청 기록 조회
     video_ids = [v["id"] for v in videos.data] if videos.data else []
 
     watch_history = {}
-    if video_ids:
-        history = (
-            supabase.table("watch_history")
-            .select("video_id, progress_seconds, is_completed")
-            .eq("user_id", str(current_user.id))
-            .in_("video_id", video_ids)
-            .execute()
-        )
+    for h in history.data or []:
+        watch_history[h["video_id"]] = {
+            "progress_seconds": h["progress_seconds"],
+            "is_completed": h["is_completed"],
+        }
 
-        for h in history.data or []:
-            watch_history[h["video_id"]] = {
-                "progress_seconds": h["progress_seconds"],
-                "is_completed": h["is_completed"],
+    # 아직 DB에 기록되지 않은 버퍼 값 반영
+    for video_id in video_ids:
+        buffered = progress_buffer.get(current_user.id, video_id)
+        if buffered:
+            watch_history[video_id] = {
+                "progress_seconds": buffered["progress_seconds"],
+                "is_completed": buffered["is_completed"],
             }
 
     # 시청 기록 병합
@@ -165,3 +189,58 @@ async def get_course_videos(
         result.append(video_with_progress)
 
     return result
+
+
+@router.post("/{course_id}/signed-urls", response_model=BatchSignedUrlResponse)
+async def get_course_signed_urls(
+    course_id: UUID,
+    request: Optional[BatchSignedUrlRequest] = None,
+    current_user: dict = Depends(get_current_user),
+):
+    """강의 비디오 Signed URL 일괄 발급 (플레이리스트/다음 영상 미리 받기용)"""
+    supabase = get_supabase_admin_client()
+
+    # 수강 권한 확인 (캐시) - 강의 단위로 한 번만 확인
+    if not await enrollment_cache.is_enrolled(current_user.id, course_id):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not enrolled in this course",
+        )
+
+    # 비디오 목록 조회 (요청한 비디오만 또는 강의 전체)
+    query = (
+        supabase.table("videos")
+        .select("id, bunny_video_id")
+        .eq("course_id", str(course_id))
+        .order("order_index")
+    )
+    requested_ids = {str(v) for v in request.video_ids} if request and request.video_ids else None
+    if requested_ids:
+        query = query.in_("id", list(requested_ids))
+
+    videos = await run_query(query)
+    videos = videos.data or []
+
+    if requested_ids and len(videos) != len(requested_ids):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Video not found in this course",
+        )
+
+    # 모든 URL에 같은 만료 시각 사용
+    expiration_time = bunny_service.expiration_time(expires_in_hours=2)
+
+    return {
+        "course_id": course_id,
+        "expires_in": expiration_time - int(time.time()),
+        "videos": [
+            {
+                "video_id": video["id"],
+                **bunny_service.generate_playback_urls(
+                    video_id=video["bunny_video_id"],
+                    expiration_time=expiration_time,
+                ),
+            }
+            for video in videos
+        ],
+    }
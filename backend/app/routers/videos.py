@@ -1,100 +1,123 @@
+import logging
+import time
+from datetime import datetime
+from typing import List
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 
 from app.dependencies import get_current_user
-from app.services.supabase import get_supabase_admin_client
 from app.services.bunny import bunny_service
-from app.schemas.video import VideoResponse, SignedUrlResponse, ProgressUpdate
+from app.services.catalog import catalog_cache
+from app.services.enrollments import enrollment_cache
+from app.services.progress_buffer import progress_buffer
+from app.services.repository import repository
+from app.schemas.video import (
+    ContinueWatchingItem,
+    VideoResponse,
+    SignedUrlResponse,
+    ProgressUpdate,
+)
 from app.schemas.common import StatusResponse
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
 
-@router.get("/{video_id}", response_model=VideoResponse)
-async def get_video(video_id: UUID, current_user: dict = Depends(get_current_user)):
-    """비디오 상세 정보 조회"""
-    supabase = get_supabase_admin_client()
-
-    # 비디오 정보 조회
-    result = (
-        supabase.table("videos")
-        .select("*")
-        .eq("id", str(video_id))
-        .single()
-        .execute()
+def _forbidden() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_403_FORBIDDEN,
+        detail="이 강의에 대한 수강 권한이 없습니다",
     )
 
-    if not result.data:
+
+async def authorize_video(video_id: UUID, user_id: str) -> dict:
+    """비디오 조회 + 수강 권한 확인
+
+    비디오 행과 수강 등록 여부가 모두 캐시에 있으면 DB를 거치지 않고 (하트비트 등),
+    없으면 authorize_video SQL 함수로 한 번에 조회해 두 캐시를 채운다.
+    """
+    video = catalog_cache.get_video(video_id)
+    if video is not None:
+        if not await enrollment_cache.is_enrolled(user_id, video["course_id"]):
+            raise _forbidden()
+        return video
+
+    result = await repository.authorize_video(user_id, video_id)
+
+    if not result or not result.get("video"):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Video not found",
         )
 
-    video = result.data
+    video = result["video"]
+    enrolled = bool(result.get("enrolled"))
+    catalog_cache.set_video(video)
+    enrollment_cache.set(user_id, video["course_id"], enrolled)
 
-    # 수강 권한 확인
-    enrollment = (
-        supabase.table("enrollments")
-        .select("*")
-        .eq("user_id", str(current_user.id))
-        .eq("course_id", video["course_id"])
-        .execute()
-    )
-
-    if not enrollment.data or len(enrollment.data) == 0:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="이 강의에 대한 수강 권한이 없습니다",
-        )
+    if not enrolled:
+        raise _forbidden()
 
     return video
 
 
-@router.post("/{video_id}/signed-url", response_model=SignedUrlResponse)
-async def get_signed_url(video_id: UUID, current_user: dict = Depends(get_current_user)):
-    """Signed URL 발급"""
-    supabase = get_supabase_admin_client()
-
-    # 비디오 정보 조회
-    result = (
-        supabase.table("videos")
-        .select("bunny_video_id, course_id")
-        .eq("id", str(video_id))
-        .single()
-        .execute()
-    )
+def _as_datetime(value) -> datetime:
+    return value if isinstance(value, datetime) else datetime.fromisoformat(value)
 
-    if not result.data:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Video not found",
-        )
 
-    video = result.data
+@router.get("/continue-watching", response_model=List[ContinueWatchingItem])
+async def get_continue_watching(
+    limit: int = Query(10, ge=1, le=50),
+    current_user: dict = Depends(get_current_user),
+):
+    """이어보기: 수강 중인 모든 강의에서 최근 시청한 미완료 비디오 (최근 순)"""
+    # 버퍼에만 있는 (방금 처음 본) 비디오도 포함되도록 이 사용자의 진도를 먼저 기록
+    try:
+        await progress_buffer.flush(current_user.id)
+    except Exception:
+        logger.exception("Failed to flush watch progress before continue-watching")
+
+    items = await repository.continue_watching(current_user.id, limit)
+
+    # 조회 중에 들어온 버퍼 값 반영
+    results = []
+    for item in items:
+        buffered = progress_buffer.get(current_user.id, item["video_id"])
+        if buffered:
+            if buffered["is_completed"]:
+                continue
+            item = {
+                **item,
+                "progress_seconds": buffered["progress_seconds"],
+                "last_watched_at": buffered["last_watched_at"],
+            }
+        results.append(item)
+
+    results.sort(key=lambda item: _as_datetime(item["last_watched_at"]), reverse=True)
+    return results
 
-    # 수강 권한 확인
-    enrollment = (
-        supabase.table("enrollments")
-        .select("*")
-        .eq("user_id", str(current_user.id))
-        .eq("course_id", video["course_id"])
-        .execute()
-    )
 
-    if not enrollment.data or len(enrollment.data) == 0:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="이 강의에 대한 수강 권한이 없습니다",
-        )
+@router.get("/{video_id}", response_model=VideoResponse)
+async def get_video(video_id: UUID, current_user: dict = Depends(get_current_user)):
+    """비디오 상세 정보 조회"""
+    return await authorize_video(video_id, current_user.id)
+
 
-    # DRM iframe URL 생성
-    iframe_url = bunny_service.generate_iframe_url(
+@router.post("/{video_id}/signed-url", response_model=SignedUrlResponse)
+async def get_signed_url(video_id: UUID, current_user: dict = Depends(get_current_user)):
+    """Signed URL 발급"""
+    video = await authorize_video(video_id, current_user.id)
+
+    # DRM iframe/HLS URL 생성 (버킷 단위 만료 시각이면 같은 URL 재사용)
+    expiration_time = bunny_service.expiration_time(expires_in_hours=2)
+    urls = bunny_service.generate_playback_urls(
         video_id=video["bunny_video_id"],
-        expires_in_hours=2,
+        expiration_time=expiration_time,
     )
 
-    return {"iframe_url": iframe_url, "expires_in": 7200}
+    return {**urls, "expires_in": expiration_time - int(time.time())}
 
 
 @router.post("/{video_id}/progress", response_model=StatusResponse)
@@ -104,70 +127,57 @@ async def update_progress(
     current_user: dict = Depends(get_current_user),
 ):
     """시청 진도 업데이트"""
-    supabase = get_supabase_admin_client()
-
-    # 비디오 존재 확인
-    video = (
-        supabase.table("videos")
-        .select("id, course_id")
-        .eq("id", str(video_id))
-        .single()
-        .execute()
+    # write-behind 버퍼에 기록 (주기적으로 bulk upsert)
+    if progress_buffer.enabled:
+        await authorize_video(video_id, current_user.id)
+        await progress_buffer.record(
+            current_user.id,
+            video_id,
+            progress.progress_seconds,
+            progress.is_completed,
+        )
+        return {"status": "success"}
+
+    # 비디오 확인, 수강 권한 확인, 시청 기록 upsert를 한 번에 처리
+    result = await repository.record_progress(
+        current_user.id,
+        video_id,
+        progress.progress_seconds,
+        progress.is_completed,
     )
 
-    if not video.data:
+    if result == "not_found":
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Video not found",
         )
 
-    # 수강 권한 확인
-    enrollment = (
-        supabase.table("enrollments")
-        .select("*")
-        .eq("user_id", str(current_user.id))
-        .eq("course_id", video.data["course_id"])
-        .execute()
-    )
-
-    if not enrollment.data or len(enrollment.data) == 0:
+    if result == "forbidden":
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="이 강의에 대한 수강 권한이 없습니다",
         )
 
-    # upsert로 시청 기록 업데이트
-    supabase.table("watch_history").upsert(
-        {
-            "user_id": str(current_user.id),
-            "video_id": str(video_id),
-            "progress_seconds": progress.progress_seconds,
-            "is_completed": progress.is_completed,
-        },
-        on_conflict="user_id,video_id",
-    ).execute()
-
     return {"status": "success"}
 
 
 @router.get("/{video_id}/progress")
 async def get_progress(video_id: UUID, current_user: dict = Depends(get_current_user)):
     """시청 진도 조회"""
-    supabase = get_supabase_admin_client()
-
-    result = (
-        supabase.table("watch_history")
-        .select("*")
-        .eq("user_id", str(current_user.id))
-        .eq("video_id", str(video_id))
-        .maybe_single()
-        .execute()
-    )
+    # 아직 DB에 기록되지 않은 버퍼 값 우선
+    buffered = progress_buffer.get(current_user.id, video_id)
+    if buffered:
+        return {
+            "progress_seconds": buffered["progress_seconds"],
+            "is_completed": buffered["is_completed"],
+        }
+
+    history = await repository.get_progress(current_user.id, video_id)
 
-    if not result.data:
+    if not history:
         return {"progress_seconds": 0, "is_completed": False}
 
     return {
-        "progress_seconds": result.data["progress_seconds"],
-        "is_completed": result.data["is_completed"],
+        "progress_seconds": history["progress_seconds"],
+        "is_completed": history["is_completed"],
     }
@@ -0,0 +1,114 @@
+import hashlib
+import hmac
+import logging
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, Request, status
+from pydantic import BaseModel, Field, ValidationError
+
+from app.config import settings
+from app.services.bunny import bunny_service
+from app.services.catalog import catalog_cache
+from app.services.database import run_query
+from app.services.supabase import get_supabase_admin_client
+from app.services.video_status import WEBHOOK_STATUS, status_payload, video_status_broker
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+
+class BunnyWebhookPayload(BaseModel):
+    video_library_id: int = Field(alias="VideoLibraryId")
+    video_guid: str = Field(alias="VideoGuid")
+    status: int = Field(alias="Status")
+
+
+def _verify(body: bytes, signature: Optional[str], token: Optional[str]) -> bool:
+    """본문 HMAC-SHA256 서명(hex) 또는 고정 토큰 헤더 확인 (URL에 비밀 값을 넣지 않음)"""
+    secret = settings.BUNNY_WEBHOOK_SECRET.encode()
+    if signature:
+        expected = hmac.new(secret, body, hashlib.sha256).hexdigest()
+        return hmac.compare_digest(signature.removeprefix("sha256=").lower().encode(), expected.encode())
+    if token:
+        return hmac.compare_digest(token.encode(), secret)
+    return False
+
+
+@router.post("/bunny")
+async def bunny_webhook(request: Request):
+    """Bunny Stream 인코딩 상태 웹훅 수신
+
+    X-BunnyStream-Signature(본문 HMAC-SHA256) 또는 X-Webhook-Token 헤더로 인증한다.
+    상태를 videos 행(encoding_status, 완료 시 길이/썸네일)에 기록하고 SSE 구독자에게 전달한다.
+    """
+    if not settings.BUNNY_WEBHOOK_SECRET:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Webhook is not configured",
+        )
+
+    body = await request.body()
+    if not _verify(
+        body,
+        request.headers.get("x-bunnystream-signature"),
+        request.headers.get("x-webhook-token"),
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Invalid webhook signature",
+        )
+
+    try:
+        payload = BunnyWebhookPayload.model_validate_json(body)
+    except ValidationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=e.errors(include_url=False, include_context=False),
+        )
+
+    if str(payload.video_library_id) != str(bunny_service.library_id):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Unknown video library",
+        )
+
+    encoding_status = WEBHOOK_STATUS.get(payload.status)
+    if encoding_status is None:
+        # 자막/제목 생성 등 처리 상태와 무관한 이벤트
+        return {"ok": True}
+
+    update = {"encoding_status": encoding_status}
+    duration = None
+    thumbnail = None
+
+    if encoding_status == "finished":
+        # 웹훅에는 길이 정보가 없으므로 완료 시 한 번만 조회
+        thumbnail = bunny_service.get_thumbnail_url(payload.video_guid)
+        update["bunny_thumbnail"] = thumbnail
+        try:
+            details = await bunny_service.get_video_details(payload.video_guid)
+            duration = int(details.get("length") or 0) or None
+        except Exception:
+            logger.exception("Failed to fetch Bunny video details for %s", payload.video_guid)
+        if duration:
+            update["duration_seconds"] = duration
+
+    supabase = get_supabase_admin_client()
+    result = await run_query(
+        supabase.table("videos")
+        .update(update)
+        .eq("bunny_video_id", payload.video_guid)
+    )
+
+    # 길이/썸네일이 바뀌면 카탈로그 캐시 무효화, 상태만 바뀌면 해당 비디오 행만
+    if result.data and encoding_status == "finished":
+        catalog_cache.bump()
+    for video in result.data or []:
+        catalog_cache.invalidate_video(video["id"])
+
+    video_status_broker.publish(
+        status_payload(payload.video_guid, encoding_status, duration, thumbnail)
+    )
+
+    return {"ok": True}
@@ -1,3 +1,5 @@
+from typing import List, Optional
+
 from pydantic import BaseModel
 
 
@@ -5,5 +7,19 @@ class MessageResponse(BaseModel):
     message: str
 
 
+class DeleteResponse(MessageResponse):
+    cleanup_job_id: Optional[str] = None  # Bunny 비디오 백그라운드 삭제 작업
+
+
+class CleanupJobResponse(BaseModel):
+    id: str
+    status: str  # running | completed | failed | cancelled
+    total: int
+    deleted: int
+    failed: List[str]
+    created_at: float
+    finished_at: Optional[float] = None
+
+
 class StatusResponse(BaseModel):
     status: str
@@ -35,6 +35,15 @@ class CourseWithVideosResponse(CourseResponse):
     videos: List["VideoSummary"] = []
 
 
+class CourseProgressResponse(BaseModel):
+    course_id: UUID
+    title: str
+    total_videos: int
+    completed_videos: int
+    progress_percent: int
+    last_watched_at: Optional[datetime] = None
+
+
 class VideoSummary(BaseModel):
     id: UUID
     title: str
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Dict, List, Optional
 from uuid import UUID
 from datetime import datetime
 
@@ -20,3 +20,18 @@ class EnrollmentResponse(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+class BulkEnrollmentResult(BaseModel):
+    row: int
+    email: Optional[str] = None
+    user_id: Optional[UUID] = None
+    course_id: Optional[UUID] = None
+    status: str  # enrolled | already_enrolled | duplicate | user_not_found | course_not_found | invalid
+    detail: Optional[str] = None
+
+
+class BulkEnrollmentResponse(BaseModel):
+    total: int
+    counts: Dict[str, int]
+    results: List[BulkEnrollmentResult]
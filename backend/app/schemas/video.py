@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID
 from datetime import datetime
 
@@ -33,17 +33,59 @@ class VideoResponse(VideoBase):
     course_id: UUID
     bunny_thumbnail: Optional[str] = None
     require_signed_url: bool
+    encoding_status: Optional[str] = None
     created_at: datetime
 
     class Config:
         from_attributes = True
 
 
+class ContinueWatchingItem(BaseModel):
+    video_id: UUID
+    course_id: UUID
+    course_title: str
+    title: str
+    duration_seconds: Optional[int] = None
+    bunny_thumbnail: Optional[str] = None
+    progress_seconds: int
+    last_watched_at: datetime
+
+
 class SignedUrlResponse(BaseModel):
     iframe_url: str
+    hls_url: Optional[str] = None
     expires_in: int  # seconds
 
 
+class BatchSignedUrlRequest(BaseModel):
+    video_ids: Optional[List[UUID]] = None  # 비어 있으면 강의 전체 비디오
+
+
+class VideoSignedUrl(BaseModel):
+    video_id: UUID
+    iframe_url: str
+    hls_url: str
+
+
+class BatchSignedUrlResponse(BaseModel):
+    course_id: UUID
+    expires_in: int  # seconds
+    videos: List[VideoSignedUrl]
+
+
+class BulkImportRequest(BaseModel):
+    course_id: UUID
+    bunny_video_ids: Optional[List[str]] = None  # 지정한 Bunny 비디오 (이 순서로 order_index 부여)
+    collection_id: Optional[str] = None  # 또는 Bunny 컬렉션 전체
+
+
+class BulkImportResponse(BaseModel):
+    course_id: UUID
+    imported: List[VideoResponse]
+    skipped: List[str]  # 이미 강의에 등록된 비디오
+    failed: List[str]  # Bunny에서 찾을 수 없는 비디오
+
+
 class ProgressUpdate(BaseModel):
     progress_seconds: int
     is_completed: bool = False
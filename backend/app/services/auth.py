@@ -0,0 +1,168 @@
+import hashlib
+import time
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+import jwt
+from fastapi.concurrency import run_in_threadpool
+from supabase import AuthApiError
+
+from app.config import settings
+from app.services import request_stats
+from app.services.cache import TTLCache
+from app.services.database import run_sync
+from app.services.supabase import get_supabase_client
+
+
+class InvalidTokenError(Exception):
+    """유효하지 않은 액세스 토큰"""
+
+
+@dataclass(frozen=True)
+class AuthenticatedUser:
+    """로컬 JWT 검증으로 얻은 사용자 정보 (Supabase User와 동일한 주요 속성 제공)"""
+
+    id: str
+    email: Optional[str] = None
+    role: Optional[str] = None
+    app_metadata: dict = field(default_factory=dict)
+    user_metadata: dict = field(default_factory=dict)
+    claims: dict = field(default_factory=dict)
+
+    @classmethod
+    def from_claims(cls, claims: dict) -> "AuthenticatedUser":
+        return cls(
+            id=claims["sub"],
+            email=claims.get("email"),
+            role=claims.get("role"),
+            app_metadata=claims.get("app_metadata") or {},
+            user_metadata=claims.get("user_metadata") or {},
+            claims=claims,
+        )
+
+
+_REJECTED = object()
+
+
+class TokenVerifier:
+    """Supabase 액세스 토큰 검증기
+
+    - remote: Supabase Auth 서버의 get_user로 검증 (기존 방식)
+    - local: PyJWT로 서명/만료를 로컬 검증 (HS256 프로젝트 시크릿 또는 JWKS 공개키)
+
+    두 모드 모두 검증 결과(성공/실패)를 제한된 크기의 캐시에 보관하여
+    같은 토큰이 반복해서 들어와도 인증 서버나 서명 검증을 다시 거치지 않는다.
+    """
+
+    ASYMMETRIC_ALGORITHMS = ["RS256", "ES256", "EdDSA"]
+
+    def __init__(self):
+        self.mode = settings.AUTH_VERIFY_MODE
+        self.jwt_secret = settings.SUPABASE_JWT_SECRET
+        self.audience = settings.AUTH_JWT_AUDIENCE or None
+        self.jwks_url = (
+            settings.AUTH_JWKS_URL
+            or f"{settings.SUPABASE_URL.rstrip('/')}/auth/v1/.well-known/jwks.json"
+        )
+        self._cache = TTLCache(
+            maxsize=settings.AUTH_TOKEN_CACHE_SIZE,
+            ttl=settings.AUTH_TOKEN_CACHE_SECONDS,
+        )
+        self._jwks_client: Optional[jwt.PyJWKClient] = None
+
+    @property
+    def jwks_client(self) -> jwt.PyJWKClient:
+        """JWKS 클라이언트 (키 셋 캐시, 알 수 없는 kid 수신 시 자동 갱신)"""
+        if self._jwks_client is None:
+            self._jwks_client = jwt.PyJWKClient(
+                self.jwks_url,
+                cache_jwk_set=True,
+                lifespan=settings.AUTH_JWKS_CACHE_SECONDS,
+                cache_keys=True,
+                headers={"apikey": settings.SUPABASE_ANON_KEY},
+            )
+        return self._jwks_client
+
+    async def verify(self, token: str) -> Any:
+        """토큰 검증 후 사용자 객체 반환 (실패 시 InvalidTokenError)"""
+        cache_key = hashlib.sha256(token.encode()).digest()
+        cached = self._cache.get(cache_key)
+        if cached is _REJECTED:
+            raise InvalidTokenError("Token rejected")
+        if cached is not None:
+            return cached
+
+        try:
+            if self.mode == "local":
+                user, expires_at = await run_in_threadpool(self._verify_local, token)
+            else:
+                user, expires_at = await self._verify_remote(token)
+        except InvalidTokenError:
+            self._cache.set(cache_key, _REJECTED, ttl=settings.AUTH_NEGATIVE_CACHE_SECONDS)
+            raise
+
+        # 토큰 만료 시각을 넘겨서 캐시하지 않음
+        ttl = settings.AUTH_TOKEN_CACHE_SECONDS
+        if expires_at is not None:
+            ttl = min(ttl, expires_at - time.time())
+        self._cache.set(cache_key, user, ttl=ttl)
+        return user
+
+    def _verify_local(self, token: str) -> tuple[AuthenticatedUser, Optional[float]]:
+        """PyJWT 로컬 검증"""
+        try:
+            header = jwt.get_unverified_header(token)
+            algorithm = header.get("alg")
+
+            if algorithm == "HS256":
+                if not self.jwt_secret:
+                    raise InvalidTokenError("HS256 token but SUPABASE_JWT_SECRET is not set")
+                key = self.jwt_secret
+                algorithms = ["HS256"]
+            elif algorithm in self.ASYMMETRIC_ALGORITHMS:
+                key = self.jwks_client.get_signing_key_from_jwt(token).key
+                algorithms = [algorithm]
+            else:
+                raise InvalidTokenError(f"Unsupported algorithm: {algorithm}")
+
+            claims = jwt.decode(
+                token,
+                key,
+                algorithms=algorithms,
+                audience=self.audience,
+                options={"require": ["exp", "sub"], "verify_aud": self.audience is not None},
+            )
+        except jwt.PyJWKClientConnectionError:
+            # JWKS 조회 실패는 토큰 문제가 아니므로 부정 캐시하지 않음
+            raise
+        except jwt.PyJWTError as e:
+            raise InvalidTokenError(str(e)) from e
+
+        return AuthenticatedUser.from_claims(claims), float(claims["exp"])
+
+    async def _verify_remote(self, token: str) -> tuple[Any, Optional[float]]:
+        """Supabase Auth 서버 검증"""
+        supabase = get_supabase_client()
+
+        start = time.perf_counter()
+        try:
+            user_response = await run_sync(supabase.auth.get_user, token)
+        except AuthApiError as e:
+            raise InvalidTokenError(str(e)) from e
+        finally:
+            request_stats.record("auth", time.perf_counter() - start)
+
+        if not user_response or not user_response.user:
+            raise InvalidTokenError("User not found for token")
+
+        # 캐시 만료 시각 계산용 (서명은 인증 서버가 이미 검증)
+        try:
+            claims = jwt.decode(token, options={"verify_signature": False})
+            expires_at = float(claims["exp"]) if "exp" in claims else None
+        except jwt.PyJWTError:
+            expires_at = None
+
+        return user_response.user, expires_at
+
+
+token_verifier = TokenVerifier()
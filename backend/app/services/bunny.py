@@ -1,11 +1,17 @@
+import asyncio
 import hashlib
 import base64
+import math
 import time
-from typing import List
+from collections import deque
+from typing import AsyncIterator, List, Optional
 
 import httpx
 
 from app.config import settings
+from app.services import request_stats
+from app.services.cache import TTLCache
+from app.services.metrics import BUNNY_REQUEST_DURATION, BUNNY_REQUESTS_IN_PROGRESS
 
 
 class BunnyStreamService:
@@ -15,89 +21,260 @@ class BunnyStreamService:
         self.cdn_hostname = settings.BUNNY_VIDEO_LIBRARY_HOSTNAME
         self.token_auth_key = settings.BUNNY_STREAM_TOKEN_AUTH_KEY
         self.base_url = f"https://video.bunnycdn.com/library/{self.library_id}"
+        # 벤치마크/테스트에서 가짜 Bunny API로 교체할 때 사용 (None이면 실제 네트워크)
+        self.transport: Optional[httpx.AsyncBaseTransport] = None
+        self._client: Optional[httpx.AsyncClient] = None
+        self._url_cache = TTLCache(
+            maxsize=settings.BUNNY_URL_CACHE_SIZE,
+            ttl=settings.BUNNY_URL_EXPIRY_BUCKET_SECONDS,
+        )
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Bunny API 공유 클라이언트 (HTTP/2, keep-alive 커넥션 재사용)"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                transport=self.transport,
+                base_url=self.base_url,
+                headers={"AccessKey": self.api_key},
+                http2=settings.BUNNY_HTTP2,
+                limits=httpx.Limits(
+                    max_connections=settings.BUNNY_MAX_CONNECTIONS,
+                    max_keepalive_connections=settings.BUNNY_MAX_KEEPALIVE,
+                ),
+                timeout=httpx.Timeout(
+                    settings.BUNNY_TIMEOUT_SECONDS,
+                    connect=settings.BUNNY_CONNECT_TIMEOUT_SECONDS,
+                ),
+            )
+        return self._client
+
+    async def _request(self, operation: str, method: str, url: str, **kwargs) -> httpx.Response:
+        """Bunny API 호출 (operation 단위 호출 시간을 bunny_request_duration_seconds 에 기록)"""
+        status_label = "error"
+        start = time.perf_counter()
+        BUNNY_REQUESTS_IN_PROGRESS.inc()
+        try:
+            response = await self.client.request(method, url, **kwargs)
+            status_label = str(response.status_code)
+            return response
+        finally:
+            elapsed = time.perf_counter() - start
+            BUNNY_REQUESTS_IN_PROGRESS.dec()
+            BUNNY_REQUEST_DURATION.labels(operation, status_label).observe(elapsed)
+            request_stats.record("bunny", elapsed)
+
+    async def startup(self) -> None:
+        """앱 시작 시 클라이언트 생성"""
+        _ = self.client
+
+    async def close(self) -> None:
+        """앱 종료 시 커넥션 정리"""
+        if self._client is not None:
+            await self._client.aclose()
+        self._client = None
+
+    def expiration_time(self, expires_in_hours: int = 2) -> int:
+        """서명 URL 만료 시각 (unix timestamp)
+
+        BUNNY_URL_EXPIRY_BUCKET_SECONDS > 0 이면 만료 시각을 버킷 경계로 내림하여 같은 버킷 안의
+        요청이 동일한 URL을 받도록 한다 (CDN/브라우저 캐시 재사용). 남은 유효 시간이
+        BUNNY_URL_MIN_VALIDITY_SECONDS 보다 짧아지면 다음 버킷 경계를 사용한다.
+        """
+        now = int(time.time())
+        expiration = now + (expires_in_hours * 3600)
+
+        bucket = settings.BUNNY_URL_EXPIRY_BUCKET_SECONDS
+        if bucket > 0:
+            expiration -= expiration % bucket
+            while expiration - now < settings.BUNNY_URL_MIN_VALIDITY_SECONDS:
+                expiration += bucket
+
+        return expiration
+
+    def _memoized(self, key: tuple, expiration_time: int, build) -> str:
+        """(종류, video_id, 만료 시각) 단위 서명 URL 메모이제이션"""
+        if settings.BUNNY_URL_EXPIRY_BUCKET_SECONDS <= 0:
+            return build()
+
+        url = self._url_cache.get(key)
+        if url is None:
+            url = build()
+            self._url_cache.set(key, url, ttl=expiration_time - time.time())
+        return url
 
     def generate_signed_url(
         self,
         video_id: str,
         expires_in_hours: int = 2,
+        expiration_time: Optional[int] = None,
     ) -> str:
         """Bunny CDN 토큰 인증 HLS URL 생성"""
         if not self.token_auth_key:
             return f"https://{self.cdn_hostname}/{video_id}/playlist.m3u8"
 
-        expiration_time = int(time.time()) + (expires_in_hours * 3600)
+        if expiration_time is None:
+            expiration_time = self.expiration_time(expires_in_hours)
         url_path = f"/{video_id}/playlist.m3u8"
-        hashable_base = self.token_auth_key + url_path + str(expiration_time)
 
-        token = base64.b64encode(
-            hashlib.sha256(hashable_base.encode()).digest()
-        ).decode().replace("\n", "").replace("+", "-").replace("/", "_").replace("=", "")
+        def build() -> str:
+            hashable_base = self.token_auth_key + url_path + str(expiration_time)
+
+            token = base64.b64encode(
+                hashlib.sha256(hashable_base.encode()).digest()
+            ).decode().replace("\n", "").replace("+", "-").replace("/", "_").replace("=", "")
+
+            return f"https://{self.cdn_hostname}{url_path}?token={token}&expires={expiration_time}"
 
-        return f"https://{self.cdn_hostname}{url_path}?token={token}&expires={expiration_time}"
+        return self._memoized(("hls", video_id, expiration_time), expiration_time, build)
 
     def generate_iframe_url(
         self,
         video_id: str,
         expires_in_hours: int = 2,
+        expiration_time: Optional[int] = None,
     ) -> str:
         """Bunny Stream iframe 임베드 URL 생성"""
         if not self.token_auth_key:
             return f"https://iframe.mediadelivery.net/embed/{self.library_id}/{video_id}"
 
-        expiration_time = int(time.time()) + (expires_in_hours * 3600)
-        hashable_base = self.token_auth_key + video_id + str(expiration_time)
-        token = hashlib.sha256(hashable_base.encode()).hexdigest()
+        if expiration_time is None:
+            expiration_time = self.expiration_time(expires_in_hours)
 
-        return f"https://iframe.mediadelivery.net/embed/{self.library_id}/{video_id}?token={token}&expires={expiration_time}"
+        def build() -> str:
+            hashable_base = self.token_auth_key + video_id + str(expiration_time)
+            token = hashlib.sha256(hashable_base.encode()).hexdigest()
+
+            return f"https://iframe.mediadelivery.net/embed/{self.library_id}/{video_id}?token={token}&expires={expiration_time}"
+
+        return self._memoized(("iframe", video_id, expiration_time), expiration_time, build)
+
+    def generate_playback_urls(
+        self,
+        video_id: str,
+        expiration_time: int,
+    ) -> dict:
+        """같은 만료 시각의 iframe 임베드 URL과 HLS URL 생성"""
+        return {
+            "iframe_url": self.generate_iframe_url(video_id, expiration_time=expiration_time),
+            "hls_url": self.generate_signed_url(video_id, expiration_time=expiration_time),
+        }
 
     async def get_video_details(self, video_id: str) -> dict:
         """Bunny Stream 비디오 상세 정보 조회"""
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/videos/{video_id}",
-                headers={"AccessKey": self.api_key},
-            )
-            response.raise_for_status()
-            return response.json()
-
-    async def list_videos(self) -> List[dict]:
-        """Bunny Stream 비디오 목록 조회"""
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/videos",
-                headers={"AccessKey": self.api_key},
-                params={"itemsPerPage": 100},
-            )
-            response.raise_for_status()
-            data = response.json()
-            return data.get("items", [])
+        response = await self._request("get_video", "GET", f"/videos/{video_id}")
+        response.raise_for_status()
+        return response.json()
+
+    async def get_many_video_details(self, video_ids: List[str]) -> List[Optional[dict]]:
+        """여러 비디오 상세 정보 동시 조회 (BUNNY_DETAILS_CONCURRENCY 개까지, 실패한 항목은 None)"""
+        semaphore = asyncio.Semaphore(settings.BUNNY_DETAILS_CONCURRENCY)
+
+        async def fetch(video_id: str) -> Optional[dict]:
+            async with semaphore:
+                try:
+                    return await self.get_video_details(video_id)
+                except httpx.HTTPError:
+                    return None
+
+        return await asyncio.gather(*(fetch(video_id) for video_id in video_ids))
+
+    async def _list_page(
+        self,
+        page: int,
+        items_per_page: int,
+        search: Optional[str] = None,
+        collection: Optional[str] = None,
+    ) -> dict:
+        """Bunny Stream 비디오 목록 한 페이지 조회"""
+        params = {"page": page, "itemsPerPage": items_per_page, "orderBy": "date"}
+        if search:
+            params["search"] = search
+        if collection:
+            params["collection"] = collection
+
+        response = await self._request("list_videos", "GET", "/videos", params=params)
+        response.raise_for_status()
+        return response.json()
+
+    async def iter_videos(
+        self,
+        search: Optional[str] = None,
+        collection: Optional[str] = None,
+    ) -> AsyncIterator[dict]:
+        """Bunny Stream 라이브러리 전체 비디오 순회
+
+        첫 페이지의 totalItems로 페이지 수를 구한 뒤, 다음 페이지들을
+        BUNNY_LIST_CONCURRENCY 개까지 동시에 미리 가져오면서 페이지 순서대로 반환한다.
+        """
+        items_per_page = settings.BUNNY_LIST_PAGE_SIZE
+        first = await self._list_page(1, items_per_page, search, collection)
+        for item in first.get("items") or []:
+            yield item
+
+        total_pages = math.ceil((first.get("totalItems") or 0) / items_per_page)
+        next_page = 2
+        pending: "deque[asyncio.Task]" = deque()
+
+        try:
+            while next_page <= total_pages or pending:
+                while next_page <= total_pages and len(pending) < settings.BUNNY_LIST_CONCURRENCY:
+                    pending.append(asyncio.create_task(
+                        self._list_page(next_page, items_per_page, search, collection)
+                    ))
+                    next_page += 1
+
+                items = (await pending.popleft()).get("items") or []
+                if not items:
+                    # 순회 중 라이브러리가 줄어든 경우
+                    break
+                for item in items:
+                    yield item
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def list_videos(
+        self,
+        search: Optional[str] = None,
+        collection: Optional[str] = None,
+    ) -> List[dict]:
+        """Bunny Stream 비디오 전체 목록 조회"""
+        return [video async for video in self.iter_videos(search, collection)]
 
     async def create_video(self, title: str) -> dict:
         """Bunny Stream 비디오 객체 생성 (업로드 1단계)"""
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/videos",
-                headers={
-                    "AccessKey": self.api_key,
-                    "Content-Type": "application/json",
-                },
-                json={"title": title},
-            )
-            response.raise_for_status()
-            return response.json()
+        response = await self._request("create_video", "POST", "/videos", json={"title": title})
+        response.raise_for_status()
+        return response.json()
 
     def get_upload_url(self, video_id: str) -> str:
         """비디오 업로드 URL 반환 (업로드 2단계에서 사용)"""
         return f"{self.base_url}/videos/{video_id}"
 
+    def generate_tus_authorization(self, video_id: str, expires_in_seconds: Optional[int] = None) -> dict:
+        """TUS 업로드용 비디오 단위 서명 헤더 생성
+
+        서명 = SHA256(library_id + api_key + expiration_time + video_id)
+        브라우저는 API 키 없이 이 헤더로 Bunny TUS 엔드포인트에 직접 업로드한다.
+        """
+        expires_in_seconds = expires_in_seconds or settings.BUNNY_TUS_EXPIRY_SECONDS
+        expiration_time = int(time.time()) + expires_in_seconds
+
+        signature_string = f"{self.library_id}{self.api_key}{expiration_time}{video_id}"
+        signature = hashlib.sha256(signature_string.encode()).hexdigest()
+
+        return {
+            "AuthorizationSignature": signature,
+            "AuthorizationExpire": str(expiration_time),
+            "VideoId": video_id,
+            "LibraryId": str(self.library_id),
+        }
+
     async def delete_video(self, video_id: str) -> bool:
-        """Bunny Stream 비디오 삭제"""
-        async with httpx.AsyncClient() as client:
-            response = await client.delete(
-                f"{self.base_url}/videos/{video_id}",
-                headers={"AccessKey": self.api_key},
-            )
-            return response.status_code == 200
+        """Bunny Stream 비디오 삭제 (이미 없는 비디오도 삭제된 것으로 처리)"""
+        response = await self._request("delete_video", "DELETE", f"/videos/{video_id}")
+        return response.status_code in (200, 404)
 
     def get_thumbnail_url(self, video_id: str) -> str:
         """비디오 썸네일 URL 반환"""
@@ -0,0 +1,78 @@
+import hashlib
+from typing import Hashable, Optional, Tuple
+
+from fastapi import Request, Response, status
+
+from app.config import settings
+from app.services.cache import TTLCache
+
+CatalogEntry = Tuple[bytes, str]
+
+
+class CatalogCache:
+    """강의 카탈로그 직렬화 응답 캐시 (ETag 포함)
+
+    관리자 API에서 강의/비디오가 바뀌면 bump()로 카탈로그 버전을 올리고 캐시를 비운다.
+    비디오 행(video_id -> 행)도 함께 보관해 시청 경로에서 수강 권한 캐시와 함께 쓴다.
+    ETag는 응답 본문 해시로 만들어 워커가 달라도 같은 내용이면 같은 값을 갖고,
+    다른 워커의 캐시는 CATALOG_CACHE_SECONDS 후 만료되어 새 버전을 반영한다.
+    """
+
+    def __init__(self):
+        self.version = 0
+        self._cache = TTLCache(
+            maxsize=settings.CATALOG_CACHE_SIZE,
+            ttl=settings.CATALOG_CACHE_SECONDS,
+        )
+        self._videos = TTLCache(
+            maxsize=settings.VIDEO_CACHE_SIZE,
+            ttl=settings.CATALOG_CACHE_SECONDS,
+        )
+
+    def bump(self) -> None:
+        """카탈로그 버전 증가 (캐시 무효화)"""
+        self.version += 1
+        self._cache.clear()
+        self._videos.clear()
+
+    def get_video(self, video_id: Hashable) -> Optional[dict]:
+        return self._videos.get(str(video_id))
+
+    def set_video(self, video: dict) -> None:
+        self._videos.set(str(video["id"]), video)
+
+    def invalidate_video(self, video_id: Hashable) -> None:
+        self._videos.pop(str(video_id))
+
+    def get(self, key: Hashable) -> Optional[CatalogEntry]:
+        return self._cache.get((self.version, key))
+
+    def set(self, key: Hashable, body: bytes) -> CatalogEntry:
+        """직렬화된 본문 저장 후 (본문, ETag) 반환"""
+        etag = '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+        entry = (body, etag)
+        self._cache.set((self.version, key), entry)
+        return entry
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or any(
+        tag.removeprefix("W/") == etag for tag in candidates
+    )
+
+
+def conditional_response(request: Request, entry: CatalogEntry) -> Response:
+    """If-None-Match가 ETag와 일치하면 304, 아니면 캐시된 JSON 본문 응답"""
+    body, etag = entry
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+catalog_cache = CatalogCache()
@@ -0,0 +1,105 @@
+import asyncio
+import logging
+import time
+import uuid
+from typing import Iterable, List, Optional, Set
+
+import httpx
+
+from app.config import settings
+from app.services.bunny import bunny_service
+from app.services.cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+
+class BunnyCleanup:
+    """Bunny 비디오 백그라운드 삭제
+
+    요청 경로 밖에서 BUNNY_DELETE_CONCURRENCY 개까지 동시에 삭제하고, 실패하면
+    BUNNY_DELETE_RETRIES 번까지 지수 백오프로 재시도한다 (이미 없는 비디오는 삭제 완료로 처리).
+    작업 진행 상황은 워커 메모리에 CLEANUP_JOB_RETENTION_SECONDS 동안 보관한다.
+    """
+
+    def __init__(self):
+        self._jobs = TTLCache(maxsize=1000, ttl=settings.CLEANUP_JOB_RETENTION_SECONDS)
+        self._tasks: Set[asyncio.Task] = set()
+
+    def get(self, job_id: str) -> Optional[dict]:
+        return self._jobs.get(job_id)
+
+    def submit(self, bunny_video_ids: Iterable[str]) -> Optional[dict]:
+        """삭제 작업 등록 (삭제할 비디오가 없으면 None)"""
+        video_ids = list(dict.fromkeys(video_id for video_id in bunny_video_ids if video_id))
+        if not video_ids:
+            return None
+
+        job = {
+            "id": str(uuid.uuid4()),
+            "status": "running",
+            "total": len(video_ids),
+            "deleted": 0,
+            "failed": [],
+            "created_at": time.time(),
+            "finished_at": None,
+        }
+        self._jobs.set(job["id"], job)
+
+        task = asyncio.create_task(self._run(job, video_ids))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return job
+
+    async def _delete(self, video_id: str) -> bool:
+        for attempt in range(settings.BUNNY_DELETE_RETRIES + 1):
+            if attempt:
+                await asyncio.sleep(settings.BUNNY_DELETE_BACKOFF_SECONDS * 2 ** (attempt - 1))
+            try:
+                if await bunny_service.delete_video(video_id):
+                    return True
+            except httpx.HTTPError:
+                pass
+        return False
+
+    async def _run(self, job: dict, video_ids: List[str]) -> None:
+        semaphore = asyncio.Semaphore(settings.BUNNY_DELETE_CONCURRENCY)
+
+        async def delete(video_id: str) -> None:
+            async with semaphore:
+                if await self._delete(video_id):
+                    job["deleted"] += 1
+                else:
+                    job["failed"].append(video_id)
+
+        try:
+            await asyncio.gather(*(delete(video_id) for video_id in video_ids))
+            job["status"] = "failed" if job["failed"] else "completed"
+        except asyncio.CancelledError:
+            job["status"] = "cancelled"
+            raise
+        finally:
+            job["finished_at"] = time.time()
+            if job["status"] != "completed":
+                logger.warning(
+                    "Bunny cleanup job %s %s (deleted %d/%d, failed: %s)",
+                    job["id"],
+                    job["status"],
+                    job["deleted"],
+                    job["total"],
+                    job["failed"],
+                )
+
+    async def stop(self) -> None:
+        """앱 종료 시 진행 중인 삭제를 잠시 기다린 뒤 취소"""
+        if not self._tasks:
+            return
+        _, pending = await asyncio.wait(
+            set(self._tasks), timeout=settings.CLEANUP_SHUTDOWN_TIMEOUT_SECONDS
+        )
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+
+bunny_cleanup = BunnyCleanup()
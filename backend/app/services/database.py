@@ -0,0 +1,32 @@
+from typing import Any, Callable, Optional
+
+import anyio
+from anyio import to_thread
+
+from app.config import settings
+from app.services.metrics import query_labels, track_query
+
+_limiter: Optional[anyio.CapacityLimiter] = None
+
+
+def _get_limiter() -> anyio.CapacityLimiter:
+    """DB 호출 전용 스레드 풀 동시 실행 제한 (이벤트 루프 안에서 생성)"""
+    global _limiter
+    if _limiter is None:
+        _limiter = anyio.CapacityLimiter(settings.DB_MAX_CONCURRENCY)
+    return _limiter
+
+
+async def run_sync(func: Callable[..., Any], *args: Any) -> Any:
+    """동기 Supabase 호출을 제한된 스레드 풀에서 실행 (이벤트 루프 블로킹 방지)"""
+    return await to_thread.run_sync(func, *args, limiter=_get_limiter())
+
+
+async def run_query(query: Any) -> Any:
+    """Supabase 쿼리 빌더를 실행하고 응답 반환
+
+    supabase-py의 .execute()는 동기 HTTP 호출이므로 워커 스레드에서 실행한다.
+    테이블/작업 단위 실행 시간은 supabase_query_duration_seconds 에 기록한다.
+    """
+    with track_query(*query_labels(query)):
+        return await run_sync(query.execute)
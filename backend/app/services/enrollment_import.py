@@ -0,0 +1,263 @@
+import asyncio
+import csv
+import json
+from datetime import datetime
+from typing import AsyncIterator, Dict, List, Optional, Set, Tuple
+from uuid import UUID
+
+from app.config import settings
+from app.services.database import run_query
+from app.services.enrollments import enrollment_cache
+from app.services.supabase import get_supabase_admin_client
+
+CSV_COLUMNS = ("email", "user_id", "course_id", "expires_at")
+
+
+async def iter_lines(stream: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """요청 본문 스트림을 줄 단위 바이트로 반환 (빈 줄 제외, 디코딩은 iter_records에서 줄마다)"""
+    buffer = b""
+    first = True
+    async for chunk in stream:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            line = line.strip()
+            if first:
+                line, first = line.removeprefix(b"\xef\xbb\xbf"), False
+            if line:
+                yield line
+    line = buffer.strip()
+    if first:
+        line = line.removeprefix(b"\xef\xbb\xbf")
+    if line:
+        yield line
+
+
+async def iter_records(lines: AsyncIterator[bytes], content_type: str) -> AsyncIterator[dict]:
+    """CSV(헤더 필수) 또는 NDJSON 줄을 dict로 변환 (잘못된 줄은 {"_error": ...})
+
+    UTF-8이 아니거나 CSV로 읽을 수 없는 줄도 그 행의 오류로 돌려주고 다음 줄을 계속 읽는다.
+    CSV 헤더를 읽을 수 없으면 오류 하나를 돌려주고 멈춘다.
+    """
+    is_csv = "csv" in content_type
+    header: Optional[List[str]] = None
+
+    async for raw in lines:
+        try:
+            line = raw.decode("utf-8")
+        except UnicodeDecodeError:
+            line = None
+
+        if is_csv:
+            try:
+                values = next(csv.reader([line])) if line is not None else None
+                error = "Invalid UTF-8"
+            except csv.Error as e:
+                values, error = None, f"Invalid CSV: {e}"
+
+            if values is None:
+                yield {"_error": error if header is not None else f"Invalid CSV header: {error}"}
+                if header is None:
+                    return
+                continue
+            if header is None:
+                header = [value.strip().lower() for value in values]
+                continue
+            yield {
+                key: value.strip()
+                for key, value in zip(header, values)
+                if key in CSV_COLUMNS and value.strip()
+            }
+        elif line is None:
+            yield {"_error": "Invalid UTF-8"}
+        else:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                yield {"_error": "Invalid JSON"}
+                continue
+            yield record if isinstance(record, dict) else {"_error": "Expected a JSON object"}
+
+
+def _text(record: dict, key: str) -> Optional[str]:
+    """문자열 필드 (없거나 빈 값이면 None, 문자열이 아니면 ValueError)"""
+    value = record.get(key)
+    if value is None:
+        return None
+    if not isinstance(value, str):
+        raise ValueError(f"{key} must be a string")
+    return value.strip() or None
+
+
+def _parse(record: dict) -> Tuple[Optional[dict], Optional[str]]:
+    """레코드 검증 -> (정규화된 값, 오류 메시지)"""
+    if "_error" in record:
+        return None, record["_error"]
+
+    try:
+        email = _text(record, "email")
+        email = email.lower() if email else None
+        user_id = _text(record, "user_id")
+        if not email and not user_id:
+            return None, "email or user_id is required"
+
+        course_id = str(UUID(_text(record, "course_id") or ""))
+        user_id = str(UUID(user_id)) if user_id else None
+        expires_at = _text(record, "expires_at")
+        if expires_at:
+            expires_at = datetime.fromisoformat(expires_at).isoformat()
+    except ValueError as e:
+        return None, str(e)
+
+    return {"email": email, "user_id": user_id, "course_id": course_id, "expires_at": expires_at}, None
+
+
+class EnrollmentImport:
+    """일괄 수강 등록
+
+    ENROLLMENT_IMPORT_BATCH_SIZE 행마다 사용자/강의를 한 번에 조회하고, 기존 등록을 한 번의
+    쿼리로 확인한 뒤 on_conflict ignore upsert로 기록한다. 행별 결과를 results에 쌓는다.
+    """
+
+    def __init__(self):
+        self.results: List[dict] = []
+        self._seen: Set[Tuple[str, str]] = set()
+
+    def summary(self) -> dict:
+        self.results.sort(key=lambda result: result["row"])
+        counts: Dict[str, int] = {}
+        for result in self.results:
+            counts[result["status"]] = counts.get(result["status"], 0) + 1
+        return {"total": len(self.results), "counts": counts, "results": self.results}
+
+    async def run(self, records: AsyncIterator[dict]) -> dict:
+        batch: List[Tuple[int, dict]] = []
+        row = 0
+        async for record in records:
+            row += 1
+            batch.append((row, record))
+            if len(batch) >= settings.ENROLLMENT_IMPORT_BATCH_SIZE:
+                await self._process(batch)
+                batch = []
+        if batch:
+            await self._process(batch)
+        return self.summary()
+
+    def _report(self, row: int, status: str, item: Optional[dict] = None, detail: Optional[str] = None) -> None:
+        item = item or {}
+        self.results.append({
+            "row": row,
+            "email": item.get("email"),
+            "user_id": item.get("user_id"),
+            "course_id": item.get("course_id"),
+            "status": status,
+            "detail": detail,
+        })
+
+    async def _process(self, batch: List[Tuple[int, dict]]) -> None:
+        supabase = get_supabase_admin_client()
+
+        parsed: List[Tuple[int, dict]] = []
+        for row, record in batch:
+            item, error = _parse(record)
+            if error:
+                self._report(row, "invalid", detail=error)
+            else:
+                parsed.append((row, item))
+
+        emails = sorted({item["email"] for _, item in parsed if item["email"] and not item["user_id"]})
+        user_ids = sorted({item["user_id"] for _, item in parsed if item["user_id"]})
+        course_ids = sorted({item["course_id"] for _, item in parsed})
+
+        # 사용자(이메일/ID)와 강의를 배치 단위로 동시에 조회
+        async def profiles_by_email() -> List[dict]:
+            if not emails:
+                return []
+            # 저장된 이메일의 대소문자와 무관하게 조회 (profiles_by_email SQL 함수)
+            result = await run_query(supabase.rpc("profiles_by_email", {"p_emails": emails}))
+            return result.data or []
+
+        async def profiles_by_id() -> List[dict]:
+            if not user_ids:
+                return []
+            result = await run_query(
+                supabase.table("profiles").select("id").in_("id", user_ids)
+            )
+            return result.data or []
+
+        async def existing_courses() -> List[dict]:
+            if not course_ids:
+                return []
+            result = await run_query(supabase.table("courses").select("id").in_("id", course_ids))
+            return result.data or []
+
+        by_email, by_id, courses = await asyncio.gather(
+            profiles_by_email(),
+            profiles_by_id(),
+            existing_courses(),
+        )
+        email_to_id = {(p.get("email") or "").lower(): p["id"] for p in by_email}
+        known_users = {p["id"] for p in by_id}
+        known_courses = {c["id"] for c in courses}
+
+        candidates: List[Tuple[int, dict]] = []
+        for row, item in parsed:
+            if not item["user_id"]:
+                item["user_id"] = email_to_id.get(item["email"])
+                found = item["user_id"] is not None
+            else:
+                found = item["user_id"] in known_users
+            if not found:
+                self._report(row, "user_not_found", item)
+            elif item["course_id"] not in known_courses:
+                self._report(row, "course_not_found", item)
+            else:
+                candidates.append((row, item))
+
+        if not candidates:
+            return
+
+        # 기존 등록을 한 번의 쿼리로 확인 (user_id × course_id 범위 조회 후 쌍 비교)
+        existing = await run_query(
+            supabase.table("enrollments")
+            .select("user_id, course_id")
+            .in_("user_id", sorted({item["user_id"] for _, item in candidates}))
+            .in_("course_id", sorted({item["course_id"] for _, item in candidates}))
+        )
+        existing_pairs = {(e["user_id"], e["course_id"]) for e in existing.data or []}
+
+        to_insert: List[Tuple[int, dict]] = []
+        for row, item in candidates:
+            key = (item["user_id"], item["course_id"])
+            if key in self._seen:
+                self._report(row, "duplicate", item)
+            elif key in existing_pairs:
+                self._report(row, "already_enrolled", item)
+            else:
+                to_insert.append((row, item))
+            self._seen.add(key)
+
+        if not to_insert:
+            return
+
+        # 확인 이후 다른 요청이 먼저 등록한 경우도 unique 제약으로 무시
+        result = await run_query(
+            supabase.table("enrollments").upsert(
+                [
+                    {"user_id": item["user_id"], "course_id": item["course_id"], "expires_at": item["expires_at"]}
+                    for _, item in to_insert
+                ],
+                on_conflict="user_id,course_id",
+                ignore_duplicates=True,
+            )
+        )
+        inserted = {(e["user_id"], e["course_id"]) for e in result.data or []}
+
+        for row, item in to_insert:
+            key = (item["user_id"], item["course_id"])
+            if key in inserted:
+                # 수강 권한 캐시 무효화 (미등록 캐시 제거)
+                enrollment_cache.invalidate(*key)
+                self._report(row, "enrolled", item)
+            else:
+                self._report(row, "already_enrolled", item)
@@ -0,0 +1,57 @@
+from typing import Union
+from uuid import UUID
+
+from app.config import settings
+from app.services.cache import TTLCache
+from app.services.repository import repository
+
+
+class EnrollmentCache:
+    """(user_id, course_id) 수강 등록 여부 인메모리 캐시
+
+    등록된 경우는 ENROLLMENT_CACHE_SECONDS, 미등록은 ENROLLMENT_NEGATIVE_CACHE_SECONDS 동안 보관한다.
+    관리자 API에서 수강 등록이 바뀌면 즉시 무효화하며, 다른 워커 프로세스의 캐시는 TTL로 정리된다.
+    """
+
+    def __init__(self):
+        self._cache = TTLCache(
+            maxsize=settings.ENROLLMENT_CACHE_SIZE,
+            ttl=settings.ENROLLMENT_CACHE_SECONDS,
+        )
+
+    @staticmethod
+    def _key(user_id: Union[str, UUID], course_id: Union[str, UUID]) -> tuple:
+        return (str(user_id), str(course_id))
+
+    async def is_enrolled(
+        self, user_id: Union[str, UUID], course_id: Union[str, UUID]
+    ) -> bool:
+        """수강 등록 여부 확인 (캐시 우선)"""
+        key = self._key(user_id, course_id)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+
+        enrolled = await repository.is_enrolled(key[0], key[1])
+        self.set(user_id, course_id, enrolled)
+        return enrolled
+
+    def set(
+        self, user_id: Union[str, UUID], course_id: Union[str, UUID], enrolled: bool
+    ) -> None:
+        ttl = None if enrolled else settings.ENROLLMENT_NEGATIVE_CACHE_SECONDS
+        self._cache.set(self._key(user_id, course_id), enrolled, ttl=ttl)
+
+    def invalidate(self, user_id: Union[str, UUID], course_id: Union[str, UUID]) -> None:
+        self._cache.pop(self._key(user_id, course_id))
+
+    def invalidate_course(self, course_id: Union[str, UUID]) -> None:
+        """강의의 모든 수강 등록 캐시 제거"""
+        course_id = str(course_id)
+        self._cache.pop_matching(lambda key: key[1] == course_id)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+
+enrollment_cache = EnrollmentCache()
@@ -0,0 +1,104 @@
+import os
+import time
+from contextlib import contextmanager
+from typing import Any, Iterator, Tuple
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    CollectorRegistry,
+    Gauge,
+    Histogram,
+    generate_latest,
+)
+
+from app.services import request_stats
+
+# 지연 시간 버킷 (초) - 캐시 히트 수준부터 Bunny/Supabase 타임아웃 근처까지
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 10.0, 15.0)
+
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "HTTP 요청 처리 시간",
+    ["method", "route", "status"],
+    buckets=LATENCY_BUCKETS,
+)
+HTTP_REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress",
+    "처리 중인 HTTP 요청 수",
+    ["method"],
+    multiprocess_mode="livesum",
+)
+
+SUPABASE_QUERY_DURATION = Histogram(
+    "supabase_query_duration_seconds",
+    "DB 쿼리 시간 (PostgREST는 스레드 풀 대기 포함, asyncpg는 풀 대기 포함)",
+    ["table", "operation", "outcome"],
+    buckets=LATENCY_BUCKETS,
+)
+SUPABASE_QUERIES_IN_PROGRESS = Gauge(
+    "supabase_queries_in_progress",
+    "실행 중인 Supabase 쿼리 수",
+    multiprocess_mode="livesum",
+)
+
+BUNNY_REQUEST_DURATION = Histogram(
+    "bunny_request_duration_seconds",
+    "Bunny Stream API 호출 시간",
+    ["operation", "status"],
+    buckets=LATENCY_BUCKETS,
+)
+BUNNY_REQUESTS_IN_PROGRESS = Gauge(
+    "bunny_requests_in_progress",
+    "실행 중인 Bunny Stream API 호출 수",
+    multiprocess_mode="livesum",
+)
+
+
+def query_labels(query: Any) -> Tuple[str, str]:
+    """쿼리 빌더에서 (테이블/RPC 이름, 작업 종류) 추출"""
+    request = getattr(query, "request", None)
+    if request is None:
+        return "unknown", "unknown"
+
+    path = str(request.path.path if hasattr(request.path, "path") else request.path)
+    name = path.rstrip("/").rsplit("/", 1)[-1]
+    if "/rpc/" in path:
+        return name, "rpc"
+
+    method = str(getattr(request.http_method, "value", request.http_method)).upper()
+    if method == "POST":
+        prefer = request.headers.get("prefer", "")
+        return name, "upsert" if "resolution=" in prefer else "insert"
+
+    return name, {"GET": "select", "HEAD": "count", "PATCH": "update", "DELETE": "delete"}.get(method, method.lower())
+
+
+@contextmanager
+def track_query(table: str, operation: str) -> Iterator[None]:
+    """Supabase 쿼리 시간/동시 실행 수 기록 (요청 단위 집계 포함)"""
+    outcome = "error"
+    start = time.perf_counter()
+    SUPABASE_QUERIES_IN_PROGRESS.inc()
+    try:
+        yield
+        outcome = "ok"
+    finally:
+        elapsed = time.perf_counter() - start
+        SUPABASE_QUERIES_IN_PROGRESS.dec()
+        SUPABASE_QUERY_DURATION.labels(table, operation, outcome).observe(elapsed)
+        request_stats.record("db", elapsed)
+
+
+def render_metrics() -> Tuple[bytes, str]:
+    """Prometheus 텍스트 형식 출력
+
+    PROMETHEUS_MULTIPROC_DIR 이 설정된 경우(uvicorn/gunicorn 다중 워커) 모든 워커의 값을 합산한다.
+    """
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        from prometheus_client import multiprocess
+
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry), CONTENT_TYPE_LATEST
+
+    return generate_latest(), CONTENT_TYPE_LATEST
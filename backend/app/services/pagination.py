@@ -0,0 +1,79 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, List, Optional
+from uuid import UUID
+
+from fastapi import HTTPException, Response, status
+
+
+def encode_cursor(row: dict, sort_column: str) -> str:
+    """마지막 행의 (정렬 컬럼, id)를 불투명한 커서 문자열로 인코딩"""
+    raw = json.dumps([row[sort_column], row["id"]], default=str)
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple:
+    """커서를 (정렬 시각, id) 문자열로 복원
+
+    값이 그대로 PostgREST 필터에 들어가므로 시각/UUID 형식이 아니면 400으로 거절한다.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        value, last_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(value).isoformat(), str(UUID(last_id))
+    except (binascii.Error, ValueError, TypeError, AttributeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        )
+
+
+def count_method(include_total: bool, cursor: Optional[str]) -> Optional[str]:
+    """전체 개수 조회 방식 (커서 조건이 붙으면 남은 행만 세므로 첫 페이지에서만 계산)"""
+    return "exact" if include_total and not cursor else None
+
+
+def keyset_page(query: Any, sort_column: str, limit: int, cursor: Optional[str] = None) -> Any:
+    """(sort_column desc, id desc) 키셋 페이지네이션 적용
+
+    정렬 컬럼이 NULL인 행은 커서로 이어 갈 수 없으므로 제외한다.
+    다음 페이지 존재 여부를 알기 위해 limit + 1 행을 조회한다.
+    """
+    query = (
+        query.not_.is_(sort_column, "null")
+        .order(sort_column, desc=True)
+        .order("id", desc=True)
+    )
+
+    if cursor:
+        value, last_id = decode_cursor(cursor)
+        query = query.or_(
+            f'{sort_column}.lt."{value}",'
+            f'and({sort_column}.eq."{value}",id.lt."{last_id}")'
+        )
+
+    return query.limit(limit + 1)
+
+
+def page_rows(
+    response: Response,
+    rows: List[dict],
+    sort_column: str,
+    limit: int,
+    total: Optional[int] = None,
+) -> List[dict]:
+    """페이지 행 반환 + 다음 커서/전체 개수를 응답 헤더에 설정
+
+    응답 본문은 기존과 같은 목록이며, 다음 페이지가 있으면 X-Next-Cursor,
+    include_total 요청 시 X-Total-Count 헤더를 추가한다.
+    """
+    if len(rows) > limit:
+        rows = rows[:limit]
+        response.headers["X-Next-Cursor"] = encode_cursor(rows[-1], sort_column)
+
+    if total is not None:
+        response.headers["X-Total-Count"] = str(total)
+
+    return rows
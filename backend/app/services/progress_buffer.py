@@ -0,0 +1,204 @@
+import asyncio
+import logging
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple, Union
+from uuid import UUID
+
+from app.config import settings
+from app.services.repository import repository
+
+logger = logging.getLogger(__name__)
+
+ProgressKey = Tuple[str, str]
+
+# 행 자체가 잘못된 경우의 SQLSTATE 클래스 (22: 데이터 오류, 23: 무결성 제약 위반)
+_ROW_ERROR_CLASSES = ("22", "23")
+
+
+def _is_row_error(exc: Exception) -> bool:
+    """재시도해도 성공할 수 없는 행 단위 오류인지 (PostgREST APIError.code / asyncpg sqlstate)"""
+    code = getattr(exc, "sqlstate", None) or getattr(exc, "code", None)
+    return isinstance(code, str) and code[:2] in _ROW_ERROR_CLASSES
+
+
+class ProgressBuffer:
+    """시청 진도 write-behind 버퍼
+
+    플레이어 하트비트를 메모리에 모아 (user_id, video_id)별 최신 값만 유지하고,
+    PROGRESS_FLUSH_INTERVAL_SECONDS 마다 또는 PROGRESS_FLUSH_MAX_BATCH 건이 쌓이면
+    watch_history에 한 번의 bulk upsert로 기록한다. 앱 종료 시 남은 값을 모두 기록한다.
+
+    삭제된 비디오/사용자처럼 제약 조건에 걸리는 행은 배치를 나눠 찾아내 버리고,
+    네트워크 등 일시적 오류는 키마다 PROGRESS_FLUSH_MAX_ATTEMPTS 번까지만 다시 시도한다.
+    """
+
+    def __init__(self):
+        self._pending: Dict[ProgressKey, dict] = {}
+        self._inflight: Dict[ProgressKey, dict] = {}
+        self._attempts: Dict[ProgressKey, int] = {}
+        self._flush_lock = asyncio.Lock()
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = False
+
+    @property
+    def enabled(self) -> bool:
+        return settings.PROGRESS_BUFFER_ENABLED
+
+    @staticmethod
+    def _key(user_id: Union[str, UUID], video_id: Union[str, UUID]) -> ProgressKey:
+        return (str(user_id), str(video_id))
+
+    def get(self, user_id: Union[str, UUID], video_id: Union[str, UUID]) -> Optional[dict]:
+        """아직 DB에 기록되지 않은 최신 진도 (기록 중인 값 포함)"""
+        key = self._key(user_id, video_id)
+        return self._pending.get(key) or self._inflight.get(key)
+
+    async def record(
+        self,
+        user_id: Union[str, UUID],
+        video_id: Union[str, UUID],
+        progress_seconds: int,
+        is_completed: bool,
+    ) -> None:
+        """진도 기록 (같은 키의 이전 값은 덮어씀)"""
+        key = self._key(user_id, video_id)
+        self._pending[key] = {
+            "user_id": key[0],
+            "video_id": key[1],
+            "progress_seconds": progress_seconds,
+            "is_completed": is_completed,
+            "last_watched_at": datetime.now(timezone.utc),
+        }
+
+        if len(self._pending) >= settings.PROGRESS_FLUSH_MAX_BATCH:
+            if self._task is None:
+                # 백그라운드 루프가 없으면 (lifespan 밖) 직접 기록
+                await self.flush()
+            else:
+                self._wakeup.set()
+
+    async def flush(self, user_id: Optional[Union[str, UUID]] = None) -> int:
+        """버퍼의 진도를 watch_history에 bulk upsert 하고 기록한 건수 반환
+
+        user_id를 주면 그 사용자의 값만 기록한다 (DB 조회 전에 최신 진도 반영).
+        """
+        async with self._flush_lock:
+            if user_id is None:
+                self._inflight, self._pending = self._pending, {}
+            else:
+                user_id = str(user_id)
+                self._inflight = {key: row for key, row in self._pending.items() if key[0] == user_id}
+                for key in self._inflight:
+                    del self._pending[key]
+
+            if not self._inflight:
+                return 0
+
+            rows = list(self._inflight.values())
+            batch_size = settings.PROGRESS_FLUSH_MAX_BATCH
+            written = 0
+
+            try:
+                for start in range(0, len(rows), batch_size):
+                    batch = rows[start:start + batch_size]
+                    written += await self._write(batch)
+                    for row in batch:
+                        key = (row["user_id"], row["video_id"])
+                        self._inflight.pop(key, None)
+                        self._attempts.pop(key, None)
+            except Exception:
+                self._requeue()
+                raise
+            except BaseException:
+                # 취소 등으로 중단되면 시도 횟수와 무관하게 그대로 되돌림
+                self._requeue(count_attempt=False)
+                raise
+            finally:
+                self._inflight = {}
+
+            return written
+
+    async def _write(self, rows: List[dict]) -> int:
+        """배치 upsert, 행 단위 오류면 반으로 나눠 잘못된 행만 버림 (기록한 건수 반환)"""
+        try:
+            await repository.upsert_progress(rows)
+            return len(rows)
+        except Exception as exc:
+            if not _is_row_error(exc):
+                raise
+            if len(rows) == 1:
+                logger.warning(
+                    "Dropping watch progress rejected by the database (user_id=%s, video_id=%s): %s",
+                    rows[0]["user_id"], rows[0]["video_id"], exc,
+                )
+                return 0
+
+        middle = len(rows) // 2
+        return await self._write(rows[:middle]) + await self._write(rows[middle:])
+
+    def _requeue(self, count_attempt: bool = True) -> None:
+        """일시적 오류로 기록하지 못한 값을 버퍼로 되돌림 (그 사이 들어온 더 최신 값 우선)"""
+        dropped = 0
+        for key, row in self._inflight.items():
+            if not count_attempt:
+                self._pending.setdefault(key, row)
+                continue
+            attempts = self._attempts.get(key, 0) + 1
+            if attempts >= settings.PROGRESS_FLUSH_MAX_ATTEMPTS:
+                self._attempts.pop(key, None)
+                dropped += 1
+                continue
+            self._attempts[key] = attempts
+            self._pending.setdefault(key, row)
+
+        if dropped:
+            logger.error(
+                "Dropped %d watch progress rows after %d failed flush attempts",
+                dropped, settings.PROGRESS_FLUSH_MAX_ATTEMPTS,
+            )
+
+    async def _run(self) -> None:
+        while not self._stopping:
+            try:
+                await asyncio.wait_for(
+                    self._wakeup.wait(),
+                    timeout=settings.PROGRESS_FLUSH_INTERVAL_SECONDS,
+                )
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+            try:
+                await self.flush()
+            except Exception:
+                logger.exception("Failed to flush watch progress buffer")
+
+    async def start(self) -> None:
+        """주기적 flush 루프 시작"""
+        if self.enabled and self._task is None:
+            # 현재 이벤트 루프에서 동기화 객체 생성
+            self._flush_lock = asyncio.Lock()
+            self._wakeup = asyncio.Event()
+            self._stopping = False
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """flush 루프 중지 후 남은 진도 기록
+
+        진행 중인 flush를 취소하면 기록 중이던 배치를 잃으므로, 루프가 현재 flush를
+        마치고 스스로 끝나기를 기다린다.
+        """
+        if self._task is not None:
+            self._stopping = True
+            self._wakeup.set()
+            await self._task
+            self._task = None
+
+        try:
+            await self.flush()
+        except Exception:
+            logger.exception("Failed to flush watch progress buffer on shutdown")
+
+
+progress_buffer = ProgressBuffer()
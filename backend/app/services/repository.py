@@ -0,0 +1,322 @@
+import asyncio
+import json
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Any, List, Optional, Union
+from uuid import UUID
+
+from app.config import settings
+from app.services.database import run_query
+from app.services.metrics import track_query
+from app.services.supabase import get_supabase_admin_client
+
+Id = Union[str, UUID]
+
+
+class Repository(ABC):
+    """핫 패스 조회/기록 인터페이스 (DB_BACKEND 설정으로 구현 선택)
+
+    권한 확인이 함께 필요한 조회는 supabase/migrations의 SQL 함수를 그대로 사용하므로
+    두 백엔드의 결과 형식이 같다.
+    """
+
+    async def startup(self) -> None:
+        pass
+
+    async def shutdown(self) -> None:
+        pass
+
+    @abstractmethod
+    async def is_enrolled(self, user_id: Id, course_id: Id) -> bool:
+        """user가 course를 수강 중인지"""
+
+    @abstractmethod
+    async def get_role(self, user_id: Id) -> Optional[str]:
+        """profiles.role (프로필이 없으면 None)"""
+
+    @abstractmethod
+    async def authorize_video(self, user_id: Id, video_id: Id) -> Optional[dict]:
+        """{"video": {...}, "enrolled": bool}, 비디오가 없으면 None"""
+
+    @abstractmethod
+    async def course_with_videos(self, user_id: Id, course_id: Id) -> Optional[dict]:
+        """{"course": {...}, "enrolled": bool, "videos": [...]}, 강의가 없으면 None"""
+
+    @abstractmethod
+    async def record_progress(
+        self, user_id: Id, video_id: Id, progress_seconds: int, is_completed: bool
+    ) -> str:
+        """권한 확인 후 시청 기록 upsert ('ok' | 'not_found' | 'forbidden')"""
+
+    @abstractmethod
+    async def get_progress(self, user_id: Id, video_id: Id) -> Optional[dict]:
+        """watch_history 한 건 (없으면 None)"""
+
+    @abstractmethod
+    async def upsert_progress(self, rows: List[dict]) -> None:
+        """시청 진도 bulk upsert (user_id, video_id, progress_seconds, is_completed, last_watched_at)"""
+
+    @abstractmethod
+    async def continue_watching(self, user_id: Id, limit: int) -> List[dict]:
+        """수강 중인 강의에서 최근 시청한 미완료 비디오 (최근 순)"""
+
+    @abstractmethod
+    async def course_progress(self, user_id: Id) -> List[dict]:
+        """수강 중인 공개 강의별 전체/완료 비디오 수와 진도율"""
+
+
+class SupabaseRepository(Repository):
+    """supabase-py(PostgREST HTTP) 구현"""
+
+    async def is_enrolled(self, user_id: Id, course_id: Id) -> bool:
+        supabase = get_supabase_admin_client()
+        result = await run_query(
+            supabase.table("enrollments")
+            .select("id")
+            .eq("user_id", str(user_id))
+            .eq("course_id", str(course_id))
+            .limit(1)
+        )
+        return bool(result.data)
+
+    async def get_role(self, user_id: Id) -> Optional[str]:
+        supabase = get_supabase_admin_client()
+        result = await run_query(
+            supabase.table("profiles").select("role").eq("id", str(user_id)).maybe_single()
+        )
+        # maybe_single은 결과가 없으면 None 반환
+        return result.data.get("role") if result and result.data else None
+
+    async def authorize_video(self, user_id: Id, video_id: Id) -> Optional[dict]:
+        supabase = get_supabase_admin_client()
+        result = await run_query(
+            supabase.rpc(
+                "authorize_video",
+                {"p_user_id": str(user_id), "p_video_id": str(video_id)},
+            )
+        )
+        return result.data if result and result.data else None
+
+    async def course_with_videos(self, user_id: Id, course_id: Id) -> Optional[dict]:
+        supabase = get_supabase_admin_client()
+        result = await run_query(
+            supabase.rpc(
+                "course_with_videos_for_user",
+                {"p_user_id": str(user_id), "p_course_id": str(course_id)},
+            )
+        )
+        return result.data if result and result.data else None
+
+    async def record_progress(
+        self, user_id: Id, video_id: Id, progress_seconds: int, is_completed: bool
+    ) -> str:
+        supabase = get_supabase_admin_client()
+        result = await run_query(
+            supabase.rpc(
+                "record_progress",
+                {
+                    "p_user_id": str(user_id),
+                    "p_video_id": str(video_id),
+                    "p_progress_seconds": progress_seconds,
+                    "p_is_completed": is_completed,
+                },
+            )
+        )
+        return result.data
+
+    async def get_progress(self, user_id: Id, video_id: Id) -> Optional[dict]:
+        supabase = get_supabase_admin_client()
+        result = await run_query(
+            supabase.table("watch_history")
+            .select("*")
+            .eq("user_id", str(user_id))
+            .eq("video_id", str(video_id))
+            .maybe_single()
+        )
+        return result.data if result and result.data else None
+
+    async def upsert_progress(self, rows: List[dict]) -> None:
+        supabase = get_supabase_admin_client()
+        payload = [
+            {**row, "last_watched_at": row["last_watched_at"].isoformat()}
+            if isinstance(row.get("last_watched_at"), datetime) else row
+            for row in rows
+        ]
+        await run_query(
+            supabase.table("watch_history").upsert(payload, on_conflict="user_id,video_id")
+        )
+
+    async def continue_watching(self, user_id: Id, limit: int) -> List[dict]:
+        supabase = get_supabase_admin_client()
+        result = await run_query(
+            supabase.rpc("continue_watching", {"p_user_id": str(user_id), "p_limit": limit})
+        )
+        return result.data or []
+
+    async def course_progress(self, user_id: Id) -> List[dict]:
+        supabase = get_supabase_admin_client()
+        result = await run_query(
+            supabase.rpc("course_progress_for_user", {"p_user_id": str(user_id)})
+        )
+        return result.data or []
+
+
+class AsyncpgRepository(Repository):
+    """asyncpg 커넥션 풀로 Postgres에 직접 연결하는 구현
+
+    PostgREST HTTP 왕복과 JSON 직렬화를 거치지 않는다. 같은 SQL 문은 연결마다
+    한 번 prepare 되어 statement 캐시(DB_STATEMENT_CACHE_SIZE)에서 재사용된다.
+    service role과 같이 RLS를 우회하는 DB 사용자로 연결해야 한다.
+    Repository의 핫 패스 메서드만 구현하며 그 밖의 조회/관리 기능은 supabase-py를 사용한다.
+    """
+
+    IS_ENROLLED = "SELECT EXISTS (SELECT 1 FROM enrollments WHERE user_id = $1 AND course_id = $2)"
+    GET_ROLE = "SELECT role FROM profiles WHERE id = $1"
+    AUTHORIZE_VIDEO = "SELECT authorize_video($1, $2)"
+    COURSE_WITH_VIDEOS = "SELECT course_with_videos_for_user($1, $2)"
+    CONTINUE_WATCHING = "SELECT continue_watching($1, $2)"
+    COURSE_PROGRESS = "SELECT course_progress_for_user($1)"
+    RECORD_PROGRESS = "SELECT record_progress($1, $2, $3, $4)"
+    GET_PROGRESS = (
+        "SELECT id, user_id, video_id, progress_seconds, is_completed, last_watched_at "
+        "FROM watch_history WHERE user_id = $1 AND video_id = $2"
+    )
+    # 컬럼별 배열 파라미터로 배치 전체를 한 문장에 기록
+    UPSERT_PROGRESS = """
+        INSERT INTO watch_history (user_id, video_id, progress_seconds, is_completed, last_watched_at)
+        SELECT * FROM unnest($1::uuid[], $2::uuid[], $3::integer[], $4::boolean[], $5::timestamptz[])
+        ON CONFLICT (user_id, video_id) DO UPDATE
+        SET progress_seconds = EXCLUDED.progress_seconds,
+            is_completed = EXCLUDED.is_completed,
+            last_watched_at = EXCLUDED.last_watched_at
+    """
+
+    def __init__(self):
+        self._pool = None
+        # 동시에 들어온 첫 요청들이 풀을 하나씩 만들지 않도록 생성 구간 직렬화
+        self._pool_lock: Optional[asyncio.Lock] = None
+
+    @staticmethod
+    async def _init_connection(conn) -> None:
+        # jsonb를 dict/list로 받기 (SQL 함수 결과)
+        await conn.set_type_codec(
+            "jsonb", encoder=json.dumps, decoder=json.loads, schema="pg_catalog"
+        )
+
+    async def startup(self) -> None:
+        """커넥션 풀 생성"""
+        if self._pool is not None:
+            return
+
+        if self._pool_lock is None:
+            self._pool_lock = asyncio.Lock()
+        async with self._pool_lock:
+            if self._pool is None:
+                self._pool = await self._create_pool()
+
+    async def _create_pool(self):
+        try:
+            import asyncpg
+        except ImportError as exc:
+            raise RuntimeError("DB_BACKEND=asyncpg requires the asyncpg package") from exc
+
+        if not settings.DATABASE_URL:
+            raise RuntimeError("DB_BACKEND=asyncpg requires DATABASE_URL")
+
+        return await asyncpg.create_pool(
+            settings.DATABASE_URL,
+            min_size=settings.DB_POOL_MIN_SIZE,
+            max_size=settings.DB_POOL_MAX_SIZE,
+            command_timeout=settings.DB_COMMAND_TIMEOUT_SECONDS,
+            statement_cache_size=settings.DB_STATEMENT_CACHE_SIZE,
+            init=self._init_connection,
+        )
+
+    async def shutdown(self) -> None:
+        """커넥션 풀 정리"""
+        if self._pool is not None:
+            await self._pool.close()
+        self._pool = None
+        # 다음 startup은 다른 이벤트 루프일 수 있음
+        self._pool_lock = None
+
+    async def _pool_or_start(self):
+        # lifespan 밖(스크립트 등)에서는 처음 사용할 때 생성
+        if self._pool is None:
+            await self.startup()
+        return self._pool
+
+    async def _fetchval(self, table: str, operation: str, sql: str, *args: Any) -> Any:
+        pool = await self._pool_or_start()
+        with track_query(table, operation):
+            return await pool.fetchval(sql, *args)
+
+    async def is_enrolled(self, user_id: Id, course_id: Id) -> bool:
+        return await self._fetchval(
+            "enrollments", "select", self.IS_ENROLLED, UUID(str(user_id)), UUID(str(course_id))
+        )
+
+    async def get_role(self, user_id: Id) -> Optional[str]:
+        return await self._fetchval("profiles", "select", self.GET_ROLE, UUID(str(user_id)))
+
+    async def authorize_video(self, user_id: Id, video_id: Id) -> Optional[dict]:
+        return await self._fetchval(
+            "authorize_video", "rpc", self.AUTHORIZE_VIDEO, UUID(str(user_id)), UUID(str(video_id))
+        )
+
+    async def course_with_videos(self, user_id: Id, course_id: Id) -> Optional[dict]:
+        return await self._fetchval(
+            "course_with_videos_for_user", "rpc", self.COURSE_WITH_VIDEOS,
+            UUID(str(user_id)), UUID(str(course_id)),
+        )
+
+    async def record_progress(
+        self, user_id: Id, video_id: Id, progress_seconds: int, is_completed: bool
+    ) -> str:
+        return await self._fetchval(
+            "record_progress", "rpc", self.RECORD_PROGRESS,
+            UUID(str(user_id)), UUID(str(video_id)), progress_seconds, is_completed,
+        )
+
+    async def get_progress(self, user_id: Id, video_id: Id) -> Optional[dict]:
+        pool = await self._pool_or_start()
+        with track_query("watch_history", "select"):
+            row = await pool.fetchrow(self.GET_PROGRESS, UUID(str(user_id)), UUID(str(video_id)))
+
+        if row is None:
+            return None
+        # PostgREST 응답과 같은 형식 (UUID는 문자열)
+        return {key: str(value) if isinstance(value, UUID) else value for key, value in row.items()}
+
+    async def upsert_progress(self, rows: List[dict]) -> None:
+        pool = await self._pool_or_start()
+        with track_query("watch_history", "upsert"):
+            await pool.execute(
+                self.UPSERT_PROGRESS,
+                [UUID(row["user_id"]) for row in rows],
+                [UUID(row["video_id"]) for row in rows],
+                [row["progress_seconds"] for row in rows],
+                [row["is_completed"] for row in rows],
+                [row["last_watched_at"] for row in rows],
+            )
+
+    async def continue_watching(self, user_id: Id, limit: int) -> List[dict]:
+        return await self._fetchval(
+            "continue_watching", "rpc", self.CONTINUE_WATCHING, UUID(str(user_id)), limit
+        ) or []
+
+    async def course_progress(self, user_id: Id) -> List[dict]:
+        return await self._fetchval(
+            "course_progress_for_user", "rpc", self.COURSE_PROGRESS, UUID(str(user_id))
+        ) or []
+
+
+def create_repository(backend: str) -> Repository:
+    if backend == "supabase":
+        return SupabaseRepository()
+    if backend == "asyncpg":
+        return AsyncpgRepository()
+    raise ValueError(f"Unknown DB_BACKEND: {backend}")
+
+
+repository = create_repository(settings.DB_BACKEND)
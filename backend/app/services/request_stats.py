@@ -0,0 +1,63 @@
+import time
+from contextvars import ContextVar, Token
+from typing import Dict, Optional
+
+# 요청 단위로 집계하는 외부 호출 종류 -> Server-Timing 설명 단위
+KINDS = {"db": "queries", "bunny": "calls", "auth": "calls"}
+
+
+class RequestStats:
+    """요청 하나에서 발생한 외부 호출 횟수/시간 (Supabase 쿼리, Bunny API, Auth 서버)"""
+
+    def __init__(self):
+        self.started_at = time.perf_counter()
+        self.counts: Dict[str, int] = {kind: 0 for kind in KINDS}
+        self.durations: Dict[str, float] = {kind: 0.0 for kind in KINDS}
+
+    def record(self, kind: str, duration: float) -> None:
+        self.counts[kind] += 1
+        self.durations[kind] += duration
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started_at
+
+    def server_timing(self) -> str:
+        """Server-Timing 헤더 값 (예: db;dur=12.3;desc="3 queries", app;dur=20.1)"""
+        parts = [
+            f'{kind};dur={self.durations[kind] * 1000:.1f};desc="{self.counts[kind]} {unit}"'
+            for kind, unit in KINDS.items()
+            if self.counts[kind]
+        ]
+        parts.append(f"app;dur={self.elapsed * 1000:.1f}")
+        return ", ".join(parts)
+
+    def as_dict(self) -> dict:
+        stats = {"duration_ms": round(self.elapsed * 1000, 1)}
+        for kind in KINDS:
+            stats[f"{kind}_count"] = self.counts[kind]
+            stats[f"{kind}_ms"] = round(self.durations[kind] * 1000, 1)
+        return stats
+
+
+_current: ContextVar[Optional[RequestStats]] = ContextVar("request_stats", default=None)
+
+
+def start() -> Token:
+    """현재 컨텍스트(요청)의 집계 시작 (asyncio.gather 하위 작업도 같은 객체에 기록됨)"""
+    return _current.set(RequestStats())
+
+
+def reset(token: Token) -> None:
+    _current.reset(token)
+
+
+def current() -> Optional[RequestStats]:
+    return _current.get()
+
+
+def record(kind: str, duration: float) -> None:
+    """요청 밖(백그라운드 작업 등)에서는 기록하지 않음"""
+    stats = _current.get()
+    if stats is not None:
+        stats.record(kind, duration)
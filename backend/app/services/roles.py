@@ -0,0 +1,62 @@
+from typing import Any, Optional, Union
+from uuid import UUID
+
+from app.config import settings
+from app.services.cache import TTLCache
+from app.services.repository import repository
+
+
+def role_from_token(user: Any) -> Optional[str]:
+    """AUTH_ROLE_CLAIM 경로(예: app_metadata.role)의 역할 클레임 조회
+
+    사용자가 직접 수정할 수 있는 user_metadata는 신뢰하지 않는다.
+    """
+    path = settings.AUTH_ROLE_CLAIM
+    if not path or path.startswith("user_metadata"):
+        return None
+
+    # 로컬 검증 사용자는 전체 클레임, Supabase User는 app_metadata만 제공
+    claims = getattr(user, "claims", None)
+    if claims is None:
+        claims = {"app_metadata": getattr(user, "app_metadata", None) or {}}
+
+    value: Any = claims
+    for part in path.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(part)
+
+    return value if isinstance(value, str) else None
+
+
+class RoleCache:
+    """profiles.role 인메모리 캐시 (관리자 API 권한 확인용)
+
+    admin_update_user_role에서 즉시 무효화하며, 다른 워커의 캐시는 ROLE_CACHE_SECONDS 후 만료된다.
+    """
+
+    def __init__(self):
+        self._cache = TTLCache(
+            maxsize=settings.ROLE_CACHE_SIZE,
+            ttl=settings.ROLE_CACHE_SECONDS,
+        )
+
+    async def get_role(self, user_id: Union[str, UUID]) -> Optional[str]:
+        """사용자 역할 조회 (캐시 우선, 프로필이 없으면 None)"""
+        key = str(user_id)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached or None
+
+        role = await repository.get_role(key)
+        self._cache.set(key, role or "")
+        return role
+
+    def invalidate(self, user_id: Union[str, UUID]) -> None:
+        self._cache.pop(str(user_id))
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+
+role_cache = RoleCache()
@@ -1,20 +1,105 @@
-from supabase import create_client, Client
+from typing import Dict, Optional
+
+import httpx
+from supabase import create_client, Client, ClientOptions
 
 from app.config import settings
 
 
+class SupabaseClientRegistry:
+    """워커 프로세스당 한 번 생성해 재사용하는 Supabase 클라이언트 모음
+
+    API 키(anon/service role)마다 keep-alive 커넥션 풀을 가진 httpx.Client를 하나씩 두어
+    한 키의 인증 헤더가 다른 키의 클라이언트에 섞이지 않게 한다.
+    앱 lifespan에서 startup()/shutdown()을 호출하며, lifespan 밖(스크립트 등)에서는
+    처음 사용할 때 생성된다.
+    """
+
+    def __init__(self):
+        # 벤치마크/테스트에서 가짜 PostgREST로 교체할 때 사용 (None이면 실제 네트워크)
+        self.transport: Optional[httpx.BaseTransport] = None
+        self._http_clients: Dict[str, httpx.Client] = {}
+        self._client: Optional[Client] = None
+        self._admin_client: Optional[Client] = None
+
+    def http_client(self, key: str) -> httpx.Client:
+        """API 키별 공유 HTTP 커넥션 풀"""
+        if key not in self._http_clients:
+            self._http_clients[key] = httpx.Client(
+                transport=self.transport,
+                limits=httpx.Limits(
+                    max_connections=settings.SUPABASE_POOL_MAX_CONNECTIONS,
+                    max_keepalive_connections=settings.SUPABASE_POOL_MAX_KEEPALIVE,
+                    keepalive_expiry=settings.SUPABASE_POOL_KEEPALIVE_EXPIRY,
+                ),
+                timeout=httpx.Timeout(
+                    settings.SUPABASE_TIMEOUT_SECONDS,
+                    connect=settings.SUPABASE_CONNECT_TIMEOUT_SECONDS,
+                ),
+            )
+        return self._http_clients[key]
+
+    def _create(self, key: str) -> Client:
+        return create_client(
+            settings.SUPABASE_URL,
+            key,
+            options=ClientOptions(
+                httpx_client=self.http_client(key),
+                auto_refresh_token=False,
+                persist_session=False,
+            ),
+        )
+
+    @property
+    def client(self) -> Client:
+        if self._client is None:
+            self._client = self._create(settings.SUPABASE_ANON_KEY)
+        return self._client
+
+    @property
+    def admin_client(self) -> Client:
+        if self._admin_client is None:
+            self._admin_client = self._create(settings.SUPABASE_SERVICE_ROLE_KEY)
+        return self._admin_client
+
+    def create_session_client(self) -> Client:
+        """세션 상태를 갖는 요청 전용 클라이언트 (커넥션 풀은 공유)"""
+        return self._create(settings.SUPABASE_ANON_KEY)
+
+    def startup(self) -> None:
+        """클라이언트 미리 생성"""
+        _ = self.client
+        _ = self.admin_client
+
+    def shutdown(self) -> None:
+        """커넥션 풀 정리"""
+        for http_client in self._http_clients.values():
+            http_client.close()
+        self._http_clients = {}
+        self._client = None
+        self._admin_client = None
+
+
+supabase_clients = SupabaseClientRegistry()
+
+
 def get_supabase_client() -> Client:
     """일반 Supabase 클라이언트 (anon key)"""
-    return create_client(settings.SUPABASE_URL, settings.SUPABASE_ANON_KEY)
+    return supabase_clients.client
 
 
 def get_supabase_admin_client() -> Client:
     """관리자 Supabase 클라이언트 (service role key) - RLS 우회"""
-    return create_client(settings.SUPABASE_URL, settings.SUPABASE_SERVICE_ROLE_KEY)
+    return supabase_clients.admin_client
+
+
+def get_supabase_session_client() -> Client:
+    """로그인/로그아웃 등 세션을 다루는 요청 전용 Supabase 클라이언트 (anon key)"""
+    return supabase_clients.create_session_client()
 
 
 def get_supabase_client_with_token(token: str) -> Client:
     """사용자 토큰으로 인증된 Supabase 클라이언트 (RLS 적용)"""
-    client = create_client(settings.SUPABASE_URL, settings.SUPABASE_ANON_KEY)
+    client = supabase_clients.create_session_client()
     client.auth.set_session(token, token)  # access_token, refresh_token
     return client
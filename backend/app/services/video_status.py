@@ -0,0 +1,112 @@
+import asyncio
+from typing import AsyncIterator, Iterable, Optional, Set
+
+from app.config import settings
+from app.services.cache import TTLCache
+
+# Bunny 비디오 객체의 status 값
+VIDEO_STATUS = {0: "created", 1: "uploaded", 2: "processing", 3: "transcoding", 4: "finished", 5: "error", 6: "error"}
+
+# Bunny 웹훅 Status 값 -> 비디오 처리 상태 (자막/제목 생성 등 상태와 무관한 이벤트는 제외)
+WEBHOOK_STATUS = {
+    0: "uploaded",  # Queued
+    1: "processing",  # Processing
+    2: "transcoding",  # Encoding
+    3: "finished",  # Finished
+    4: "transcoding",  # Resolution finished (다른 해상도 인코딩 진행 중)
+    5: "error",  # Failed
+    6: "created",  # PresignedUploadStarted
+    7: "uploaded",  # PresignedUploadFinished
+    8: "error",  # PresignedUploadFailed
+}
+
+# 더 이상 바뀌지 않는 상태
+TERMINAL_STATUSES = frozenset({"finished", "error"})
+
+
+def status_payload(
+    bunny_video_id: str,
+    encoding_status: str,
+    duration: Optional[int] = None,
+    thumbnail: Optional[str] = None,
+) -> dict:
+    """상태 조회 API / SSE 이벤트 공통 형식"""
+    return {
+        "video_id": bunny_video_id,
+        "status": encoding_status,
+        "ready_to_stream": encoding_status == "finished",
+        "duration": duration,
+        "thumbnail": thumbnail,
+    }
+
+
+class VideoStatusBroker:
+    """비디오 처리 상태 인프로세스 pub/sub
+
+    웹훅으로 받은 최신 상태를 bunny_video_id별로 보관하고, SSE 구독자에게 전달한다.
+    워커 프로세스 단위이므로 다른 워커의 구독자는 DB(videos.encoding_status)를 통해서만 상태를 본다.
+    """
+
+    def __init__(self):
+        self._latest = TTLCache(
+            maxsize=settings.VIDEO_STATUS_CACHE_SIZE,
+            ttl=settings.VIDEO_STATUS_CACHE_SECONDS,
+        )
+        self._subscribers: Set[asyncio.Queue] = set()
+
+    def get(self, bunny_video_id: str) -> Optional[dict]:
+        """이 워커가 마지막으로 받은 상태"""
+        return self._latest.get(bunny_video_id)
+
+    def publish(self, event: dict) -> None:
+        """상태 변경 저장 후 모든 구독자에게 전달 (느린 구독자의 큐가 가득 차면 버림)"""
+        self._latest.set(event["video_id"], event)
+        for queue in list(self._subscribers):
+            try:
+                queue.put_nowait(event)
+            except asyncio.QueueFull:
+                pass
+
+    async def subscribe(self, video_ids: Optional[Iterable[str]] = None) -> AsyncIterator[Optional[dict]]:
+        """상태 이벤트 구독 (video_ids 지정 시 해당 비디오만)
+
+        SSE_KEEPALIVE_SECONDS 동안 이벤트가 없으면 None을 반환해 연결 유지용 신호를 보낼 수 있게 한다.
+        """
+        wanted = set(video_ids) if video_ids else None
+        queue: asyncio.Queue = asyncio.Queue(maxsize=settings.VIDEO_STATUS_QUEUE_SIZE)
+        self._subscribers.add(queue)
+
+        try:
+            # 구독 시점에 알고 있는 상태 먼저 전달
+            for video_id in wanted or ():
+                event = self.get(video_id)
+                if event is not None:
+                    yield event
+
+            while True:
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=settings.SSE_KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    yield None
+                    continue
+
+                if event is _CLOSED:
+                    return
+                if wanted is None or event["video_id"] in wanted:
+                    yield event
+        finally:
+            self._subscribers.discard(queue)
+
+    def close(self) -> None:
+        """앱 종료 시 열린 구독 스트림 종료"""
+        for queue in list(self._subscribers):
+            try:
+                queue.put_nowait(_CLOSED)
+            except asyncio.QueueFull:
+                queue.get_nowait()
+                queue.put_nowait(_CLOSED)
+
+
+_CLOSED = object()
+
+video_status_broker = VideoStatusBroker()
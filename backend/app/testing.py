@@ -0,0 +1,77 @@
+"""테스트용 쿼리 예산 헬퍼
+
+엔드포인트가 선언한 횟수보다 많은 Supabase 쿼리를 실행하면 테스트를 실패시킨다.
+
+    from app.testing import assert_query_budget
+
+    def test_get_video_query_budget(client, student_headers, video_id):
+        response = client.get(f"/api/videos/{video_id}", headers=student_headers)
+        assert_query_budget(response, db=1)
+
+서비스 함수를 직접 호출할 때는 query_budget 컨텍스트 매니저를 사용한다.
+
+    async def test_enrollment_cache():
+        async with query_budget(db=0):
+            await enrollment_cache.is_enrolled(user_id, course_id)
+"""
+
+import re
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Optional
+
+from app.services import request_stats
+from app.services.request_stats import RequestStats
+
+_SERVER_TIMING_COUNT = re.compile(r'(\w+);dur=[\d.]+;desc="(\d+) \w+"')
+
+
+def call_counts(response) -> Dict[str, int]:
+    """응답의 Server-Timing 헤더에서 외부 호출 종류별 횟수 추출 (db, bunny, auth)"""
+    header = response.headers.get("server-timing")
+    if header is None:
+        raise AssertionError("Server-Timing header is missing (SERVER_TIMING_ENABLED=false?)")
+
+    counts = {kind: 0 for kind in request_stats.KINDS}
+    for kind, count in _SERVER_TIMING_COUNT.findall(header):
+        counts[kind] = int(count)
+    return counts
+
+
+def _check(counts: Dict[str, int], budgets: Dict[str, Optional[int]], where: str) -> None:
+    exceeded = [
+        f"{kind}: {counts[kind]} > {budget}"
+        for kind, budget in budgets.items()
+        if budget is not None and counts[kind] > budget
+    ]
+    if exceeded:
+        raise AssertionError(f"Query budget exceeded for {where} ({', '.join(exceeded)})")
+
+
+def assert_query_budget(
+    response,
+    db: Optional[int] = None,
+    bunny: Optional[int] = None,
+    auth: Optional[int] = None,
+) -> Dict[str, int]:
+    """응답이 선언한 호출 예산 안에 있는지 확인하고 실제 횟수 반환"""
+    counts = call_counts(response)
+    request = getattr(response, "request", None)
+    where = f"{request.method} {request.url.path}" if request is not None else "response"
+    _check(counts, {"db": db, "bunny": bunny, "auth": auth}, where)
+    return counts
+
+
+@asynccontextmanager
+async def query_budget(
+    db: Optional[int] = None,
+    bunny: Optional[int] = None,
+    auth: Optional[int] = None,
+) -> AsyncIterator[RequestStats]:
+    """블록 안의 외부 호출 횟수가 예산을 넘으면 AssertionError"""
+    token = request_stats.start()
+    stats = request_stats.current()
+    try:
+        yield stats
+    finally:
+        request_stats.reset(token)
+    _check(stats.counts, {"db": db, "bunny": bunny, "auth": auth}, "block")
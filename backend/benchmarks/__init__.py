@@ -0,0 +1 @@
+"""가짜 Supabase/Bunny 서버로 API를 호출하는 오프라인 벤치마크 (python -m benchmarks.run)"""
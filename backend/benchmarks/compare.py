@@ -0,0 +1,44 @@
+"""두 벤치마크 결과(JSON) 비교
+
+    python -m benchmarks.compare benchmarks/results/before.json benchmarks/results/after.json
+"""
+
+import json
+import sys
+from pathlib import Path
+
+
+def load(path: str) -> dict:
+    report = json.loads(Path(path).read_text())
+    return {(r["scenario"], r["concurrency"]): r for r in report["results"]}
+
+
+def change(before: float, after: float) -> str:
+    if not before:
+        return "n/a"
+    return f"{(after - before) / before * 100:+.1f}%"
+
+
+def main(before_path: str, after_path: str) -> None:
+    before, after = load(before_path), load(after_path)
+
+    print(f"{'scenario':<20} {'c':>4}  {'req/s':>16}  {'p50 ms':>16}  {'p95 ms':>16}  {'p99 ms':>16}")
+    for key in sorted(before.keys() & after.keys()):
+        b, a = before[key], after[key]
+        columns = [
+            f"{a['throughput_rps']:.1f} ({change(b['throughput_rps'], a['throughput_rps'])})",
+        ] + [
+            f"{a['latency_ms'][p]:.2f} ({change(b['latency_ms'][p], a['latency_ms'][p])})"
+            for p in ("p50", "p95", "p99")
+        ]
+        print(f"{key[0]:<20} {key[1]:>4}  " + "  ".join(f"{c:>16}" for c in columns))
+
+    missing = sorted(before.keys() ^ after.keys())
+    if missing:
+        print(f"\nOnly in one run: {missing}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        raise SystemExit("usage: python -m benchmarks.compare BEFORE.json AFTER.json")
+    main(sys.argv[1], sys.argv[2])
@@ -0,0 +1,137 @@
+"""벤치마크용 가짜 데이터 (강의/비디오/학생/수강 등록)"""
+
+import random
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List
+
+import jwt
+
+from benchmarks.fake_bunny import FakeBunny
+from benchmarks.fake_postgrest import FakePostgrest, _now
+from benchmarks.fake_rpc import register_rpcs
+
+
+@dataclass
+class Student:
+    id: str
+    headers: Dict[str, str]
+    course_ids: List[str]
+
+
+@dataclass
+class Dataset:
+    course_ids: List[str] = field(default_factory=list)
+    videos_by_course: Dict[str, List[str]] = field(default_factory=dict)
+    students: List[Student] = field(default_factory=list)
+    admin_headers: Dict[str, str] = field(default_factory=dict)
+
+    def summary(self) -> dict:
+        return {
+            "courses": len(self.course_ids),
+            "videos": sum(len(v) for v in self.videos_by_course.values()),
+            "students": len(self.students),
+            "enrollments": sum(len(s.course_ids) for s in self.students),
+        }
+
+
+def create_fake_postgrest(latency: float) -> FakePostgrest:
+    fake = FakePostgrest(
+        latency=latency,
+        unique_keys={
+            "watch_history": ["user_id", "video_id"],
+            "enrollments": ["user_id", "course_id"],
+        },
+        defaults={
+            "enrollments": {"enrolled_at": _now, "expires_at": None},
+            "watch_history": {"last_watched_at": _now, "is_completed": False, "progress_seconds": 0},
+            "videos": {"require_signed_url": True, "order_index": 0, "encoding_status": None},
+            "courses": {"is_published": False},
+        },
+    )
+    register_rpcs(fake)
+    return fake
+
+
+def _token(user_id: str, secret: str) -> Dict[str, str]:
+    token = jwt.encode(
+        {"sub": user_id, "aud": "authenticated", "role": "authenticated", "exp": int(time.time()) + 24 * 3600},
+        secret,
+        algorithm="HS256",
+    )
+    return {"Authorization": f"Bearer {token}"}
+
+
+def build_dataset(
+    postgrest: FakePostgrest,
+    bunny: FakeBunny,
+    jwt_secret: str,
+    courses: int = 20,
+    videos_per_course: int = 30,
+    students: int = 200,
+    enrollments_per_student: int = 3,
+    seed: int = 42,
+) -> Dataset:
+    rng = random.Random(seed)
+    dataset = Dataset()
+    base = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+    def timestamp(offset: int) -> str:
+        return (base + timedelta(minutes=offset)).isoformat()
+
+    for c in range(courses):
+        course_id = str(uuid.uuid4())
+        postgrest.table("courses").append({
+            "id": course_id,
+            "title": f"Course {c}",
+            "description": f"Benchmark course {c}",
+            "thumbnail_url": None,
+            "instructor_name": "Bench",
+            "is_published": True,
+            "created_at": timestamp(c),
+        })
+        dataset.course_ids.append(course_id)
+        dataset.videos_by_course[course_id] = []
+
+        for v in range(videos_per_course):
+            bunny_video = bunny.add_video(f"Course {c} / Lecture {v}", length=600 + v)
+            video_id = str(uuid.uuid4())
+            postgrest.table("videos").append({
+                "id": video_id,
+                "course_id": course_id,
+                "title": bunny_video["title"],
+                "description": None,
+                "bunny_video_id": bunny_video["guid"],
+                "bunny_thumbnail": None,
+                "duration_seconds": bunny_video["length"],
+                "order_index": v,
+                "require_signed_url": True,
+                "encoding_status": "finished",
+                "created_at": timestamp(c * videos_per_course + v),
+            })
+            dataset.videos_by_course[course_id].append(video_id)
+
+    admin_id = str(uuid.uuid4())
+    postgrest.table("profiles").append({
+        "id": admin_id, "email": "admin@bench.local", "name": "Admin", "role": "admin",
+        "created_at": timestamp(0), "updated_at": timestamp(0),
+    })
+    dataset.admin_headers = _token(admin_id, jwt_secret)
+
+    for s in range(students):
+        user_id = str(uuid.uuid4())
+        postgrest.table("profiles").append({
+            "id": user_id, "email": f"student{s}@bench.local", "name": f"Student {s}", "role": "student",
+            "created_at": timestamp(s), "updated_at": timestamp(s),
+        })
+        enrolled = rng.sample(dataset.course_ids, min(enrollments_per_student, courses))
+        for course_id in enrolled:
+            postgrest.table("enrollments").append({
+                "id": str(uuid.uuid4()), "user_id": user_id, "course_id": course_id,
+                "enrolled_at": timestamp(s), "expires_at": None,
+            })
+        dataset.students.append(Student(user_id, _token(user_id, jwt_secret), enrolled))
+
+    return dataset
@@ -0,0 +1,82 @@
+"""Bunny Stream API 최소 호환 인메모리 ASGI 앱 (벤치마크/로컬 검증용)"""
+
+import asyncio
+import uuid
+from typing import Dict
+
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Route
+
+
+class FakeBunny:
+    """/library/{library_id}/videos 목록/상세/생성/삭제를 흉내 내는 앱
+
+    latency: 요청마다 지연(초)을 주어 Bunny API 왕복을 흉내 냄
+    """
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.videos: Dict[str, dict] = {}
+        self.request_count = 0
+        self.app = Starlette(routes=[
+            Route("/library/{library_id}/videos", self.list_videos, methods=["GET"]),
+            Route("/library/{library_id}/videos", self.create_video, methods=["POST"]),
+            Route("/library/{library_id}/videos/{guid}", self.get_video, methods=["GET"]),
+            Route("/library/{library_id}/videos/{guid}", self.delete_video, methods=["DELETE"]),
+        ])
+
+    def add_video(self, title: str, length: int = 600, collection: str = "") -> dict:
+        guid = str(uuid.uuid4())
+        self.videos[guid] = {
+            "guid": guid,
+            "title": title,
+            "length": length,
+            "status": 4,
+            "collectionId": collection,
+            "thumbnailFileName": "thumbnail.jpg",
+        }
+        return self.videos[guid]
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http":
+            self.request_count += 1
+            if self.latency:
+                await asyncio.sleep(self.latency)
+        await self.app(scope, receive, send)
+
+    async def list_videos(self, request: Request) -> Response:
+        page = int(request.query_params.get("page", 1))
+        per_page = int(request.query_params.get("itemsPerPage", 100))
+        search = request.query_params.get("search", "").lower()
+        collection = request.query_params.get("collection")
+
+        items = [
+            video for video in self.videos.values()
+            if search in video["title"].lower()
+            and (not collection or video["collectionId"] == collection)
+        ]
+        return JSONResponse({
+            "totalItems": len(items),
+            "currentPage": page,
+            "itemsPerPage": per_page,
+            "items": items[(page - 1) * per_page:page * per_page],
+        })
+
+    async def create_video(self, request: Request) -> Response:
+        body = await request.json()
+        video = self.add_video(body.get("title", ""), length=0)
+        video["status"] = 0
+        return JSONResponse(video)
+
+    async def get_video(self, request: Request) -> Response:
+        video = self.videos.get(request.path_params["guid"])
+        if video is None:
+            return JSONResponse({"message": "Video not found"}, status_code=404)
+        return JSONResponse(video)
+
+    async def delete_video(self, request: Request) -> Response:
+        if self.videos.pop(request.path_params["guid"], None) is None:
+            return JSONResponse({"message": "Video not found"}, status_code=404)
+        return JSONResponse({"success": True})
@@ -0,0 +1,317 @@
+"""PostgREST 최소 호환 인메모리 WSGI 서버 (벤치마크/로컬 검증용)"""
+
+import json
+import re
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional
+from urllib.parse import parse_qsl, unquote
+
+OBJECT_MEDIA_TYPE = "application/vnd.pgrst.object+json"
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _split_top_level(value: str) -> List[str]:
+    """괄호 밖의 쉼표 기준 분리"""
+    parts, depth, current = [], 0, ""
+    for ch in value:
+        if ch == "(":
+            depth += 1
+        elif ch == ")":
+            depth -= 1
+        if ch == "," and depth == 0:
+            parts.append(current)
+            current = ""
+        else:
+            current += ch
+    if current:
+        parts.append(current)
+    return parts
+
+
+def _coerce(raw: str):
+    raw = unquote(raw)
+    if raw.startswith('"') and raw.endswith('"'):
+        return raw[1:-1]
+    if raw == "null":
+        return None
+    if raw == "true":
+        return True
+    if raw == "false":
+        return False
+    return raw
+
+
+def _compare_value(row_value, raw):
+    """행 값 타입에 맞춰 필터 값 변환"""
+    value = _coerce(raw)
+    if isinstance(row_value, bool) or value is None or isinstance(value, bool):
+        return value
+    if isinstance(row_value, int):
+        try:
+            return int(value)
+        except ValueError:
+            return value
+    return str(value)
+
+
+def _match(row: dict, column: str, expr: str) -> bool:
+    negate = False
+    if expr.startswith("not."):
+        negate, expr = True, expr[4:]
+    op, _, raw = expr.partition(".")
+    current = row.get(column)
+
+    if op == "in":
+        values = [str(_coerce(v)) for v in _split_top_level(raw.strip("()"))]
+        result = str(current) in values
+    elif op == "is":
+        result = current is _coerce(raw) if raw in ("null", "true", "false") else False
+    else:
+        value = _compare_value(current, raw)
+        if op == "eq":
+            result = current == value if not isinstance(current, str) else current == str(value)
+        elif op == "neq":
+            result = current != value
+        elif current is None or value is None:
+            result = False
+        elif op == "lt":
+            result = current < value
+        elif op == "lte":
+            result = current <= value
+        elif op == "gt":
+            result = current > value
+        elif op == "gte":
+            result = current >= value
+        elif op in ("ilike", "like"):
+            pattern = re.escape(str(value)).replace(r"\*", ".*").replace("%", ".*")
+            flags = re.IGNORECASE if op == "ilike" else 0
+            result = re.fullmatch(pattern, str(current), flags) is not None
+        else:
+            raise ValueError(f"unsupported operator: {op}")
+    return not result if negate else result
+
+
+def _match_logic(row: dict, expr: str, conjunction: str) -> bool:
+    """or=(a.eq.1,and(b.eq.2,c.lt.3)) 형식 평가"""
+    results = []
+    for part in _split_top_level(expr.strip("()")):
+        if part.startswith("and(") or part.startswith("or("):
+            name, _, inner = part.partition("(")
+            results.append(_match_logic(row, "(" + inner, name))
+        else:
+            column, _, rest = part.partition(".")
+            results.append(_match(row, column, rest))
+    return any(results) if conjunction == "or" else all(results)
+
+
+class FakePostgrest:
+    """supabase-py가 사용하는 PostgREST 하위 집합을 흉내 내는 WSGI 앱
+
+    - /rest/v1/{table}: select/insert/upsert/update/delete, eq/in/lt/gt/or 필터, order, limit
+    - /rest/v1/rpc/{name}: register_rpc로 등록한 파이썬 함수 호출
+    - latency: 요청마다 지연(초)을 주어 네트워크 왕복을 흉내 냄
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        unique_keys: Optional[Dict[str, List[str]]] = None,
+        defaults: Optional[Dict[str, Dict[str, object]]] = None,
+    ):
+        self.latency = latency
+        self.tables: Dict[str, List[dict]] = {}
+        self.unique_keys = unique_keys or {}
+        self.defaults = defaults or {}
+        self.rpcs: Dict[str, Callable[[dict], object]] = {}
+        self.request_count = 0
+        self._lock = threading.Lock()
+
+    def register_rpc(self, name: str, func: Callable[[dict], object]) -> None:
+        self.rpcs[name] = func
+
+    def table(self, name: str) -> List[dict]:
+        return self.tables.setdefault(name, [])
+
+    # ---------------------------------------------------------------- WSGI
+
+    def __call__(self, environ, start_response):
+        if self.latency:
+            time.sleep(self.latency)
+
+        method = environ["REQUEST_METHOD"]
+        path = environ.get("PATH_INFO", "")
+        query = parse_qsl(environ.get("QUERY_STRING", ""), keep_blank_values=True)
+        length = int(environ.get("CONTENT_LENGTH") or 0)
+        body = environ["wsgi.input"].read(length) if length else b""
+        accept = environ.get("HTTP_ACCEPT", "")
+        prefer = environ.get("HTTP_PREFER", "")
+
+        with self._lock:
+            self.request_count += 1
+            try:
+                status, payload, headers = self.handle(method, path, query, body, accept, prefer)
+            except LookupError as e:
+                status, payload, headers = 404, {"message": str(e), "code": "PGRST202"}, {}
+            except ValueError as e:
+                status, payload, headers = 400, {"message": str(e), "code": "PGRST100"}, {}
+
+        data = json.dumps(payload, default=str).encode()
+        header_list = [("Content-Type", "application/json"), ("Content-Length", str(len(data)))]
+        header_list += list(headers.items())
+        start_response(f"{status} {'OK' if status < 400 else 'ERROR'}", header_list)
+        return [data]
+
+    def handle(self, method, path, query, body, accept, prefer):
+        if path.startswith("/auth/v1/"):
+            raise LookupError("auth endpoints are not supported; use AUTH_VERIFY_MODE=local")
+
+        match = re.match(r"^/rest/v1/(rpc/)?([\w]+)$", path)
+        if not match:
+            raise LookupError(path)
+        is_rpc, name = match.group(1), match.group(2)
+        payload = json.loads(body) if body else None
+
+        if is_rpc:
+            if name not in self.rpcs:
+                raise LookupError(f"function {name} not found")
+            params = payload if method == "POST" else dict(query)
+            return 200, self.rpcs[name](params or {}), {}
+
+        filters = [(k, v) for k, v in query if k not in ("select", "order", "limit", "offset", "on_conflict", "columns")]
+        params = dict(query)
+        rows = self.table(name)
+
+        def selected(matching):
+            return [r for r in rows if all(
+                _match_logic(r, v, k) if k in ("or", "and") else _match(r, k, v)
+                for k, v in filters
+            )] if matching is None else matching
+
+        if method == "GET":
+            embeds = self._embeds(params.get("select", "*"))
+            embed_filters = [(k, v) for k, v in filters if "." in k]
+            filters[:] = [(k, v) for k, v in filters if "." not in k]
+            result = selected(None)
+            if embeds:
+                result = self._apply_embeds(result, embeds, embed_filters)
+            total = len(result)
+            for spec in reversed(params.get("order", "").split(",") if params.get("order") else []):
+                column, *mods = spec.split(".")
+                present = [r for r in result if r.get(column) is not None]
+                missing = [r for r in result if r.get(column) is None]
+                present.sort(key=lambda r: r[column], reverse="desc" in mods)
+                # PostgreSQL 기본값: ASC는 NULL이 뒤, DESC는 NULL이 앞
+                nulls_first = "nullsfirst" in mods or ("desc" in mods and "nullslast" not in mods)
+                result = missing + present if nulls_first else present + missing
+            offset = int(params.get("offset", 0))
+            if "limit" in params:
+                result = result[offset:offset + int(params["limit"])]
+            result = [self._project(r, params.get("select", "*")) for r in result]
+            headers = {}
+            if "count=" in prefer:
+                headers["Content-Range"] = f"0-{max(len(result) - 1, 0)}/{total}"
+            return self._respond(result, accept, headers)
+
+        if method == "POST":
+            items = payload if isinstance(payload, list) else [payload]
+            conflict = params.get("on_conflict")
+            keys = conflict.split(",") if conflict else self.unique_keys.get(name, [])
+            merge = "resolution=merge-duplicates" in prefer
+            ignore = "resolution=ignore-duplicates" in prefer
+            written = []
+            for item in items:
+                existing = None
+                if keys:
+                    existing = next(
+                        (r for r in rows if all(str(r.get(k)) == str(item.get(k)) for k in keys)),
+                        None,
+                    )
+                if existing is not None:
+                    if merge:
+                        existing.update(item)
+                        written.append(existing)
+                    elif ignore:
+                        continue
+                    else:
+                        return 409, {"message": "duplicate key value violates unique constraint", "code": "23505"}, {}
+                else:
+                    defaults = {
+                        k: (v() if callable(v) else v)
+                        for k, v in self.defaults.get(name, {}).items()
+                    }
+                    row = {"id": str(uuid.uuid4()), "created_at": _now(), **defaults, **item}
+                    rows.append(row)
+                    written.append(row)
+            return self._respond(written, accept, {}, status=201)
+
+        if method == "PATCH":
+            result = selected(None)
+            for r in result:
+                r.update(payload)
+            return self._respond(result, accept, {})
+
+        if method == "DELETE":
+            result = selected(None)
+            self.tables[name] = [r for r in rows if r not in result]
+            return self._respond(result, accept, {})
+
+        raise ValueError(f"unsupported method {method}")
+
+    @staticmethod
+    def _embeds(select: str) -> List[tuple]:
+        """select의 리소스 임베딩 (예: videos!inner(course_id)) 파싱"""
+        embeds = []
+        for part in _split_top_level(select):
+            match = re.match(r"^\s*(\w+)(!inner)?\((.*)\)\s*$", part)
+            if match:
+                embeds.append((match.group(1), bool(match.group(2)), match.group(3)))
+        return embeds
+
+    def _apply_embeds(self, rows: List[dict], embeds: List[tuple], filters: List[tuple]) -> List[dict]:
+        """외래 키(<단수형>_id) 기준으로 관련 행을 붙이고 임베딩 필터 적용"""
+        result = []
+        for row in rows:
+            row = dict(row)
+            keep = True
+            for name, inner, columns in embeds:
+                fk = name.rstrip("s") + "_id"
+                related = next((r for r in self.table(name) if r.get("id") == row.get(fk)), None)
+                conditions = [(k.split(".", 1)[1], v) for k, v in filters if k.split(".", 1)[0] == name]
+                if related is not None and not all(_match(related, c, v) for c, v in conditions):
+                    related = None
+                if related is None and inner:
+                    keep = False
+                row[name] = self._project(related, columns) if related is not None else None
+            if keep:
+                result.append(row)
+        return result
+
+    @staticmethod
+    def _project(row: dict, select: str) -> dict:
+        columns = [c.strip() for c in _split_top_level(select)]
+        if "*" in columns:
+            return dict(row)
+        projected = {}
+        for column in columns:
+            match = re.match(r"^(\w+)(!inner)?\(", column)
+            key = match.group(1) if match else column
+            projected[key] = row.get(key)
+        return projected
+
+    @staticmethod
+    def _respond(result, accept, headers, status=200):
+        if OBJECT_MEDIA_TYPE in accept:
+            if len(result) != 1:
+                return 406, {
+                    "message": "JSON object requested, multiple (or no) rows returned",
+                    "code": "PGRST116",
+                    "details": f"The result contains {len(result)} rows",
+                }, {}
+            return status, result[0], headers
+        return status, result, headers
@@ -0,0 +1,128 @@
+"""supabase/migrations의 RPC 함수를 FakePostgrest용 파이썬 함수로 옮긴 것"""
+
+import json
+
+from benchmarks.fake_postgrest import FakePostgrest, _now
+
+
+def register_rpcs(fake: FakePostgrest) -> None:
+    def enrolled(user_id: str, course_id: str) -> bool:
+        return any(
+            e["user_id"] == user_id and e["course_id"] == course_id
+            for e in fake.table("enrollments")
+        )
+
+    def find(table: str, row_id: str):
+        return next((r for r in fake.table(table) if r["id"] == row_id), None)
+
+    def authorize_video(p: dict):
+        video = find("videos", p["p_video_id"])
+        if video is None:
+            return None
+        return {"video": dict(video), "enrolled": enrolled(p["p_user_id"], video["course_id"])}
+
+    def course_with_videos_for_user(p: dict):
+        course = find("courses", p["p_course_id"])
+        if course is None:
+            return None
+        is_enrolled = enrolled(p["p_user_id"], course["id"])
+        videos = sorted(
+            (v for v in fake.table("videos") if v["course_id"] == course["id"]),
+            key=lambda v: v.get("order_index") or 0,
+        )
+        columns = ("id", "title", "duration_seconds", "order_index", "bunny_thumbnail")
+        return {
+            "course": dict(course),
+            "enrolled": is_enrolled,
+            "videos": [{c: v.get(c) for c in columns} for v in videos] if is_enrolled else [],
+        }
+
+    def record_progress(p: dict):
+        video = find("videos", p["p_video_id"])
+        if video is None:
+            return "not_found"
+        if not enrolled(p["p_user_id"], video["course_id"]):
+            return "forbidden"
+        fake.handle(
+            "POST",
+            "/rest/v1/watch_history",
+            [("on_conflict", "user_id,video_id")],
+            json.dumps({
+                "user_id": p["p_user_id"],
+                "video_id": p["p_video_id"],
+                "progress_seconds": p["p_progress_seconds"],
+                "is_completed": p["p_is_completed"],
+                "last_watched_at": _now(),
+            }).encode(),
+            "",
+            "resolution=merge-duplicates",
+        )
+        return "ok"
+
+    def continue_watching(p: dict):
+        user_id = p["p_user_id"]
+        videos = {v["id"]: v for v in fake.table("videos")}
+        courses = {c["id"]: c for c in fake.table("courses")}
+        history = sorted(
+            (h for h in fake.table("watch_history") if h["user_id"] == user_id and not h["is_completed"]),
+            key=lambda h: h["last_watched_at"],
+            reverse=True,
+        )
+        items = []
+        for h in history:
+            video = videos.get(h["video_id"])
+            if video is None or not enrolled(user_id, video["course_id"]):
+                continue
+            items.append({
+                "video_id": video["id"],
+                "course_id": video["course_id"],
+                "course_title": courses[video["course_id"]]["title"],
+                "title": video["title"],
+                "duration_seconds": video.get("duration_seconds"),
+                "bunny_thumbnail": video.get("bunny_thumbnail"),
+                "progress_seconds": h["progress_seconds"],
+                "last_watched_at": h["last_watched_at"],
+            })
+            if len(items) >= p["p_limit"]:
+                break
+        return items
+
+    def course_progress_for_user(p: dict):
+        user_id = p["p_user_id"]
+        history = {h["video_id"]: h for h in fake.table("watch_history") if h["user_id"] == user_id}
+        items = []
+        for e in fake.table("enrollments"):
+            course = find("courses", e["course_id"]) if e["user_id"] == user_id else None
+            if course is None or not course.get("is_published"):
+                continue
+            watched = [history[v["id"]] for v in fake.table("videos") if v["course_id"] == course["id"] and v["id"] in history]
+            total = sum(1 for v in fake.table("videos") if v["course_id"] == course["id"])
+            completed = sum(1 for h in watched if h["is_completed"])
+            items.append({
+                "course_id": course["id"],
+                "title": course["title"],
+                "total_videos": total,
+                "completed_videos": completed,
+                "progress_percent": round(100 * completed / total) if total else 0,
+                "last_watched_at": max((h["last_watched_at"] for h in watched), default=None),
+            })
+        items.sort(key=lambda item: item["last_watched_at"] or "", reverse=True)
+        return items
+
+    def profiles_by_email(p: dict):
+        emails = set(p["p_emails"])
+        return [
+            {"id": profile["id"], "email": profile["email"].lower()}
+            for profile in fake.table("profiles")
+            if (profile.get("email") or "").lower() in emails
+        ]
+
+    for func in (
+        authorize_video,
+        course_with_videos_for_user,
+        record_progress,
+        continue_watching,
+        course_progress_for_user,
+        profiles_by_email,
+    ):
+        fake.register_rpc(func.__name__, func)
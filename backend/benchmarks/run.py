@@ -0,0 +1,274 @@
+"""오프라인 부하 테스트 / 벤치마크
+
+FastAPI 앱을 같은 프로세스에서 띄우고, Supabase(PostgREST)와 Bunny API는 지연 시간을 줄 수 있는
+가짜 서버로 대체해 주요 엔드포인트를 동시성 단계별로 호출한다.
+
+    cd backend
+    python -m benchmarks.run --concurrency 1,10,50 --requests 500 --db-latency 0.01
+    python -m benchmarks.compare benchmarks/results/a.json benchmarks/results/b.json
+
+클라이언트와 서버가 같은 이벤트 루프를 쓰므로 절대값보다는 같은 조건의 실행끼리 비교하는 용도이다.
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import platform
+import random
+import subprocess
+import time
+from collections import Counter
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List
+
+import httpx
+
+JWT_SECRET = "benchmark-jwt-secret-0123456789abcdef"
+RESULTS_DIR = Path(__file__).parent / "results"
+
+
+def configure_environment() -> None:
+    """실제 Supabase/Bunny 대신 가짜 서버를 쓰도록 설정 (app 임포트 전에 호출)"""
+    os.environ.update({
+        "SUPABASE_URL": "http://supabase.benchmark",
+        "SUPABASE_ANON_KEY": "benchmark-anon",
+        "SUPABASE_SERVICE_ROLE_KEY": "benchmark-service-role",
+        "BUNNY_STREAM_API_KEY": "benchmark",
+        "BUNNY_VIDEO_LIBRARY_API_KEY": "benchmark",
+        "BUNNY_STREAM_TOKEN_AUTH_KEY": "benchmark",
+        "AUTH_VERIFY_MODE": "local",
+        "SUPABASE_JWT_SECRET": JWT_SECRET,
+        "REQUEST_LOG_LEVEL": "",
+    })
+
+
+def percentile(sorted_values: List[float], p: float) -> float:
+    """nearest-rank 백분위수"""
+    if not sorted_values:
+        return 0.0
+    rank = math.ceil(p / 100 * len(sorted_values))
+    return sorted_values[min(max(rank, 1), len(sorted_values)) - 1]
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True, cwd=Path(__file__).parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+Scenario = Callable[[httpx.AsyncClient, random.Random], Awaitable[httpx.Response]]
+
+
+def build_scenarios(dataset) -> Dict[str, Scenario]:
+    """주요 엔드포인트 호출 (학생/강의/비디오는 수강 중인 것 중에서 무작위 선택)"""
+
+    def pick(rng: random.Random):
+        student = rng.choice(dataset.students)
+        course_id = rng.choice(student.course_ids)
+        video_id = rng.choice(dataset.videos_by_course[course_id])
+        return student, course_id, video_id
+
+    async def courses(client, rng):
+        student, _, _ = pick(rng)
+        return await client.get("/api/courses", headers=student.headers)
+
+    async def course_videos(client, rng):
+        student, course_id, _ = pick(rng)
+        return await client.get(f"/api/courses/{course_id}/videos", headers=student.headers)
+
+    async def signed_url(client, rng):
+        student, _, video_id = pick(rng)
+        return await client.post(f"/api/videos/{video_id}/signed-url", headers=student.headers)
+
+    async def progress(client, rng):
+        student, _, video_id = pick(rng)
+        return await client.post(
+            f"/api/videos/{video_id}/progress",
+            headers=student.headers,
+            json={"progress_seconds": rng.randint(0, 600), "is_completed": False},
+        )
+
+    async def continue_watching(client, rng):
+        student, _, _ = pick(rng)
+        return await client.get("/api/videos/continue-watching", headers=student.headers)
+
+    async def course_progress(client, rng):
+        student, _, _ = pick(rng)
+        return await client.get("/api/courses/progress", headers=student.headers)
+
+    async def admin_bunny_videos(client, rng):
+        return await client.get("/api/admin/bunny/videos", headers=dataset.admin_headers)
+
+    return {
+        "courses": courses,
+        "course_videos": course_videos,
+        "signed_url": signed_url,
+        "progress": progress,
+        "continue_watching": continue_watching,
+        "course_progress": course_progress,
+        "admin_bunny_videos": admin_bunny_videos,
+    }
+
+
+DEFAULT_SCENARIOS = ("courses", "course_videos", "signed_url", "progress")
+
+
+async def run_level(
+    client: httpx.AsyncClient,
+    scenario: Scenario,
+    concurrency: int,
+    total: int,
+    rng: random.Random,
+) -> dict:
+    latencies: List[float] = []
+    statuses: Counter = Counter()
+    remaining = iter(range(total))
+
+    async def worker() -> None:
+        for _ in remaining:
+            start = time.perf_counter()
+            try:
+                response = await scenario(client, rng)
+                statuses[response.status_code] += 1
+            except httpx.HTTPError:
+                statuses["error"] += 1
+            latencies.append(time.perf_counter() - start)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    errors = sum(count for status, count in statuses.items() if status == "error" or status >= 400)
+    return {
+        "concurrency": concurrency,
+        "requests": total,
+        "errors": errors,
+        "statuses": {str(status): count for status, count in statuses.items()},
+        "duration_s": round(elapsed, 3),
+        "throughput_rps": round(total / elapsed, 1) if elapsed else 0.0,
+        "latency_ms": {
+            "mean": round(sum(latencies) / len(latencies) * 1000, 2) if latencies else 0.0,
+            "p50": round(percentile(latencies, 50) * 1000, 2),
+            "p95": round(percentile(latencies, 95) * 1000, 2),
+            "p99": round(percentile(latencies, 99) * 1000, 2),
+            "max": round(latencies[-1] * 1000, 2) if latencies else 0.0,
+        },
+    }
+
+
+async def main(args: argparse.Namespace) -> dict:
+    configure_environment()
+
+    from app.config import settings
+    from app.main import app
+    from app.services.bunny import bunny_service
+    from app.services.supabase import supabase_clients
+    from benchmarks.dataset import build_dataset, create_fake_postgrest
+    from benchmarks.fake_bunny import FakeBunny
+
+    postgrest = create_fake_postgrest(args.db_latency)
+    bunny = FakeBunny(args.bunny_latency)
+    dataset = build_dataset(
+        postgrest,
+        bunny,
+        JWT_SECRET,
+        courses=args.courses,
+        videos_per_course=args.videos_per_course,
+        students=args.students,
+        seed=args.seed,
+    )
+
+    supabase_clients.transport = httpx.WSGITransport(app=postgrest)
+    bunny_service.transport = httpx.ASGITransport(app=bunny)
+
+    scenarios = build_scenarios(dataset)
+    unknown = set(args.scenarios) - set(scenarios)
+    if unknown:
+        raise SystemExit(f"Unknown scenarios: {', '.join(sorted(unknown))}")
+
+    rng = random.Random(args.seed)
+    results = []
+
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app),
+            base_url="http://benchmark",
+            timeout=60,
+        ) as client:
+            for name in args.scenarios:
+                scenario = scenarios[name]
+                for _ in range(args.warmup):
+                    await scenario(client, rng)
+
+                for concurrency in args.concurrency:
+                    db_before, bunny_before = postgrest.request_count, bunny.request_count
+                    result = await run_level(client, scenario, concurrency, args.requests, rng)
+                    result["scenario"] = name
+                    result["db_requests_per_call"] = round((postgrest.request_count - db_before) / args.requests, 2)
+                    result["bunny_requests_per_call"] = round((bunny.request_count - bunny_before) / args.requests, 2)
+                    results.append(result)
+                    print_result(result)
+
+    return {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "git_revision": git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "db_latency_s": args.db_latency,
+            "bunny_latency_s": args.bunny_latency,
+            "dataset": dataset.summary(),
+            "settings": {
+                "DB_MAX_CONCURRENCY": settings.DB_MAX_CONCURRENCY,
+                "PROGRESS_BUFFER_ENABLED": settings.PROGRESS_BUFFER_ENABLED,
+                "AUTH_VERIFY_MODE": settings.AUTH_VERIFY_MODE,
+                "BUNNY_URL_EXPIRY_BUCKET_SECONDS": settings.BUNNY_URL_EXPIRY_BUCKET_SECONDS,
+            },
+        },
+        "results": results,
+    }
+
+
+def print_result(result: dict) -> None:
+    latency = result["latency_ms"]
+    print(
+        f"{result['scenario']:<20} c={result['concurrency']:<4} "
+        f"{result['throughput_rps']:>8.1f} req/s  "
+        f"p50={latency['p50']:>7.2f}ms p95={latency['p95']:>7.2f}ms p99={latency['p99']:>7.2f}ms  "
+        f"db/call={result['db_requests_per_call']:<5} errors={result['errors']}"
+    )
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Offline API benchmark against fake Supabase/Bunny")
+    parser.add_argument("--scenarios", type=lambda v: v.split(","), default=list(DEFAULT_SCENARIOS),
+                        help="comma-separated: courses,course_videos,signed_url,progress,continue_watching,course_progress,admin_bunny_videos")
+    parser.add_argument("--concurrency", type=lambda v: [int(c) for c in v.split(",")], default=[1, 10, 50])
+    parser.add_argument("--requests", type=int, default=500, help="requests per scenario and concurrency level")
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--db-latency", type=float, default=0.005, help="fake PostgREST latency per request (s)")
+    parser.add_argument("--bunny-latency", type=float, default=0.02, help="fake Bunny API latency per request (s)")
+    parser.add_argument("--courses", type=int, default=20)
+    parser.add_argument("--videos-per-course", type=int, default=30)
+    parser.add_argument("--students", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", type=Path, default=None, help="JSON result path (default: benchmarks/results/)")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    report = asyncio.run(main(args))
+
+    output = args.output or RESULTS_DIR / f"{datetime.now().strftime('%Y%m%d-%H%M%S')}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2))
+    print(f"\nResults written to {output}")
@@ -0,0 +1,69 @@
+"""API 테스트 공통 fixture
+
+실제 Supabase/Bunny 대신 벤치마크용 가짜 서버(benchmarks/)를 지연 없이 사용한다.
+
+    cd backend
+    pip install -r requirements-dev.txt
+    python -m pytest
+"""
+
+from benchmarks.run import JWT_SECRET, configure_environment
+
+# app.config가 임포트되기 전에 가짜 서버용 설정 적용
+configure_environment()
+
+import httpx  # noqa: E402
+import pytest  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+from app.main import app  # noqa: E402
+from app.services.bunny import bunny_service  # noqa: E402
+from app.services.catalog import catalog_cache  # noqa: E402
+from app.services.enrollments import enrollment_cache  # noqa: E402
+from app.services.roles import role_cache  # noqa: E402
+from app.services.supabase import supabase_clients  # noqa: E402
+from benchmarks.dataset import build_dataset, create_fake_postgrest  # noqa: E402
+from benchmarks.fake_bunny import FakeBunny  # noqa: E402
+
+
+@pytest.fixture
+def postgrest():
+    return create_fake_postgrest(0)
+
+
+@pytest.fixture
+def bunny():
+    return FakeBunny()
+
+
+@pytest.fixture
+def dataset(postgrest, bunny):
+    """강의 3개 x 비디오 4개, 학생 2명 (학생마다 강의 2개 수강)"""
+    data = build_dataset(
+        postgrest,
+        bunny,
+        JWT_SECRET,
+        courses=3,
+        videos_per_course=4,
+        students=2,
+        enrollments_per_student=2,
+    )
+    supabase_clients.shutdown()
+    supabase_clients.transport = httpx.WSGITransport(app=postgrest)
+    bunny_service.transport = httpx.ASGITransport(app=bunny)
+    return data
+
+
+@pytest.fixture
+def client(dataset):
+    """캐시를 비운 상태의 앱 클라이언트 (lifespan 포함)"""
+    enrollment_cache.clear()
+    role_cache.clear()
+    catalog_cache.bump()
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def student(dataset):
+    return dataset.students[0]
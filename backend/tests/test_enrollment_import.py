@@ -0,0 +1,24 @@
+"""일괄 수강 등록"""
+
+from app.config import settings
+
+
+def test_undecodable_row_is_reported_with_the_rest(client, dataset, monkeypatch):
+    # 배치마다 바로 기록되도록 해서 잘못된 줄 앞의 행이 이미 등록된 상황을 만든다
+    monkeypatch.setattr(settings, "ENROLLMENT_IMPORT_BATCH_SIZE", 1)
+    rows = []
+    for student in dataset.students:
+        course_id = next(c for c in dataset.course_ids if c not in student.course_ids)
+        rows.append(f"{student.id},{course_id}".encode())
+    body = b"\n".join([b"user_id,course_id", rows[0], b"\xff\xfe,broken", rows[1]])
+
+    response = client.post(
+        "/api/admin/enrollments/bulk",
+        headers={**dataset.admin_headers, "Content-Type": "text/csv"},
+        content=body,
+    )
+
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [result["status"] for result in results] == ["enrolled", "invalid", "enrolled"]
+    assert results[1]["detail"] == "Invalid UTF-8"
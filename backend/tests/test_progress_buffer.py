@@ -0,0 +1,39 @@
+"""시청 진도 write-behind 버퍼"""
+
+import asyncio
+
+from app.config import settings
+from app.services import progress_buffer as progress_buffer_module
+from app.services.progress_buffer import ProgressBuffer
+
+
+def test_stop_during_flush_keeps_buffered_rows(monkeypatch):
+    monkeypatch.setattr(settings, "PROGRESS_BUFFER_ENABLED", True)
+    monkeypatch.setattr(settings, "PROGRESS_FLUSH_MAX_BATCH", 2)
+    monkeypatch.setattr(settings, "PROGRESS_FLUSH_INTERVAL_SECONDS", 60)
+
+    stored = {}
+    writing = asyncio.Event()
+
+    async def slow_upsert(rows):
+        writing.set()
+        await asyncio.sleep(0.05)
+        for row in rows:
+            stored[(row["user_id"], row["video_id"])] = row["progress_seconds"]
+
+    monkeypatch.setattr(progress_buffer_module.repository, "upsert_progress", slow_upsert)
+
+    async def scenario():
+        buffer = ProgressBuffer()
+        await buffer.start()
+        for index in range(5):
+            await buffer.record("user", f"video-{index}", index * 10, False)
+        # 백그라운드 flush가 기록 중일 때 종료
+        await asyncio.wait_for(writing.wait(), timeout=1)
+        await buffer.stop()
+        return buffer
+
+    buffer = asyncio.run(scenario())
+
+    assert stored == {("user", f"video-{index}"): index * 10 for index in range(5)}
+    assert buffer.get("user", "video-4") is None
@@ -0,0 +1,112 @@
+"""주요 엔드포인트 쿼리 예산 (N+1 회귀 방지)
+
+캐시가 빈 첫 요청과 캐시가 채워진 반복 요청의 DB/Bunny 호출 횟수 상한을 고정한다.
+"""
+
+import pytest
+
+from app.testing import assert_query_budget
+
+
+def test_course_list(client, student):
+    response = client.get("/api/courses", headers=student.headers)
+    assert response.status_code == 200
+    assert_query_budget(response, db=2, bunny=0, auth=0)
+
+
+def test_course_detail(client, student):
+    course_id = student.course_ids[0]
+
+    response = client.get(f"/api/courses/{course_id}", headers=student.headers)
+    assert response.status_code == 200
+    assert_query_budget(response, db=1, bunny=0)
+
+    # 카탈로그/수강 권한 캐시 히트
+    response = client.get(f"/api/courses/{course_id}", headers=student.headers)
+    assert response.status_code == 200
+    assert_query_budget(response, db=0, bunny=0)
+
+
+def test_course_videos(client, dataset, student):
+    course_id = student.course_ids[0]
+    response = client.get(f"/api/courses/{course_id}/videos", headers=student.headers)
+    assert response.status_code == 200
+    assert len(response.json()) == len(dataset.videos_by_course[course_id])
+    assert_query_budget(response, db=3, bunny=0)
+
+
+def test_course_signed_urls(client, dataset, student):
+    course_id = student.course_ids[0]
+    response = client.post(f"/api/courses/{course_id}/signed-urls", headers=student.headers, json={})
+    assert response.status_code == 200
+    assert len(response.json()["videos"]) == len(dataset.videos_by_course[course_id])
+    assert_query_budget(response, db=2, bunny=0)
+
+
+def test_signed_url(client, dataset, student):
+    video_id = dataset.videos_by_course[student.course_ids[0]][0]
+
+    response = client.post(f"/api/videos/{video_id}/signed-url", headers=student.headers)
+    assert response.status_code == 200
+    assert_query_budget(response, db=1, bunny=0)
+
+    response = client.post(f"/api/videos/{video_id}/signed-url", headers=student.headers)
+    assert response.status_code == 200
+    assert_query_budget(response, db=0, bunny=0)
+
+
+def test_progress_heartbeat(client, dataset, student):
+    video_id = dataset.videos_by_course[student.course_ids[0]][0]
+
+    for seconds in (10, 20, 30):
+        response = client.post(
+            f"/api/videos/{video_id}/progress",
+            headers=student.headers,
+            json={"progress_seconds": seconds, "is_completed": False},
+        )
+        assert response.status_code == 200
+        # 첫 하트비트만 권한 확인 쿼리, 이후는 캐시 + 쓰기 버퍼
+        assert_query_budget(response, db=1 if seconds == 10 else 0)
+
+    response = client.get(f"/api/videos/{video_id}/progress", headers=student.headers)
+    assert response.json()["progress_seconds"] == 30
+    assert_query_budget(response, db=0)
+
+
+def test_dashboard(client, student):
+    for path in ("/api/videos/continue-watching", "/api/courses/progress"):
+        response = client.get(path, headers=student.headers)
+        assert response.status_code == 200
+        assert_query_budget(response, db=1, bunny=0)
+
+
+def test_admin_lists(client, dataset):
+    paths = ("/api/admin/courses", "/api/admin/videos", "/api/admin/enrollments")
+    for index, path in enumerate(paths):
+        response = client.get(path, headers=dataset.admin_headers)
+        assert response.status_code == 200
+        # 첫 요청만 역할 조회, 이후는 역할 캐시 + 목록 1회
+        assert_query_budget(response, db=2 if index == 0 else 1, bunny=0)
+
+
+def test_budget_violation_is_reported(client, student):
+    response = client.get("/api/courses", headers=student.headers)
+    with pytest.raises(AssertionError, match="Query budget exceeded"):
+        assert_query_budget(response, db=1)
+
+
+def test_continue_watching_includes_buffered_video(client, dataset, student):
+    video_id = dataset.videos_by_course[student.course_ids[0]][1]
+    response = client.post(
+        f"/api/videos/{video_id}/progress",
+        headers=student.headers,
+        json={"progress_seconds": 42, "is_completed": False},
+    )
+    assert response.status_code == 200
+
+    # 아직 flush 전인 진도를 먼저 기록한 뒤 조회
+    response = client.get("/api/videos/continue-watching", headers=student.headers)
+    assert response.status_code == 200
+    assert_query_budget(response, db=2, bunny=0)
+    item = next(item for item in response.json() if item["video_id"] == str(video_id))
+    assert item["progress_seconds"] == 42
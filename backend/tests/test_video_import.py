@@ -0,0 +1,18 @@
+"""Bunny 비디오 일괄 등록"""
+
+
+def test_import_appends_after_last_ordered_video(client, dataset, postgrest, bunny):
+    course_id = dataset.course_ids[0]
+    videos = [video for video in postgrest.table("videos") if video["course_id"] == course_id]
+    videos[0]["order_index"] = None
+    last_index = max(video["order_index"] for video in videos[1:])
+    guid = bunny.add_video("New lesson")["guid"]
+
+    response = client.post(
+        "/api/admin/videos/bulk-import",
+        headers=dataset.admin_headers,
+        json={"course_id": course_id, "bunny_video_ids": [guid]},
+    )
+
+    assert response.status_code == 200
+    assert [video["order_index"] for video in response.json()["imported"]] == [last_index + 1]
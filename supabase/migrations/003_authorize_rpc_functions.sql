@@ -0,0 +1,108 @@
+-- 권한 확인 + 조회를 한 번의 DB 왕복으로 처리하는 RPC 함수
+-- 백엔드(service role)에서만 호출하므로 anon/authenticated 실행 권한은 회수
+
+-- 비디오 조회 + 수강 여부 확인
+-- 반환: {"video": {...}, "enrolled": true|false}, 비디오가 없으면 NULL
+CREATE OR REPLACE FUNCTION public.authorize_video(p_user_id UUID, p_video_id UUID)
+RETURNS JSONB
+LANGUAGE sql
+STABLE
+SECURITY DEFINER
+SET search_path = public
+AS $$
+    SELECT jsonb_build_object(
+        'video', to_jsonb(v),
+        'enrolled', EXISTS (
+            SELECT 1 FROM enrollments e
+            WHERE e.user_id = p_user_id
+            AND e.course_id = v.course_id
+        )
+    )
+    FROM videos v
+    WHERE v.id = p_video_id;
+$$;
+
+-- 강의 + 수강 여부 + 비디오 목록 (수강 중일 때만 비디오 포함)
+-- 반환: {"course": {...}, "enrolled": true|false, "videos": [...]}, 강의가 없으면 NULL
+CREATE OR REPLACE FUNCTION public.course_with_videos_for_user(p_user_id UUID, p_course_id UUID)
+RETURNS JSONB
+LANGUAGE sql
+STABLE
+SECURITY DEFINER
+SET search_path = public
+AS $$
+    WITH enrollment AS (
+        SELECT EXISTS (
+            SELECT 1 FROM enrollments e
+            WHERE e.user_id = p_user_id
+            AND e.course_id = p_course_id
+        ) AS enrolled
+    )
+    SELECT jsonb_build_object(
+        'course', to_jsonb(c),
+        'enrolled', enrollment.enrolled,
+        'videos', CASE WHEN enrollment.enrolled THEN COALESCE((
+            SELECT jsonb_agg(
+                jsonb_build_object(
+                    'id', v.id,
+                    'title', v.title,
+                    'duration_seconds', v.duration_seconds,
+                    'order_index', v.order_index,
+                    'bunny_thumbnail', v.bunny_thumbnail
+                )
+                ORDER BY v.order_index
+            )
+            FROM videos v
+            WHERE v.course_id = c.id
+        ), '[]'::jsonb) ELSE '[]'::jsonb END
+    )
+    FROM courses c, enrollment
+    WHERE c.id = p_course_id;
+$$;
+
+-- 비디오 존재/수강 권한 확인 후 시청 기록 upsert
+-- 반환: 'ok' | 'not_found' | 'forbidden'
+CREATE OR REPLACE FUNCTION public.record_progress(
+    p_user_id UUID,
+    p_video_id UUID,
+    p_progress_seconds INTEGER,
+    p_is_completed BOOLEAN
+)
+RETURNS TEXT
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+    v_course_id UUID;
+BEGIN
+    SELECT course_id INTO v_course_id FROM videos WHERE id = p_video_id;
+    IF NOT FOUND THEN
+        RETURN 'not_found';
+    END IF;
+
+    IF NOT EXISTS (
+        SELECT 1 FROM enrollments
+        WHERE user_id = p_user_id
+        AND course_id = v_course_id
+    ) THEN
+        RETURN 'forbidden';
+    END IF;
+
+    INSERT INTO watch_history (user_id, video_id, progress_seconds, is_completed)
+    VALUES (p_user_id, p_video_id, p_progress_seconds, p_is_completed)
+    ON CONFLICT (user_id, video_id) DO UPDATE
+    SET progress_seconds = EXCLUDED.progress_seconds,
+        is_completed = EXCLUDED.is_completed;
+
+    RETURN 'ok';
+END;
+$$;
+
+REVOKE EXECUTE ON FUNCTION public.authorize_video(UUID, UUID) FROM PUBLIC, anon, authenticated;
+REVOKE EXECUTE ON FUNCTION public.course_with_videos_for_user(UUID, UUID) FROM PUBLIC, anon, authenticated;
+REVOKE EXECUTE ON FUNCTION public.record_progress(UUID, UUID, INTEGER, BOOLEAN) FROM PUBLIC, anon, authenticated;
+
+GRANT EXECUTE ON FUNCTION public.authorize_video(UUID, UUID) TO service_role;
+GRANT EXECUTE ON FUNCTION public.course_with_videos_for_user(UUID, UUID) TO service_role;
+GRANT EXECUTE ON FUNCTION public.record_progress(UUID, UUID, INTEGER, BOOLEAN) TO service_role;
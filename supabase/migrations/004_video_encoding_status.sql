@@ -0,0 +1,5 @@
+-- Bunny 웹훅으로 받은 인코딩 상태 저장 (created/uploaded/processing/transcoding/finished/error)
+ALTER TABLE videos ADD COLUMN IF NOT EXISTS encoding_status VARCHAR(32);
+
+-- 웹훅/상태 조회는 bunny_video_id로 비디오를 찾음
+CREATE INDEX IF NOT EXISTS idx_videos_bunny_video_id ON videos(bunny_video_id);
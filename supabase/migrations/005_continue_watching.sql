@@ -0,0 +1,84 @@
+-- 이어보기: 수강 중인 모든 강의에서 최근 시청한 미완료 비디오
+
+-- 사용자별 최근 시청 순서 조회
+CREATE INDEX IF NOT EXISTS idx_watch_history_user_last_watched
+    ON watch_history(user_id, last_watched_at DESC);
+
+-- 진도 기록 시 마지막 시청 시각도 갱신
+CREATE OR REPLACE FUNCTION public.record_progress(
+    p_user_id UUID,
+    p_video_id UUID,
+    p_progress_seconds INTEGER,
+    p_is_completed BOOLEAN
+)
+RETURNS TEXT
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+    v_course_id UUID;
+BEGIN
+    SELECT course_id INTO v_course_id FROM videos WHERE id = p_video_id;
+    IF NOT FOUND THEN
+        RETURN 'not_found';
+    END IF;
+
+    IF NOT EXISTS (
+        SELECT 1 FROM enrollments
+        WHERE user_id = p_user_id
+        AND course_id = v_course_id
+    ) THEN
+        RETURN 'forbidden';
+    END IF;
+
+    INSERT INTO watch_history (user_id, video_id, progress_seconds, is_completed, last_watched_at)
+    VALUES (p_user_id, p_video_id, p_progress_seconds, p_is_completed, NOW())
+    ON CONFLICT (user_id, video_id) DO UPDATE
+    SET progress_seconds = EXCLUDED.progress_seconds,
+        is_completed = EXCLUDED.is_completed,
+        last_watched_at = EXCLUDED.last_watched_at;
+
+    RETURN 'ok';
+END;
+$$;
+
+-- 최근 시청 순으로 미완료 비디오 (현재 수강 중인 강의만)
+-- 반환: [{"video_id", "course_id", "course_title", "title", ...}, ...]
+CREATE OR REPLACE FUNCTION public.continue_watching(p_user_id UUID, p_limit INTEGER)
+RETURNS JSONB
+LANGUAGE sql
+STABLE
+SECURITY DEFINER
+SET search_path = public
+AS $$
+    SELECT COALESCE(jsonb_agg(item ORDER BY watched_at DESC), '[]'::jsonb)
+    FROM (
+        SELECT jsonb_build_object(
+            'video_id', v.id,
+            'course_id', v.course_id,
+            'course_title', c.title,
+            'title', v.title,
+            'duration_seconds', v.duration_seconds,
+            'bunny_thumbnail', v.bunny_thumbnail,
+            'progress_seconds', wh.progress_seconds,
+            'last_watched_at', wh.last_watched_at
+        ) AS item,
+        wh.last_watched_at AS watched_at
+        FROM watch_history wh
+        JOIN videos v ON v.id = wh.video_id
+        JOIN courses c ON c.id = v.course_id
+        WHERE wh.user_id = p_user_id
+        AND NOT wh.is_completed
+        AND EXISTS (
+            SELECT 1 FROM enrollments e
+            WHERE e.user_id = p_user_id
+            AND e.course_id = v.course_id
+        )
+        ORDER BY wh.last_watched_at DESC
+        LIMIT p_limit
+    ) recent;
+$$;
+
+REVOKE EXECUTE ON FUNCTION public.continue_watching(UUID, INTEGER) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.continue_watching(UUID, INTEGER) TO service_role;
@@ -0,0 +1,41 @@
+-- 강의별 진도 요약 (대시보드 "7/20강, 35%")
+
+-- 수강 중인 공개 강의별 전체/완료 비디오 수
+-- 반환: [{"course_id", "title", "total_videos", "completed_videos", "progress_percent", "last_watched_at"}, ...]
+CREATE OR REPLACE FUNCTION public.course_progress_for_user(p_user_id UUID)
+RETURNS JSONB
+LANGUAGE sql
+STABLE
+SECURITY DEFINER
+SET search_path = public
+AS $$
+    SELECT COALESCE(jsonb_agg(
+        jsonb_build_object(
+            'course_id', c.id,
+            'title', c.title,
+            'total_videos', stats.total_videos,
+            'completed_videos', stats.completed_videos,
+            'progress_percent', CASE WHEN stats.total_videos = 0 THEN 0
+                ELSE ROUND(100.0 * stats.completed_videos / stats.total_videos)::INTEGER END,
+            'last_watched_at', stats.last_watched_at
+        )
+        ORDER BY stats.last_watched_at DESC NULLS LAST, e.enrolled_at DESC
+    ), '[]'::jsonb)
+    FROM enrollments e
+    JOIN courses c ON c.id = e.course_id AND c.is_published
+    CROSS JOIN LATERAL (
+        SELECT
+            COUNT(v.id) AS total_videos,
+            COUNT(wh.id) FILTER (WHERE wh.is_completed) AS completed_videos,
+            MAX(wh.last_watched_at) AS last_watched_at
+        FROM videos v
+        LEFT JOIN watch_history wh
+            ON wh.video_id = v.id
+            AND wh.user_id = p_user_id
+        WHERE v.course_id = c.id
+    ) stats
+    WHERE e.user_id = p_user_id;
+$$;
+
+REVOKE EXECUTE ON FUNCTION public.course_progress_for_user(UUID) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.course_progress_for_user(UUID) TO service_role;
@@ -0,0 +1,20 @@
+-- 일괄 수강 등록: 이메일 대소문자 구분 없이 프로필 조회
+
+CREATE INDEX IF NOT EXISTS idx_profiles_email_lower ON profiles(LOWER(email));
+
+-- p_emails는 소문자로 정규화해서 전달
+-- 반환: [{"id", "email"(소문자)}, ...]
+CREATE OR REPLACE FUNCTION public.profiles_by_email(p_emails TEXT[])
+RETURNS TABLE (id UUID, email TEXT)
+LANGUAGE sql
+STABLE
+SECURITY DEFINER
+SET search_path = public
+AS $$
+    SELECT p.id, LOWER(p.email)
+    FROM profiles p
+    WHERE LOWER(p.email) = ANY (p_emails);
+$$;
+
+REVOKE EXECUTE ON FUNCTION public.profiles_by_email(TEXT[]) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.profiles_by_email(TEXT[]) TO service_role;